@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Compare building charts as validated Plotly figures and as fast figures.py
+specs.
+
+Both paths draw every chart from the same inputs and are timed through
+payload.figure_payload, the form charts are published in. That both give
+the same payload is checked by tests/test_figures.py.
+
+Usage:
+    python benchmarks/figure_build.py [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from utah_sb60 import charts, figures  # noqa: E402
+from utah_sb60.household import GRID_CHILDREN, GRID_HOUSEHOLD_STRUCTURES  # noqa: E402
+from utah_sb60.payload import figure_payload  # noqa: E402
+from utah_sb60.statewide import published_impacts  # noqa: E402
+
+
+def sample_inputs() -> dict:
+    """Synthetic chart inputs shaped like the simulated ones."""
+    rng = np.random.default_rng(0)
+    impacts = published_impacts()
+    values = impacts["AVG_IMPACT_BY_DECILE"]
+    incomes = np.arange(0, 200_001, charts.HOUSEHOLD_GRID_STEP)
+    return {
+        "curve": (incomes, rng.normal(size=len(incomes)).cumsum()),
+        "grid": (
+            incomes,
+            rng.normal(
+                size=(len(GRID_HOUSEHOLD_STRUCTURES), len(GRID_CHILDREN), len(incomes))
+            ),
+        ),
+        "household_types": GRID_HOUSEHOLD_STRUCTURES,
+        "children": GRID_CHILDREN,
+        "projection": pd.DataFrame(
+            {"revenue_impact_millions": -100 - rng.random(10) * 10},
+            index=pd.Index(range(2026, 2036), name="year"),
+        ),
+        "impacts": impacts,
+        "intervals": {
+            "AVG_IMPACT_BY_DECILE": {
+                "low": [value * 0.9 for value in values],
+                "high": [value * 1.1 for value in values],
+            }
+        },
+    }
+
+
+def builders(inputs: dict) -> dict:
+    """Chart name -> (Plotly builder, fast builder), both zero-argument."""
+    curve, grid = inputs["curve"], inputs["grid"]
+    household = (grid, inputs["household_types"], inputs["children"])
+    impacts, intervals = inputs["impacts"], inputs["intervals"]
+    projection = inputs["projection"]
+    return {
+        "net-income-change": (
+            lambda: charts.create_net_income_change_chart(curve),
+            lambda: figures.net_income_change_figure(*curve),
+        ),
+        "winners-by-decile": (
+            lambda: charts.create_winners_by_decile_chart(impacts),
+            lambda: figures.winners_by_decile_figure(impacts),
+        ),
+        "avg-benefit-by-decile": (
+            lambda: charts.create_avg_benefit_by_decile_chart(impacts, intervals),
+            lambda: figures.avg_benefit_by_decile_figure(impacts, intervals),
+        ),
+        "net-income-change-by-household": (
+            lambda: charts.create_net_income_change_heatmap(*household),
+            lambda: figures.net_income_change_heatmap_figure(*household),
+        ),
+        "budget-window": (
+            lambda: charts.create_budget_window_chart(projection),
+            lambda: figures.budget_window_figure(projection),
+        ),
+    }
+
+
+def best_of(build, repeat: int) -> float:
+    """Fastest of repeat timings of building and serializing a chart."""
+    figure_payload(build())
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        figure_payload(build())
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per chart")
+    args = parser.parse_args()
+
+    inputs = sample_inputs()
+    totals = [0.0, 0.0]
+    print(f"{'chart':<32} {'plotly':>9} {'fast':>9} {'speedup':>8}")
+    for name, (plotly_build, fast_build) in builders(inputs).items():
+        plotly_seconds = best_of(plotly_build, args.repeat)
+        fast_seconds = best_of(fast_build, args.repeat)
+        totals[0] += plotly_seconds
+        totals[1] += fast_seconds
+        print(
+            f"{name:<32} {plotly_seconds * 1000:>7.1f}ms "
+            f"{fast_seconds * 1000:>7.2f}ms {plotly_seconds / fast_seconds:>7.0f}x"
+        )
+    print(
+        f"{'total':<32} {totals[0] * 1000:>7.1f}ms {totals[1] * 1000:>7.2f}ms "
+        f"{totals[0] / totals[1]:>7.0f}x"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Fail if `import utah_sb60` exceeds an import-time budget.
+
+Each sample runs in a fresh interpreter so module caches do not hide the
+cost. The script also checks that the heavy dependencies stay unimported
+until a symbol that needs them is used.
+
+Usage:
+    python benchmarks/import_time.py [--budget SECONDS] [--samples N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# Default budget for a bare `import utah_sb60`, in seconds
+DEFAULT_BUDGET_SECONDS = float(os.environ.get("UTAH_SB60_IMPORT_BUDGET", 0.1))
+
+# Modules that must not be loaded by the bare package import
+HEAVY_MODULES = ["policyengine_core", "policyengine_us", "pandas", "plotly", "numpy"]
+
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import utah_sb60
+elapsed = time.perf_counter() - start
+loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def measure(samples: int) -> tuple[float, list[str]]:
+    """Return the fastest import time over samples and any heavy modules loaded."""
+    results = []
+    for _ in range(samples):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE], check=True, capture_output=True, text=True
+        ).stdout
+        results.append(json.loads(output))
+    best = min(result["seconds"] for result in results)
+    loaded = sorted({name for result in results for name in result["loaded"]})
+    return best, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS)
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    seconds, loaded = measure(args.samples)
+    print(
+        f"import utah_sb60: {seconds * 1000:.1f} ms (budget {args.budget * 1000:.0f} ms)"
+    )
+
+    failed = False
+    if loaded:
+        print(f"FAIL: heavy modules imported eagerly: {', '.join(loaded)}")
+        failed = True
+    if seconds > args.budget:
+        print("FAIL: import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Load-test the household calculator service at a fixed request rate.
+
+Requests are scheduled open-loop at --qps over a pool of keep-alive
+connections; latency is measured from each request's scheduled send time,
+so a server that falls behind shows up in the tail instead of lowering the
+offered load.
+
+Usage:
+    python benchmarks/load_test.py --start-server --qps 2000 --duration 10
+    python benchmarks/load_test.py --port 8060 --qps 500
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FILING_STATUSES = [
+    "single",
+    "joint",
+    "head_of_household",
+    "separate",
+    "surviving_spouse",
+]
+
+
+def random_query(rng: random.Random, income_step: int) -> str:
+    income = rng.randrange(0, 200_001, income_step)
+    return (
+        f"/household?employment_income={income}"
+        f"&filing_status={rng.choice(FILING_STATUSES)}&dependents={rng.randint(0, 4)}"
+    )
+
+
+async def _request(reader, writer, target: str) -> tuple[int, bytes]:
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def run_load(
+    host: str,
+    port: int,
+    qps: float,
+    duration: float,
+    connections: int,
+    income_step: int,
+    seed: int,
+) -> dict:
+    rng = random.Random(seed)
+    pool = asyncio.Queue()
+    for _ in range(connections):
+        pool.put_nowait(await asyncio.open_connection(host, port))
+
+    latencies = []
+    errors = 0
+
+    async def one(target: str, scheduled: float):
+        nonlocal errors
+        reader, writer = await pool.get()
+        try:
+            status, _ = await _request(reader, writer, target)
+            errors += status != 200
+        except (ConnectionError, asyncio.IncompleteReadError):
+            errors += 1
+            reader, writer = await asyncio.open_connection(host, port)
+        finally:
+            pool.put_nowait((reader, writer))
+        latencies.append(time.perf_counter() - scheduled)
+
+    total = int(qps * duration)
+    start = time.perf_counter()
+    tasks = []
+    for index in range(total):
+        scheduled = start + index / qps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(
+            asyncio.create_task(one(random_query(rng, income_step), scheduled))
+        )
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await pool.get()
+    _, body = await _request(reader, writer, "/metrics")
+    while not pool.empty():
+        pool.get_nowait()[1].close()
+    writer.close()
+
+    latencies_ms = np.asarray(latencies) * 1e3
+    return {
+        "requests": total,
+        "errors": errors,
+        "target_qps": qps,
+        "achieved_qps": round(total / elapsed, 1),
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "p99_ms": round(float(np.percentile(latencies_ms, 99)), 3),
+        "max_ms": round(float(latencies_ms.max()), 3),
+        "server_metrics": json.loads(body),
+    }
+
+
+def _wait_for_port(host: str, port: int, timeout: float = 10.0) -> None:
+    async def probe():
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                _, writer = await asyncio.open_connection(host, port)
+                writer.close()
+                return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.05)
+
+    asyncio.run(probe())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load-test the household service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8060)
+    parser.add_argument("--qps", type=float, default=1000)
+    parser.add_argument("--duration", type=float, default=10, help="Seconds")
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument(
+        "--income-step",
+        type=int,
+        default=100,
+        help="Income granularity of generated queries; coarser means more cache hits",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--start-server", action="store_true", help="Run the service in a subprocess"
+    )
+    args = parser.parse_args()
+
+    server = None
+    if args.start_server:
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "utah_sb60.service",
+                "--host",
+                args.host,
+                "--port",
+                str(args.port),
+            ],
+            cwd=REPO_ROOT,
+            stdout=subprocess.DEVNULL,
+        )
+    try:
+        _wait_for_port(args.host, args.port)
+        report = asyncio.run(
+            run_load(
+                args.host,
+                args.port,
+                args.qps,
+                args.duration,
+                args.connections,
+                args.income_step,
+                args.seed,
+            )
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(
+        f"{report['requests']} requests at {report['achieved_qps']} QPS "
+        f"(target {report['target_qps']}): p50 {report['p50_ms']} ms, "
+        f"p99 {report['p99_ms']} ms, max {report['max_ms']} ms, "
+        f"{report['errors']} errors"
+    )
+    print(json.dumps(report["server_metrics"], indent=2))
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
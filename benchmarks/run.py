@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Utah SB60 pipeline stage by stage.
+
+Each run times every stage, appends the results to a JSON history file and
+can be compared against a stored baseline to flag regressions.
+
+Usage:
+    python benchmarks/run.py run [--stages NAME ...] [--repeat N]
+    python benchmarks/run.py baseline            # promote the latest run
+    python benchmarks/run.py compare [--threshold 0.2]
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+HISTORY_PATH = RESULTS_DIR / "history.json"
+BASELINE_PATH = RESULTS_DIR / "baseline.json"
+
+# Allowed slowdown relative to the baseline median before a stage is flagged
+DEFAULT_THRESHOLD = 0.2
+
+# Step sizes for the household sweep stages
+HOUSEHOLD_STEPS = [1, 10, 50]
+
+# Stages too slow to repeat; timed once without a warm-up call
+SLOW_STAGES = {"generate_post", "reform_simulation"}
+
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def _household(step):
+    from utah_sb60.household import calculate_net_income_changes
+
+    return lambda: calculate_net_income_changes(step=step)
+
+
+def _adaptive():
+    from utah_sb60.household import calculate_net_income_change
+    from utah_sb60.sampling import adaptive_sample
+
+    return lambda: adaptive_sample(calculate_net_income_change, 0, 200_000)
+
+
+def _chart(name, *args):
+    from utah_sb60 import charts
+
+    return lambda: getattr(charts, name)(*args)
+
+
+def _curve_chart():
+    from utah_sb60.household import calculate_net_income_change_arrays
+    from utah_sb60.payload import reduce_piecewise_linear
+
+    # Fixed analytic inputs, so the chart build is timed rather than a
+    # PolicyEngine-US simulation or a cache hit
+    curve = reduce_piecewise_linear(*calculate_net_income_change_arrays())
+    return _chart("create_net_income_change_chart", curve)
+
+
+def _heatmap_chart():
+    from utah_sb60.household import calculate_net_income_change_grid
+    from utah_sb60.theme import HOUSEHOLD_GRID_STEP
+
+    grid = calculate_net_income_change_grid(step=HOUSEHOLD_GRID_STEP)
+    return _chart("create_net_income_change_heatmap", grid)
+
+
+def _figure(name):
+    from utah_sb60 import figures
+
+    return getattr(figures, name)
+
+
+def _serialize():
+    import generate_post
+    from utah_sb60.charts import create_winners_by_decile_chart
+
+    fig = create_winners_by_decile_chart()
+    output = Path(tempfile.mkdtemp()) / "chart.html"
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_post.generate_chart_html(fig, output)
+
+    return run
+
+
+def _full_pipeline():
+    output = tempfile.mkdtemp()
+    command = [
+        sys.executable,
+        str(REPO_ROOT / "generate_post.py"),
+        "--out",
+        output,
+        "--force",
+    ]
+    return lambda: subprocess.run(command, check=True, capture_output=True)
+
+
+def _simulation():
+    from utah_sb60.household import simulate_net_income_changes
+
+    # Bypass the on-disk cache so the simulation itself is timed
+    def run():
+        previous = os.environ.get("UTAH_SB60_CACHE")
+        os.environ["UTAH_SB60_CACHE"] = "0"
+        try:
+            simulate_net_income_changes(step=1000)
+        finally:
+            if previous is None:
+                del os.environ["UTAH_SB60_CACHE"]
+            else:
+                os.environ["UTAH_SB60_CACHE"] = previous
+
+    return run
+
+
+def stages() -> dict:
+    """Stage name -> zero-argument factory returning the callable to time."""
+    registry = {
+        f"household_step_{step}": (lambda step=step: _household(step))
+        for step in HOUSEHOLD_STEPS
+    }
+    registry.update(
+        {
+            "household_adaptive": _adaptive,
+            "chart_net_income_change": _curve_chart,
+            "chart_winners_by_decile": lambda: _chart("create_winners_by_decile_chart"),
+            "chart_avg_benefit_by_decile": lambda: _chart(
+                "create_avg_benefit_by_decile_chart"
+            ),
+            "chart_net_income_change_heatmap": _heatmap_chart,
+            "figure_winners_by_decile": lambda: _figure("winners_by_decile_figure"),
+            "figure_avg_benefit_by_decile": lambda: _figure(
+                "avg_benefit_by_decile_figure"
+            ),
+            "generate_chart_html": _serialize,
+        }
+    )
+    # Stages that run PolicyEngine-US
+    if importlib.util.find_spec("policyengine_us") is not None:
+        registry["generate_post"] = _full_pipeline
+        registry["reform_simulation"] = _simulation
+    return registry
+
+
+def time_stage(func, repeat: int, warmup: bool = True) -> dict:
+    """Time func repeat times, after one untimed warm-up call by default."""
+    if warmup:
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "repeat": repeat,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _load(path: Path):
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def run(names: list[str] | None, repeat: int) -> dict:
+    registry = stages()
+    results = {}
+    for name in names or list(registry):
+        slow = name in SLOW_STAGES
+        results[name] = time_stage(
+            registry[name](), 1 if slow else repeat, warmup=not slow
+        )
+        print(f"{name:<32} median {results[name]['median'] * 1000:>10.2f} ms")
+
+    entry = {
+        "timestamp": time.time(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    history = _load(HISTORY_PATH) or []
+    history.append(entry)
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    HISTORY_PATH.write_text(json.dumps(history, indent=2))
+    print(f"Appended results to {HISTORY_PATH}")
+    return entry
+
+
+def save_baseline() -> None:
+    history = _load(HISTORY_PATH)
+    if not history:
+        sys.exit("No benchmark history; run `python benchmarks/run.py run` first")
+    BASELINE_PATH.write_text(json.dumps(history[-1], indent=2))
+    print(f"Saved run from commit {history[-1]['commit']} as {BASELINE_PATH}")
+
+
+def compare(threshold: float) -> int:
+    """Compare the latest run with the baseline; return 1 on regression."""
+    history = _load(HISTORY_PATH)
+    baseline = _load(BASELINE_PATH)
+    if not history or baseline is None:
+        sys.exit("Need both a benchmark history and a baseline to compare")
+    latest = history[-1]["results"]
+
+    regressions = []
+    for name, result in latest.items():
+        if name not in baseline["results"]:
+            continue
+        before = baseline["results"][name]["median"]
+        ratio = result["median"] / before if before else float("inf")
+        flag = "REGRESSION" if ratio > 1 + threshold else ""
+        if flag:
+            regressions.append(name)
+        print(
+            f"{name:<32} {before * 1000:>10.2f} ms -> "
+            f"{result['median'] * 1000:>10.2f} ms  ({ratio - 1:+.1%}) {flag}"
+        )
+    if regressions:
+        print(f"\n{len(regressions)} stage(s) regressed beyond {threshold:.0%}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Utah SB60 pipeline.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Time stages and append to history")
+    run_parser.add_argument("--stages", nargs="+", choices=list(stages()))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    commands.add_parser("baseline", help="Store the latest run as the baseline")
+    compare_parser = commands.add_parser("compare", help="Flag regressions")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        run(args.stages, args.repeat)
+    elif args.command == "baseline":
+        save_baseline()
+    else:
+        return compare(args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
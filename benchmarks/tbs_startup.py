@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Compare cold and warm startup of the SB60 reform tax-benefit system.
+
+The cold run starts from an empty snapshot directory and builds the system;
+the warm run restores the snapshot the cold run wrote. Each run is a fresh
+interpreter, and both calculate the same household to check that the
+restored system gives identical results.
+
+Usage:
+    python benchmarks/tbs_startup.py [--samples N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import json, time
+start = time.perf_counter()
+import policyengine_us
+imported = time.perf_counter()
+from utah_sb60.reform import SB60_REFORM_PARAMETERS
+from utah_sb60.snapshot import tax_benefit_system
+system = tax_benefit_system(SB60_REFORM_PARAMETERS)
+loaded = time.perf_counter()
+from utah_sb60.household import build_household_situation
+simulation = policyengine_us.Simulation(
+    situation=build_household_situation(max_income=200000, step=20000),
+    tax_benefit_system=system,
+)
+net_income = simulation.calculate("household_net_income", 2026).tolist()
+print(json.dumps({
+    "import_seconds": imported - start,
+    "system_seconds": loaded - imported,
+    "net_income": net_income,
+}))
+"""
+
+
+def run_probe(cache_dir: str) -> dict:
+    """Run PROBE in a fresh interpreter against a cache directory."""
+    env = {
+        **os.environ,
+        "UTAH_SB60_CACHE_DIR": cache_dir,
+        "PYTHONPATH": str(REPO_ROOT),
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--samples", type=int, default=1, help="Warm runs to time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cold = run_probe(cache_dir)
+        warm_runs = [run_probe(cache_dir) for _ in range(args.samples)]
+    warm = min(warm_runs, key=lambda run: run["system_seconds"])
+
+    for label, run in (("cold", cold), ("warm", warm)):
+        print(
+            f"{label}: import {run['import_seconds']:.1f}s, "
+            f"reform system {run['system_seconds']:.1f}s"
+        )
+    print(
+        f"Speedup on the reform system: {cold['system_seconds'] / warm['system_seconds']:.1f}x"
+    )
+
+    if any(run["net_income"] != cold["net_income"] for run in warm_runs):
+        print("FAIL: restored system gives different results")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,28 +12,49 @@ Output:
     └── charts/
         ├── net-income-change.html
         ├── winners-by-decile.html
-        └── avg-benefit-by-decile.html
+        ├── avg-benefit-by-decile.html
+        └── net-income-change-by-household.html
 
 Charts are deployed to GitHub Pages and embedded via iframe in policyengine-app-v2.
+
+Usage:
+    python generate_post.py [--jobs N] [--only NAME ...] [--out DIR] [--force]
+                            [--bundle] [--adaptive] [--microdata]
+                            [--profile [TRACE]]
+
+Chart figures are built and serialized in parallel worker processes, and
+outputs whose inputs have not changed since the last run are skipped.
+With --bundle, chart data is written to content-hashed JSON files loaded by
+small HTML shells through charts/manifest.json (see utah_sb60/bundle.py).
+With --microdata, the decile charts and article use statewide results
+computed from the PolicyEngine-US microdata instead of the published
+statewide.py constants.
+With --adaptive, Figure 1 is sampled adaptively instead of from one $50 sweep.
+With --profile, per-stage timings are written as a Chrome trace file.
 """
 
 # GitHub Pages base URL for chart embeds
 GITHUB_PAGES_BASE_URL = "https://policyengine.github.io/utah-sb60-calc"
 
-import os
+import argparse
+from functools import partial
+from pathlib import Path
+
 from utah_sb60 import (
-    create_net_income_change_chart,
-    create_winners_by_decile_chart,
-    create_avg_benefit_by_decile_chart,
-    REVENUE_IMPACT_MILLIONS,
-    PERCENT_BENEFITING,
-    GINI_IMPACT_PCT,
-    AVG_BENEFIT_PER_HOUSEHOLD,
-    AVG_IMPACT_BY_DECILE,
+    bundle,
+    cache,
+    figures,
+    household,
+    payload,
+    profiling,
+    reform,
+    sampling,
+    snapshot,
+    statewide,
+    theme,
 )
-
-# Create output directories
-os.makedirs("output/charts", exist_ok=True)
+from utah_sb60.build import BuildGraph, Target, print_report
+from utah_sb60.payload import figure_payload, reduce_piecewise_linear
 
 # Chart HTML template (matching California billionaire tax pattern)
 CHART_HTML_TEMPLATE = """<html>
@@ -75,37 +96,169 @@ CHART_HTML_TEMPLATE = """<html>
 """
 
 
-def generate_chart_html(fig, filename):
-    """Generate a standalone HTML file for a Plotly figure."""
-    import json
-    import plotly.io as pio
+# Chart shell for bundle mode: the page's URL and content stay fixed, and its
+# data is fetched from the content-hashed file the manifest names
+CHART_SHELL_TEMPLATE = """<html>
+  <head>
+    <meta charset="utf-8" />
+    <link
+      href="https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;500;700&display=swap"
+      rel="stylesheet"
+    />
+  </head>
+  <body>
+    <div>
+      <script type="text/javascript">
+        window.PlotlyConfig = {{ MathJaxConfig: 'local' }};
+      </script>
+      <script
+        charset="utf-8"
+        src="https://cdn.plot.ly/plotly-3.1.1.min.js"
+      ></script>
+      <div
+        id="chart"
+        class="plotly-graph-div"
+        style="height: 600px; width: 100%"
+      ></div>
+      <script type="text/javascript">
+        window.PLOTLYENV = window.PLOTLYENV || {{}};
+        fetch('{manifest}', {{ cache: 'no-cache' }})
+          .then((response) => response.json())
+          .then((manifest) => fetch(manifest.charts['{chart_name}'].data))
+          .then((response) => response.json())
+          .then((chart) => {{
+            Plotly.newPlot('chart', chart.data, chart.layout, {{ responsive: true }});
+          }});
+      </script>
+    </div>
+  </body>
+</html>
+"""
 
-    # Use Plotly's JSON serialization which handles numpy arrays
-    fig_json = json.loads(pio.to_json(fig))
-    data_json = json.dumps(fig_json['data'])
-    layout_json = json.dumps(fig_json['layout'])
 
-    html = CHART_HTML_TEMPLATE.format(
-        chart_data=data_json,
-        chart_layout=layout_json
-    )
+def generate_chart_html(fig, filepath):
+    """Generate a standalone HTML file for a Plotly figure."""
+    # Single serialization pass; numeric arrays become base64 typed arrays
+    with profiling.span("serialize figure"):
+        data_json, layout_json = figure_payload(fig)
+
+    html = CHART_HTML_TEMPLATE.format(chart_data=data_json, chart_layout=layout_json)
 
-    filepath = f"output/charts/{filename}"
-    with open(filepath, "w") as f:
-        f.write(html)
+    with profiling.span("write html", path=str(filepath)):
+        with open(filepath, "w") as f:
+            f.write(html)
     print(f"Generated {filepath}")
 
 
-# Generate chart HTML files
-print("Generating chart HTML files...")
-generate_chart_html(create_net_income_change_chart(), "net-income-change.html")
-generate_chart_html(create_winners_by_decile_chart(), "winners-by-decile.html")
-generate_chart_html(create_avg_benefit_by_decile_chart(), "avg-benefit-by-decile.html")
+def generate_chart_bundle(fig, filepath):
+    """
+    Write a chart's data to a content-hashed JSON file and its shell page
+    to filepath.
+    """
+    filepath = Path(filepath)
+    with profiling.span("serialize figure"):
+        data_json, layout_json = figure_payload(fig)
+
+    with profiling.span("write bundle", path=str(filepath)):
+        data_path = bundle.write_chart_data(
+            filepath.parent, filepath.stem, data_json, layout_json
+        )
+        filepath.write_text(
+            CHART_SHELL_TEMPLATE.format(
+                manifest=bundle.MANIFEST_NAME, chart_name=filepath.stem
+            )
+        )
+    print(f"Generated {filepath} ({data_path.name})")
+
+
+def net_income_change_spec(adaptive=False):
+    """
+    Figure 1 spec from the single-adult curve: one $50 axes sweep reduced to
+    its kinks, or with adaptive=True the adaptively sampled curve, which
+    places kinks exactly but takes about seven rounds of simulations.
+    """
+    if adaptive:
+        curve = household.sample_net_income_changes(
+            tolerance=theme.NET_INCOME_CHANGE_TOLERANCE
+        )
+    else:
+        curve = reduce_piecewise_linear(
+            *household.simulate_net_income_changes(),
+            tolerance=theme.NET_INCOME_CHANGE_TOLERANCE,
+        )
+    return figures.net_income_change_figure(*curve)
+
+
+def net_income_change_heatmap_spec():
+    """Household-type heatmap spec over the simulated grid."""
+    grid = household.simulate_net_income_change_grid(
+        household.GRID_HOUSEHOLD_STRUCTURES,
+        household.GRID_CHILDREN,
+        step=theme.HOUSEHOLD_GRID_STEP,
+    )
+    return figures.net_income_change_heatmap_figure(
+        grid, household.GRID_HOUSEHOLD_STRUCTURES, household.GRID_CHILDREN
+    )
 
-# Generate markdown file
-print("Generating markdown file...")
 
-markdown = f"""On January 7th, Senator Daniel McCray (R-Riverton) submitted [SB60](https://le.utah.gov/~2026/bills/static/SB0060.html) to the Utah State Senate. The bill proposes reducing Utah's flat income tax rate from 4.5% to 4.45%, beginning in tax year 2026. This would continue Utah's trend of income tax cuts, marking the fifth consecutive year of rate reductions since the tax rate stood at 4.95% in 2021.
+# Chart output name -> figure spec builder. Charts are published from the
+# figures.py specs, which serialize to the same payload as the charts.py
+# Plotly figures without importing or validating through Plotly
+CHARTS = {
+    "net-income-change": net_income_change_spec,
+    "winners-by-decile": figures.winners_by_decile_figure,
+    "avg-benefit-by-decile": figures.avg_benefit_by_decile_figure,
+    "net-income-change-by-household": net_income_change_heatmap_spec,
+}
+
+
+def build_chart(name, filepath, bundled=False, **options):
+    """
+    Build, serialize and write one chart; runs in a worker process.
+
+    Args:
+        options: Keyword arguments for the chart's spec builder
+    """
+    write = generate_chart_bundle if bundled else generate_chart_html
+    with profiling.span("build figure", chart=name):
+        fig = CHARTS[name](**options)
+    write(fig, filepath)
+
+
+def pages_url(name):
+    """GitHub Pages URL of a chart written by generate_chart_html."""
+    return f"{GITHUB_PAGES_BASE_URL}/{name}.html"
+
+
+def build_markdown(chart_url=pages_url, impacts=None):
+    """
+    Render the article markdown with iframe embeds.
+
+    Args:
+        chart_url: Function mapping a chart name to its iframe URL
+        impacts: Statewide results keyed by statewide.py constant name;
+            defaults to the published results
+    """
+    impacts = impacts or statewide.published_impacts()
+    REVENUE_IMPACT_MILLIONS = impacts["REVENUE_IMPACT_MILLIONS"]
+    PERCENT_BENEFITING = impacts["PERCENT_BENEFITING"]
+    GINI_IMPACT_PCT = impacts["GINI_IMPACT_PCT"]
+    AVG_BENEFIT_PER_HOUSEHOLD = impacts["AVG_BENEFIT_PER_HOUSEHOLD"]
+    AVG_IMPACT_BY_DECILE = impacts["AVG_IMPACT_BY_DECILE"]
+    poverty = impacts["POVERTY_IMPACT_PCT"]
+    deep_poverty = impacts["DEEP_POVERTY_IMPACT_PCT"]
+    if poverty == 0 and deep_poverty == 0:
+        poverty_summary = "Has no effect on the Supplemental Poverty Measure"
+        poverty_effect = "have no effect on poverty or deep poverty"
+    else:
+        poverty_summary = (
+            f"Changes Supplemental Poverty Measure poverty by {poverty}% and deep "
+            f"poverty by {deep_poverty}%"
+        )
+        poverty_effect = (
+            f"change poverty by {poverty}% and deep poverty by {deep_poverty}%"
+        )
+    return f"""On January 7th, Senator Daniel McCray (R-Riverton) submitted [SB60](https://le.utah.gov/~2026/bills/static/SB0060.html) to the Utah State Senate. The bill proposes reducing Utah's flat income tax rate from 4.5% to 4.45%, beginning in tax year 2026. This would continue Utah's trend of income tax cuts, marking the fifth consecutive year of rate reductions since the tax rate stood at 4.95% in 2021.
 
 We at PolicyEngine have analyzed the effects of this proposed change on the state of Utah and its residents.
 
@@ -113,7 +266,7 @@ Key results for 2026:
 
 * Reduces state revenues by ${abs(REVENUE_IMPACT_MILLIONS)} million
 * Benefits {PERCENT_BENEFITING}% of Utah residents
-* Has no effect on the Supplemental Poverty Measure
+* {poverty_summary}
 * Raises the Gini index of inequality by {GINI_IMPACT_PCT}%
 
 *[Use PolicyEngine](https://www.policyengine.org/us) to view the full results or calculate the effect on your household.*
@@ -130,7 +283,7 @@ Unlike the [2025 tax package](https://www.policyengine.org/us/research/utah-inco
 
 Let's examine how SB60 affects a single adult's net income in Utah. Due to interactions with the Utah taxpayer credit, this household does not benefit with earnings below $20,500. Above this threshold, the taxpayer credit begins to phase out, and tax savings become proportional to earnings. For example, [at $80,000 of earnings](https://app.policyengine.org/us/report-output/sur-mk70207zzf9k), the single adult would see their Utah income tax liability decrease by $40. Figure 1 displays the change in net income for a single adult as earnings rise.
 
-<iframe src="{GITHUB_PAGES_BASE_URL}/net-income-change.html" width="100%" height="650" frameborder="0"></iframe>
+<iframe src="{chart_url('net-income-change')}" width="100%" height="650" frameborder="0"></iframe>
 
 ## Statewide impacts
 
@@ -138,13 +291,13 @@ For tax year 2026, SB60 would reduce state revenues by ${abs(REVENUE_IMPACT_MILL
 
 The tax cut would raise the net income of {PERCENT_BENEFITING}% of residents in Utah. The percentage of residents in each income decile who are net beneficiaries varies, with residents in higher-income deciles more likely to benefit since they have greater taxable income.
 
-<iframe src="{GITHUB_PAGES_BASE_URL}/winners-by-decile.html" width="100%" height="650" frameborder="0"></iframe>
+<iframe src="{chart_url('winners-by-decile')}" width="100%" height="650" frameborder="0"></iframe>
 
 SB60 would provide an average benefit of ${AVG_BENEFIT_PER_HOUSEHOLD} per household, ranging from ${AVG_IMPACT_BY_DECILE[0]} in the bottom income decile to ${AVG_IMPACT_BY_DECILE[-1]} in the top decile.
 
-<iframe src="{GITHUB_PAGES_BASE_URL}/avg-benefit-by-decile.html" width="100%" height="650" frameborder="0"></iframe>
+<iframe src="{chart_url('avg-benefit-by-decile')}" width="100%" height="650" frameborder="0"></iframe>
 
-We project that SB60 would have no effect on poverty or deep poverty while raising the state's Gini index of inequality by {GINI_IMPACT_PCT}%.
+We project that SB60 would {poverty_effect} while raising the state's Gini index of inequality by {GINI_IMPACT_PCT}%.
 
 ## Conclusion
 
@@ -155,15 +308,285 @@ As policymakers evaluate reforms such as these, analytical tools like PolicyEngi
 We invite you to explore our [additional analyses](https://www.policyengine.org/us/research) and use [PolicyEngine](https://www.policyengine.org/us) to calculate your own tax benefits or design custom policy reforms.
 """
 
-with open("output/utah-sb60-income-tax-reduction.md", "w") as f:
-    f.write(markdown)
-print("Generated output/utah-sb60-income-tax-reduction.md")
-
-print("\n" + "="*60)
-print("Done!")
-print("="*60)
-print("\nCharts will be deployed to GitHub Pages automatically on push.")
-print(f"Chart URLs: {GITHUB_PAGES_BASE_URL}/<chart-name>.html")
-print("\nTo update policyengine-app-v2, copy the markdown file:")
-print("   cp output/utah-sb60-income-tax-reduction.md \\")
-print("      ../policyengine-app-v2/app/src/data/posts/articles/")
+
+def write_markdown(filepath, bundled=False, impacts=None):
+    """
+    Write the article markdown file. With bundled, iframe URLs are resolved
+    through the chart bundle manifest next to it. impacts defaults to the
+    published statewide results.
+    """
+    chart_url = pages_url
+    if bundled:
+        manifest = bundle.load_manifest(Path(filepath).parent / "charts")
+        chart_url = partial(bundle.chart_url, manifest, base_url=GITHUB_PAGES_BASE_URL)
+    with profiling.span("write markdown"):
+        with open(filepath, "w") as f:
+            f.write(build_markdown(chart_url, impacts))
+    print(f"Generated {filepath}")
+
+
+def module_inputs(*modules):
+    """
+    Fingerprint whole package modules, so a change to any helper a step
+    calls, not only the functions it names, rebuilds the step.
+    """
+    return {f"{module.__name__}.py": module for module in modules}
+
+
+def chart_inputs(bundled=False):
+    """
+    Inputs shared by every chart: the spec and serialization code, the
+    page template and the shared chart styling. Built when the graph is,
+    not at import, so worker processes skip the template read.
+    """
+    if bundled:
+        writer = {
+            "generate_chart_bundle": generate_chart_bundle,
+            "CHART_SHELL_TEMPLATE": CHART_SHELL_TEMPLATE,
+            **module_inputs(bundle),
+        }
+    else:
+        writer = {
+            "generate_chart_html": generate_chart_html,
+            "CHART_HTML_TEMPLATE": CHART_HTML_TEMPLATE,
+        }
+    return {
+        **writer,
+        "build_chart": build_chart,
+        **module_inputs(figures, payload, theme),
+        "plotly_template": theme.plotly_template(),
+    }
+
+
+def simulation_inputs():
+    """
+    Inputs of every chart simulated with PolicyEngine-US: the household
+    simulation code, the cached and snapshotted systems it runs on, the
+    SB60 parameters and the installed model versions.
+    """
+    return {
+        **module_inputs(household, reform, cache, snapshot),
+        "reform": reform.SB60_REFORM_PARAMETERS,
+        "baseline": reform.SB60_BASELINE_PARAMETERS,
+        "policyengine_us": cache.policyengine_us_version(),
+        "policyengine_core": cache.policyengine_core_version(),
+    }
+
+
+def statewide_inputs(impacts, *names):
+    """Select the statewide results an output depends on."""
+    return {f"statewide.{name}": impacts[name] for name in names}
+
+
+def build_graph(output_dir="output", bundled=False, adaptive=False, impacts=None):
+    """
+    Declare each output and the inputs it depends on.
+
+    Args:
+        output_dir: Directory outputs are written to
+        bundled: Write charts as content-hashed bundles instead of
+            standalone HTML files
+        adaptive: Sample Figure 1 adaptively instead of one $50 sweep
+        impacts: Statewide results for the decile charts and article, e.g.
+            from microdata.compute_statewide_impacts; defaults to the
+            published statewide.py constants
+    """
+    impacts = impacts or statewide.published_impacts()
+    graph = BuildGraph(f"{output_dir}/.build-manifest.json")
+    shared_chart_inputs = chart_inputs(bundled)
+    shared_simulation_inputs = simulation_inputs()
+    graph.add(
+        Target(
+            "net-income-change",
+            f"{output_dir}/charts/net-income-change.html",
+            partial(
+                build_chart, "net-income-change", bundled=bundled, adaptive=adaptive
+            ),
+            {
+                **shared_chart_inputs,
+                **shared_simulation_inputs,
+                **(module_inputs(sampling) if adaptive else {}),
+                "net_income_change_spec": net_income_change_spec,
+                "adaptive": adaptive,
+            },
+        )
+    )
+    graph.add(
+        Target(
+            "winners-by-decile",
+            f"{output_dir}/charts/winners-by-decile.html",
+            partial(
+                build_chart, "winners-by-decile", bundled=bundled, impacts=impacts
+            ),
+            {
+                **shared_chart_inputs,
+                **statewide_inputs(
+                    impacts,
+                    "DECILES",
+                    "GAIN_MORE_THAN_5PCT",
+                    "GAIN_LESS_THAN_5PCT",
+                    "NO_CHANGE",
+                    "LOSS_LESS_THAN_5PCT",
+                    "LOSS_MORE_THAN_5PCT",
+                    "ALL_GAIN_MORE_THAN_5PCT",
+                    "ALL_GAIN_LESS_THAN_5PCT",
+                    "ALL_NO_CHANGE",
+                    "ALL_LOSS_LESS_THAN_5PCT",
+                    "ALL_LOSS_MORE_THAN_5PCT",
+                ),
+            },
+        )
+    )
+    graph.add(
+        Target(
+            "avg-benefit-by-decile",
+            f"{output_dir}/charts/avg-benefit-by-decile.html",
+            partial(
+                build_chart, "avg-benefit-by-decile", bundled=bundled, impacts=impacts
+            ),
+            {
+                **shared_chart_inputs,
+                **statewide_inputs(impacts, "DECILES", "AVG_IMPACT_BY_DECILE"),
+            },
+        )
+    )
+    graph.add(
+        Target(
+            "net-income-change-by-household",
+            f"{output_dir}/charts/net-income-change-by-household.html",
+            partial(build_chart, "net-income-change-by-household", bundled=bundled),
+            {
+                **shared_chart_inputs,
+                **shared_simulation_inputs,
+                "net_income_change_heatmap_spec": net_income_change_heatmap_spec,
+                "household_grid_situations": [
+                    household.build_household_grid_situation(
+                        structure, step=theme.HOUSEHOLD_GRID_STEP
+                    )
+                    for structure in household.GRID_HOUSEHOLD_STRUCTURES
+                ],
+            },
+        )
+    )
+    graph.add(
+        Target(
+            "article",
+            f"{output_dir}/utah-sb60-income-tax-reduction.md",
+            partial(write_markdown, bundled=bundled, impacts=impacts),
+            {
+                "build_markdown": build_markdown,
+                "write_markdown": write_markdown,
+                "pages_url": pages_url,
+                "bundled": bundled,
+                **module_inputs(bundle),
+                **statewide_inputs(
+                    impacts,
+                    "REVENUE_IMPACT_MILLIONS",
+                    "PERCENT_BENEFITING",
+                    "POVERTY_IMPACT_PCT",
+                    "DEEP_POVERTY_IMPACT_PCT",
+                    "GINI_IMPACT_PCT",
+                    "AVG_BENEFIT_PER_HOUSEHOLD",
+                    "AVG_IMPACT_BY_DECILE",
+                ),
+                "GITHUB_PAGES_BASE_URL": GITHUB_PAGES_BASE_URL,
+            },
+        )
+    )
+    return graph
+
+
+def run_bundled(graph, args):
+    """
+    Build charts, then the bundle manifest, then the article whose iframe
+    URLs are resolved through it.
+    """
+    names = args.only or list(graph.targets)
+    report = []
+    chart_names = [name for name in names if name in CHARTS]
+    if chart_names:
+        report += graph.run(chart_names, force=args.force, jobs=args.jobs)
+    manifest = bundle.write_manifest(Path(args.out) / "charts", list(CHARTS))
+    if "article" in names:
+        report += graph.run(["article"], force=args.force, jobs=args.jobs)
+    total = sum(entry["bytes"] for entry in manifest["charts"].values())
+    print(
+        f"Bundle manifest lists {len(manifest['charts'])} charts ({total:,} bytes of data)"
+    )
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate blog post assets for Utah SB60 analysis."
+    )
+    parser.add_argument(
+        "--jobs", type=int, help="Worker processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=[*CHARTS, "article"],
+        help="Build only this output (repeatable)",
+    )
+    parser.add_argument("--out", default="output", help="Output directory")
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild even if inputs are unchanged"
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Write chart data as content-hashed JSON files with a manifest",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Sample Figure 1 adaptively (exact kinks, more simulation rounds)",
+    )
+    parser.add_argument(
+        "--microdata",
+        action="store_true",
+        help="Compute statewide results from microdata instead of statewide.py",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=profiling.DEFAULT_TRACE_PATH,
+        metavar="TRACE",
+        help=f"Write a Chrome trace of each stage (default: {profiling.DEFAULT_TRACE_PATH})",
+    )
+    args = parser.parse_args(argv)
+    if args.profile:
+        profiling.enable(args.profile)
+
+    print("Generating chart HTML files and markdown...")
+    with profiling.span("generate_post"):
+        impacts = None
+        if args.microdata:
+            from utah_sb60.microdata import compute_statewide_impacts
+
+            impacts = compute_statewide_impacts()
+        graph = build_graph(
+            args.out, bundled=args.bundle, adaptive=args.adaptive, impacts=impacts
+        )
+        if args.bundle:
+            report = run_bundled(graph, args)
+        else:
+            report = graph.run(args.only, force=args.force, jobs=args.jobs)
+    print_report(report)
+    if profiling.enabled():
+        print()
+        profiling.write_trace()
+
+    print("\n" + "=" * 60)
+    print("Done!")
+    print("=" * 60)
+    print("\nCharts will be deployed to GitHub Pages automatically on push.")
+    print(f"Chart URLs: {GITHUB_PAGES_BASE_URL}/<chart-name>.html")
+    print("\nTo update policyengine-app-v2, copy the markdown file:")
+    print(f"   cp {args.out}/utah-sb60-income-tax-reduction.md \\")
+    print("      ../policyengine-app-v2/app/src/data/posts/articles/")
+
+
+if __name__ == "__main__":
+    main()
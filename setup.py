@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import find_packages, setup
 
 setup(
     name="utah-sb60-calc",
@@ -7,7 +7,12 @@ setup(
     install_requires=[
         "policyengine-us>=1.0.0",
         "policyengine-core>=3.0.0",
+        "numpy>=1.24.0",
         "pandas>=2.0.0",
         "plotly>=5.0.0",
+        "cloudpickle>=2.0.0",
     ],
+    extras_require={
+        "parquet": ["pyarrow>=14.0.0"],
+    },
 )
@@ -0,0 +1,50 @@
+import importlib
+import sys
+
+import pytest
+
+from utah_sb60.build import BuildGraph, Target
+
+
+@pytest.fixture
+def helpers(tmp_path, monkeypatch):
+    """A helper module a build depends on, importable from tmp_path."""
+    (tmp_path / "sb60_build_helpers.py").write_text("RATE = 0.045\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield importlib.import_module("sb60_build_helpers")
+    sys.modules.pop("sb60_build_helpers", None)
+
+
+def write_output(path):
+    path.write_text("built\n")
+
+
+def graph_with(tmp_path, inputs):
+    graph = BuildGraph(tmp_path / "out" / ".build-manifest.json")
+    graph.add(Target("chart", tmp_path / "out" / "chart.html", write_output, inputs))
+    return graph
+
+
+def test_unchanged_inputs_skip_and_edited_helper_rebuilds(tmp_path, helpers):
+    inputs = {"sb60_build_helpers.py": helpers, "step": 50}
+    (first,) = graph_with(tmp_path, inputs).run(jobs=1)
+    assert first["rebuilt"] and first["reason"] == "output missing"
+
+    (second,) = graph_with(tmp_path, inputs).run(jobs=1)
+    assert not second["rebuilt"] and second["reason"] == "up to date"
+
+    (tmp_path / "sb60_build_helpers.py").write_text("RATE = 0.0445\n")
+    inputs["sb60_build_helpers.py"] = importlib.reload(helpers)
+    (third,) = graph_with(tmp_path, inputs).run(jobs=1)
+    assert third["rebuilt"]
+    assert third["reason"] == "changed: sb60_build_helpers.py"
+
+
+def test_changed_value_or_missing_output_rebuilds(tmp_path):
+    graph_with(tmp_path, {"step": 50}).run(jobs=1)
+    (changed,) = graph_with(tmp_path, {"step": 100}).run(jobs=1)
+    assert changed["reason"] == "changed: step"
+
+    (tmp_path / "out" / "chart.html").unlink()
+    (missing,) = graph_with(tmp_path, {"step": 100}).run(jobs=1)
+    assert missing["reason"] == "output missing"
@@ -0,0 +1,47 @@
+from utah_sb60 import bundle
+
+BASE_URL = "https://example.org/charts"
+
+
+def test_data_file_named_by_content_hash(tmp_path):
+    first = bundle.write_chart_data(tmp_path, "chart", "[1]", "{}")
+    again = bundle.write_chart_data(tmp_path, "chart", "[1]", "{}")
+    assert again == first
+    assert first.read_text() == '{"data":[1],"layout":{}}'
+
+    changed = bundle.write_chart_data(tmp_path, "chart", "[2]", "{}")
+    assert changed != first
+    assert not first.exists()
+    assert sorted(path.name for path in (tmp_path / bundle.DATA_DIR).iterdir()) == [
+        changed.name
+    ]
+
+
+def test_pruning_keeps_other_charts(tmp_path):
+    kept = bundle.write_chart_data(tmp_path, "chart-2", "[1]", "{}")
+    bundle.write_chart_data(tmp_path, "chart", "[1]", "{}")
+    bundle.write_chart_data(tmp_path, "chart", "[2]", "{}")
+    assert kept.exists()
+
+
+def test_manifest_round_trip(tmp_path):
+    path = bundle.write_chart_data(tmp_path, "chart", "[1]", "{}")
+    manifest = bundle.write_manifest(tmp_path, ["chart", "unbuilt"])
+    assert manifest == {
+        "version": bundle.MANIFEST_VERSION,
+        "charts": {
+            "chart": {
+                "shell": "chart.html",
+                "data": f"{bundle.DATA_DIR}/{path.name}",
+                "bytes": path.stat().st_size,
+            }
+        },
+    }
+    assert bundle.load_manifest(tmp_path) == manifest
+
+
+def test_chart_url_falls_back_to_shell_for_unbundled_chart(tmp_path):
+    bundle.write_chart_data(tmp_path, "chart", "[1]", "{}")
+    manifest = bundle.write_manifest(tmp_path, ["chart"])
+    assert bundle.chart_url(manifest, "chart", BASE_URL) == f"{BASE_URL}/chart.html"
+    assert bundle.chart_url(manifest, "unbuilt", BASE_URL) == f"{BASE_URL}/unbuilt.html"
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import numpy as np
+
+from utah_sb60 import cache
+
+
+def test_importing_cache_does_not_import_reform():
+    code = (
+        "import sys, utah_sb60.cache; "
+        "sys.exit('utah_sb60.reform' in sys.modules "
+        "or 'policyengine_core' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_key_covers_policyengine_core_version(monkeypatch):
+    spec = {"dataset": None}
+    before = cache.cache_key("scenario_results", spec, 2026)
+    assert cache.cache_key("scenario_results", spec, 2026) == before
+    monkeypatch.setattr(cache, "policyengine_core_version", lambda: "0.0.0-test")
+    assert cache.cache_key("scenario_results", spec, 2026) != before
+
+
+def test_cached_arrays_computes_once(tmp_path, monkeypatch):
+    monkeypatch.delenv("UTAH_SB60_CACHE", raising=False)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"values": np.arange(3.0)}
+
+    for _ in range(2):
+        arrays = cache.cached_arrays("test", {"n": 3}, 2026, compute, tmp_path)
+        np.testing.assert_array_equal(arrays["values"], np.arange(3.0))
+    assert len(calls) == 1
+    (entry,) = cache.inspect_cache(tmp_path)
+    assert entry["meta"]["policyengine_core"] == cache.policyengine_core_version()
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from utah_sb60.compact import (
+    DEFAULT_TOLERANCE,
+    METRIC_TOLERANCES,
+    MemoryReport,
+    main,
+    memory_budget_mb,
+)
+from utah_sb60.microdata import (
+    COMPACT_DTYPES,
+    COMPACT_WEIGHT_RTOL,
+    SCENARIO_COLUMNS,
+    aggregate_household_results,
+    compact_array,
+)
+
+
+def compact_results(results: dict) -> dict:
+    """Narrow a household table column by column, as scenario_columns does."""
+    compact = {
+        "weight": compact_array(
+            results["weight"], COMPACT_DTYPES["weight"], 0.0, COMPACT_WEIGHT_RTOL
+        ),
+        "people": compact_array(results["people"], COMPACT_DTYPES["people"]),
+    }
+    for scenario in ("baseline", "reform"):
+        for column in SCENARIO_COLUMNS:
+            name = f"{scenario}_{column}"
+            compact[name] = compact_array(results[name], COMPACT_DTYPES[column])
+    return compact
+
+
+def test_compact_metrics_within_tolerance(household_results):
+    # PolicyEngine-US returns these variables as float32; the compact run
+    # narrows those values and is compared with the float64 table
+    simulated = dict(household_results)
+    for name in ("weight", "baseline_net_income", "reform_net_income"):
+        simulated[name] = household_results[name].astype(np.float32)
+    compact = compact_results(simulated)
+    assert compact["people"].dtype == np.int16
+    assert compact["weight"].dtype == np.float32
+    assert compact["baseline_net_income"].dtype == np.float32
+
+    full = aggregate_household_results(household_results)
+    narrow = aggregate_household_results(compact)
+    for metric, value in full.items():
+        tolerance = METRIC_TOLERANCES.get(metric, DEFAULT_TOLERANCE)
+        np.testing.assert_allclose(
+            narrow[metric], value, atol=tolerance, err_msg=metric
+        )
+
+
+def test_compact_array_keeps_float64_when_rounding_loses_a_cent():
+    dollars = np.array([0.5, 123_456_789.01])
+    assert compact_array(dollars, np.float32).dtype == np.float64
+    assert compact_array(dollars[:1], np.float32).dtype == np.float32
+
+
+def test_weights_use_a_relative_tolerance():
+    # float32 rounds 123,456,789 by 3, far more than a cent but well within
+    # one part in a million
+    weights = np.array([123_456_789.0, 0.123456789])
+    assert compact_array(weights, np.float32).dtype == np.float64
+    narrowed = compact_array(weights, np.float32, 0.0, COMPACT_WEIGHT_RTOL)
+    assert narrowed.dtype == np.float32
+
+
+def test_integer_columns_must_be_exact():
+    assert compact_array(np.array([1.0, 40_000.0]), np.int16).dtype == np.float64
+    assert compact_array(np.array([1.0, 4.0]), np.int16).dtype == np.int16
+
+
+def test_memory_report_flags_a_run_over_budget():
+    report = MemoryReport(budget_mb=1)
+    report.record("start")
+    assert report.over_budget
+    assert "over the budget" in report.format_report()
+    assert not MemoryReport(budget_mb=None).over_budget
+
+
+@pytest.mark.parametrize(
+    "value, budget_mb", [("", None), ("0", None), ("8000", 8000.0)]
+)
+def test_memory_budget_from_environment(monkeypatch, value, budget_mb):
+    monkeypatch.setenv("UTAH_SB60_MEMORY_BUDGET_MB", value)
+    assert memory_budget_mb() == budget_mb
+
+
+@pytest.mark.parametrize("value", ["8GB", "-1", "nan"])
+def test_invalid_memory_budget_is_a_usage_error(monkeypatch, capsys, value):
+    monkeypatch.setenv("UTAH_SB60_MEMORY_BUDGET_MB", value)
+    with pytest.raises(ValueError, match="UTAH_SB60_MEMORY_BUDGET_MB"):
+        memory_budget_mb()
+    with pytest.raises(SystemExit) as exit_info:
+        main([])
+    assert exit_info.value.code == 2
+    assert "UTAH_SB60_MEMORY_BUDGET_MB" in capsys.readouterr().err
@@ -0,0 +1,96 @@
+import base64
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utah_sb60 import charts, figures
+from utah_sb60.household import GRID_CHILDREN, GRID_HOUSEHOLD_STRUCTURES
+from utah_sb60.payload import figure_payload
+from utah_sb60.statewide import published_impacts
+
+INCOMES = np.arange(0, 200_001, charts.HOUSEHOLD_GRID_STEP)
+RNG = np.random.default_rng(0)
+CURVE = (INCOMES, RNG.normal(size=len(INCOMES)).cumsum())
+GRID = (
+    INCOMES,
+    RNG.normal(size=(len(GRID_HOUSEHOLD_STRUCTURES), len(GRID_CHILDREN), len(INCOMES))),
+)
+HOUSEHOLD = (GRID, GRID_HOUSEHOLD_STRUCTURES, GRID_CHILDREN)
+PROJECTION = pd.DataFrame(
+    {"revenue_impact_millions": -100 - RNG.random(10) * 10},
+    index=pd.Index(range(2026, 2036), name="year"),
+)
+IMPACTS = published_impacts()
+INTERVALS = {
+    "AVG_IMPACT_BY_DECILE": {
+        "low": [value * 0.9 for value in IMPACTS["AVG_IMPACT_BY_DECILE"]],
+        "high": [value * 1.1 for value in IMPACTS["AVG_IMPACT_BY_DECILE"]],
+    }
+}
+
+# Chart name -> (Plotly figure builder, fast spec builder)
+PAIRS = {
+    "net-income-change": (
+        lambda: charts.create_net_income_change_chart(CURVE),
+        lambda: figures.net_income_change_figure(*CURVE),
+    ),
+    "winners-by-decile": (
+        lambda: charts.create_winners_by_decile_chart(IMPACTS),
+        lambda: figures.winners_by_decile_figure(IMPACTS),
+    ),
+    "winners-by-decile-published": (
+        charts.create_winners_by_decile_chart,
+        figures.winners_by_decile_figure,
+    ),
+    "avg-benefit-by-decile": (
+        lambda: charts.create_avg_benefit_by_decile_chart(IMPACTS),
+        lambda: figures.avg_benefit_by_decile_figure(IMPACTS),
+    ),
+    "avg-benefit-by-decile-intervals": (
+        lambda: charts.create_avg_benefit_by_decile_chart(IMPACTS, INTERVALS),
+        lambda: figures.avg_benefit_by_decile_figure(IMPACTS, INTERVALS),
+    ),
+    "net-income-change-by-household": (
+        lambda: charts.create_net_income_change_heatmap(*HOUSEHOLD),
+        lambda: figures.net_income_change_heatmap_figure(*HOUSEHOLD),
+    ),
+    "budget-window": (
+        lambda: charts.create_budget_window_chart(PROJECTION),
+        lambda: figures.budget_window_figure(PROJECTION),
+    ),
+}
+
+
+def decode_typed_arrays(value):
+    """
+    Replace typed arrays ({"dtype", "bdata"}) with their values as lists, so
+    payloads compare equal whatever dtype or shape string encoded them.
+    """
+    if isinstance(value, dict):
+        if "bdata" in value and "dtype" in value:
+            array = np.frombuffer(
+                base64.b64decode(value["bdata"]), dtype=np.dtype(value["dtype"])
+            )
+            if "shape" in value:
+                array = array.reshape([int(size) for size in value["shape"].split(",")])
+            return array.tolist()
+        return {key: decode_typed_arrays(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_typed_arrays(item) for item in value]
+    return value
+
+
+def payload_objects(figure) -> tuple:
+    """A figure's data and layout as published, parsed back from JSON."""
+    data_json, layout_json = figure_payload(figure)
+    return decode_typed_arrays(json.loads(data_json)), decode_typed_arrays(
+        json.loads(layout_json)
+    )
+
+
+@pytest.mark.parametrize("name", PAIRS)
+def test_fast_spec_matches_plotly_figure(name):
+    plotly_build, fast_build = PAIRS[name]
+    assert payload_objects(fast_build()) == payload_objects(plotly_build())
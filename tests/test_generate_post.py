@@ -0,0 +1,28 @@
+import json
+
+import generate_post
+from utah_sb60.microdata import aggregate_household_results
+from utah_sb60.statewide import published_impacts
+
+
+def test_article_and_decile_charts_use_given_impacts(tmp_path, household_results):
+    impacts = aggregate_household_results(household_results)
+    assert (
+        impacts["REVENUE_IMPACT_MILLIONS"]
+        != published_impacts()["REVENUE_IMPACT_MILLIONS"]
+    )
+    graph = generate_post.build_graph(tmp_path, impacts=impacts)
+    graph.run(["avg-benefit-by-decile", "article"], jobs=1)
+
+    article = (tmp_path / "utah-sb60-income-tax-reduction.md").read_text()
+    assert f"${abs(impacts['REVENUE_IMPACT_MILLIONS'])} million" in article
+    assert f"{impacts['PERCENT_BENEFITING']}% of Utah residents" in article
+    chart = (tmp_path / "charts" / "avg-benefit-by-decile.html").read_text()
+    text = json.dumps([f"${x}" for x in impacts["AVG_IMPACT_BY_DECILE"]])
+    assert text.replace(" ", "") in chart.replace(" ", "")
+
+
+def test_published_impacts_are_the_default(tmp_path):
+    published = generate_post.build_graph(tmp_path).targets["article"].inputs
+    explicit = generate_post.build_graph(tmp_path, impacts=published_impacts())
+    assert published == explicit.targets["article"].inputs
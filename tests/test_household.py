@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from utah_sb60 import household
+from utah_sb60.charts import NET_INCOME_CHANGE_TOLERANCE
+
+# Dollars the sampled curve may differ from the dense sweep at any income:
+# the sampling tolerance plus float32 rounding of simulated net income
+CURVE_TOLERANCE = NET_INCOME_CHANGE_TOLERANCE + 0.02
+DENSE_STEP = 50
+
+
+def sampled_curve_error(dense_incomes, dense_changes, incomes, changes):
+    """Largest gap between the sampled curve, drawn as a polyline, and a sweep."""
+    return np.max(np.abs(np.interp(dense_incomes, incomes, changes) - dense_changes))
+
+
+def test_sampled_curve_matches_dense_grid(monkeypatch):
+    # The Utah tax engine has the same piecewise-linear shape as the
+    # simulated change, without running PolicyEngine-US
+    monkeypatch.setattr(
+        household,
+        "simulate_net_income_change_at",
+        lambda incomes, year: household.calculate_net_income_change(incomes),
+    )
+    incomes, changes = household.sample_net_income_changes(
+        tolerance=NET_INCOME_CHANGE_TOLERANCE
+    )
+    dense_incomes = np.arange(0, 200_001, DENSE_STEP)
+    dense_changes = household.calculate_net_income_change(dense_incomes)
+    assert len(incomes) < 20
+    assert (
+        sampled_curve_error(dense_incomes, dense_changes, incomes, changes)
+        <= CURVE_TOLERANCE
+    )
+
+
+@pytest.mark.simulation
+def test_simulated_sampled_curve_matches_dense_sweep():
+    dense_incomes, dense_changes = household.simulate_net_income_changes(
+        step=DENSE_STEP
+    )
+    incomes, changes = household.sample_net_income_changes(
+        tolerance=NET_INCOME_CHANGE_TOLERANCE
+    )
+    assert (
+        sampled_curve_error(dense_incomes, dense_changes, incomes, changes)
+        <= CURVE_TOLERANCE
+    )
+
+
+def fake_simulate_net_income(situation, year):
+    """
+    Net income from the Utah tax engine for a grid situation, in the
+    income-major order PolicyEngine-US lays out axis copies.
+    """
+    axis = situation["axes"][0][0]
+    incomes = np.linspace(axis["min"], axis["max"], axis["count"])
+    ages = {
+        name: person["age"][str(year)] for name, person in situation["people"].items()
+    }
+    columns = {"baseline_net_income": [], "reform_net_income": []}
+    for members in (h["members"] for h in situation["households"].values()):
+        adults = sum(ages[member] >= 18 for member in members)
+        children = len(members) - adults
+        # PolicyEngine-US's own filing status rules, not grid_filing_status
+        if adults == 2:
+            filing_status = "joint"
+        else:
+            filing_status = "head_of_household" if children else "single"
+        for column, rate in (
+            ("baseline_net_income", household.PRE_SB60_RATE),
+            ("reform_net_income", household.SB60_RATE),
+        ):
+            tax = household.calculate_ut_income_tax(
+                incomes, rate, filing_status, children
+            )
+            columns[column].append(incomes - tax)
+    return {name: np.stack(values, axis=1).ravel() for name, values in columns.items()}
+
+
+def test_household_grids_match_per_household_changes(monkeypatch):
+    monkeypatch.setenv("UTAH_SB60_CACHE", "0")
+    monkeypatch.setattr(household, "_tax_benefit_systems", lambda: None)
+    monkeypatch.setattr(household, "_simulate_net_income", fake_simulate_net_income)
+    incomes, simulated = household.simulate_net_income_change_grid(step=5_000)
+    analytic_incomes, analytic = household.calculate_net_income_change_grid(step=5_000)
+    np.testing.assert_array_equal(incomes, analytic_incomes)
+
+    for s, structure in enumerate(household.GRID_HOUSEHOLD_STRUCTURES):
+        for c, children in enumerate(household.GRID_CHILDREN):
+            expected = household.calculate_net_income_change(
+                incomes, household.grid_filing_status(structure, children), children
+            )
+            np.testing.assert_allclose(simulated[s, c], expected, atol=1e-9)
+    for f, filing_status in enumerate(household.GRID_FILING_STATUSES):
+        for c, children in enumerate(household.GRID_CHILDREN):
+            expected = household.calculate_net_income_change(
+                incomes, filing_status, children
+            )
+            np.testing.assert_allclose(analytic[f, c], expected, atol=1e-9)
+
+
+def test_household_grid_situation_rejects_filing_statuses():
+    with pytest.raises(ValueError, match="household structures"):
+        household.build_household_grid_situation("head_of_household")
+
+
+def test_list_wrapper_matches_scalar_path():
+    incomes, changes = household.calculate_net_income_changes(step=2_500)
+    assert isinstance(incomes, list) and isinstance(changes, list)
+    assert incomes == list(range(0, 200_001, 2_500))
+    for income, change in zip(incomes, changes):
+        assert change == pytest.approx(
+            float(household.calculate_net_income_change(income)), abs=1e-9
+        )
+
+
+@pytest.mark.parametrize("filing_status", sorted(household.STANDARD_DEDUCTION))
+@pytest.mark.parametrize("rate", [household.PRE_SB60_RATE, household.SB60_RATE])
+@pytest.mark.parametrize("dependents", [0, 2])
+def test_taxpayer_credit_phase_out(filing_status, rate, dependents):
+    initial_credit = household.TAXPAYER_CREDIT_RATE * (
+        household.STANDARD_DEDUCTION[filing_status]
+        + household.PERSONAL_EXEMPTION * dependents
+    )
+    start = household.TAXPAYER_CREDIT_PHASE_OUT_THRESHOLD[filing_status]
+    end = start + initial_credit / household.TAXPAYER_CREDIT_PHASE_OUT_RATE
+    incomes = np.array([start - 100, start, start + 100, end - 100, end, end + 100])
+    expected = np.array(
+        [
+            # Full credit up to the phase-out start
+            rate * (start - 100) - initial_credit,
+            rate * start - initial_credit,
+            # Then 1.3 cents less credit per dollar of income
+            rate * (start + 100)
+            - (initial_credit - household.TAXPAYER_CREDIT_PHASE_OUT_RATE * 100),
+            rate * (end - 100) - household.TAXPAYER_CREDIT_PHASE_OUT_RATE * 100,
+            # No credit from the phase-out end on
+            rate * end,
+            rate * (end + 100),
+        ]
+    )
+    tax = household.calculate_ut_income_tax(incomes, rate, filing_status, dependents)
+    np.testing.assert_allclose(tax, np.maximum(expected, 0), atol=1e-6)
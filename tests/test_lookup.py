@@ -0,0 +1,26 @@
+from utah_sb60.lookup import (
+    build_lookup_tables,
+    load_lookup_tables,
+    save_lookup_tables,
+    verify_lookup_tables,
+)
+
+# Largest lookup error accepted, in dollars
+TOLERANCE = 1e-6
+
+
+def test_intact_tables_pass_verification(tmp_path):
+    tables = load_lookup_tables(
+        save_lookup_tables(build_lookup_tables(2), tmp_path / "tables.npz")
+    )
+    assert len(tables) == len(build_lookup_tables(2))
+    assert verify_lookup_tables(tables, samples=10_000) < TOLERANCE
+
+
+def test_corrupted_table_fails_verification():
+    tables = build_lookup_tables(2)
+    incomes, changes = tables[("joint", 1)]
+    changes = changes.copy()
+    changes[len(changes) // 2] += 5
+    tables[("joint", 1)] = (incomes, changes)
+    assert verify_lookup_tables(tables, samples=10_000) > 1
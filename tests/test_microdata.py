@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from utah_sb60 import statewide
+from utah_sb60.household import calculate_net_income_change
+from utah_sb60.microdata import (
+    OUTCOMES,
+    StatewideAccumulator,
+    classify_outcomes,
+    iter_chunks,
+    weighted_decile_cutoffs,
+    weighted_gini,
+)
+
+GAIN_LESS_THAN_5PCT = [name for name, _ in OUTCOMES].index("GAIN_LESS_THAN_5PCT")
+NO_CHANGE = [name for name, _ in OUTCOMES].index("NO_CHANGE")
+
+# Percentage points the recomputed shares may differ from the published ones,
+# which are rounded to 0.1
+SHARE_TOLERANCE = 0.1
+
+
+def test_known_household_gains_at_sb60_cut():
+    # Single filer on $60,000 of wages: $30 more net income at 4.45%, on a
+    # net income of about $50,000. That is a 0.06% change, which
+    # PolicyEngine's doubled formula puts at 0.12%, above the 0.1% bar.
+    change = float(calculate_net_income_change(60_000, "single"))
+    assert change == pytest.approx(30.0)
+    baseline = np.array([50_000.0])
+    outcome = classify_outcomes(baseline, baseline + change)
+    assert outcome.tolist() == [GAIN_LESS_THAN_5PCT]
+
+
+def test_classify_outcomes_matches_policyengine_formula():
+    baseline = np.array([50_000.0, 50_000.0, 50_000.0, 0.0, 1_000.0, 1_000.0])
+    reform = np.array([50_024.0, 50_026.0, 47_500.0, 10.0, 975.0, 1_030.0])
+    # 2 * 24 / 50,000 = 0.096% is no change; 2 * 26 / 50,000 = 0.104% is a
+    # gain; -5% doubles to -10%; incomes are floored at 1
+    assert classify_outcomes(baseline, reform).tolist() == [2, 1, 4, 0, 4, 0]
+
+
+def test_published_decile_shares_match_statewide_totals():
+    # Deciles hold equal shares of people, so each statewide share is the
+    # mean of its decile shares
+    for decile_name, total_name in OUTCOMES:
+        shares = getattr(statewide, decile_name)
+        total = getattr(statewide, total_name)
+        assert np.mean(shares) == pytest.approx(total, abs=SHARE_TOLERANCE)
+    assert statewide.PERCENT_BENEFITING == pytest.approx(
+        statewide.ALL_GAIN_MORE_THAN_5PCT + statewide.ALL_GAIN_LESS_THAN_5PCT
+    )
+
+
+@pytest.mark.simulation
+def test_recomputed_shares_match_published():
+    from utah_sb60.microdata import compute_statewide_impacts
+
+    impacts = compute_statewide_impacts(2026)
+    for name in [
+        "ALL_GAIN_LESS_THAN_5PCT",
+        "ALL_NO_CHANGE",
+        "PERCENT_BENEFITING",
+    ]:
+        assert impacts[name] == pytest.approx(
+            getattr(statewide, name), abs=SHARE_TOLERANCE
+        ), name
+    for name in ["GAIN_LESS_THAN_5PCT", "NO_CHANGE"]:
+        np.testing.assert_allclose(
+            impacts[name], getattr(statewide, name), atol=SHARE_TOLERANCE
+        )
+
+
+def accumulate(results: dict, chunk_size: int) -> StatewideAccumulator:
+    cutoffs = weighted_decile_cutoffs(
+        results["baseline_equiv_net_income"], results["weight"] * results["people"]
+    )
+    accumulator = StatewideAccumulator(cutoffs)
+    for chunk in iter_chunks(results, chunk_size):
+        accumulator.update(chunk)
+    return accumulator
+
+
+def test_accumulator_state_does_not_grow_with_households(make_household_results):
+    small = accumulate(make_household_results(1_000), chunk_size=500)
+    large = accumulate(make_household_results(20_000), chunk_size=500)
+    assert len(large.sums.units) == len(small.sums.units)
+    assert vars(large).keys() == vars(small).keys()
+    assert large.summary()["sums"].shape == small.summary()["sums"].shape == ()
+
+
+def test_histogram_gini_matches_exact_gini(make_household_results):
+    results = make_household_results(20_000)
+    person_weight = results["weight"] * results["people"]
+    gini = {
+        scenario: weighted_gini(results[f"{scenario}_equiv_net_income"], person_weight)
+        for scenario in ("baseline", "reform")
+    }
+    exact = (gini["reform"] - gini["baseline"]) / gini["baseline"] * 100
+    assert exact != 0
+    impacts = accumulate(results, chunk_size=5_000).result()
+    assert impacts["GINI_IMPACT_PCT"] == round(exact, 2)
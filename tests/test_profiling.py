@@ -0,0 +1,59 @@
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from utah_sb60 import profiling
+
+
+def traced_work(n: int) -> int:
+    with profiling.span("worker span", n=n):
+        return os.getpid()
+
+
+@pytest.fixture
+def trace(tmp_path, monkeypatch):
+    monkeypatch.setenv(profiling.ENV_VAR, "")
+    path = tmp_path / "trace.json"
+    profiling.enable(str(path))
+    yield path
+    profiling._configure(None)
+    profiling._events.clear()
+
+
+def test_spans_are_buffered_until_the_trace_is_written(trace, capsys):
+    with profiling.span("outer"):
+        with profiling.span("inner", rows=3):
+            pass
+    assert not profiling._spool_dir().exists()
+
+    profiling.write_trace()
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["outer", "inner"]
+    assert events[1]["args"]["rows"] == 3
+    assert events[1]["args"]["process_peak_rss_mb"] > 0
+    assert "proc peak MB" in capsys.readouterr().out
+
+
+def test_worker_spans_are_spooled_once_at_exit(trace):
+    # Forked workers start with a copy of this buffer and must not spool it
+    with profiling.span("before"):
+        pass
+    with profiling.span("parent"):
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(2, mp_context=context) as pool:
+            pids = set(pool.map(traced_work, range(6)))
+
+    parts = sorted(profiling._spool_dir().glob("*.jsonl"))
+    assert {int(part.stem) for part in parts} == pids
+    events = profiling.collect_events()
+    assert (
+        sorted(event["name"] for event in events)
+        == [
+            "before",
+            "parent",
+        ]
+        + ["worker span"] * 6
+    )
@@ -0,0 +1,37 @@
+import pytest
+
+from utah_sb60 import projection
+from utah_sb60.microdata import aggregate_household_results, combine_scenarios
+from utah_sb60.reform import SB60_BASELINE_PARAMETERS, SB60_REFORM_PARAMETERS
+from utah_sb60.sweep import metrics_row
+
+YEARS = [2028, 2026, 2027]
+
+
+def test_projection_rows_follow_requested_years(
+    monkeypatch, simulate_synthetic_scenario
+):
+    calls = []
+
+    def simulate_years(parameters, years, dataset=None, jobs=None):
+        calls.append(list(years))
+        return {year: simulate_synthetic_scenario(parameters, year) for year in years}
+
+    monkeypatch.setattr(projection, "simulate_scenario_years", simulate_years)
+    table = projection.project_statewide_impacts(iter(YEARS), jobs=1)
+
+    # One multi-year simulation per scenario, over every requested year
+    assert calls == [YEARS, YEARS]
+    assert table.index.name == "year"
+    assert table.index.tolist() == YEARS
+    for year, row in table.iterrows():
+        impacts = aggregate_household_results(
+            combine_scenarios(
+                simulate_synthetic_scenario(SB60_BASELINE_PARAMETERS, year),
+                simulate_synthetic_scenario(SB60_REFORM_PARAMETERS, year),
+            )
+        )
+        assert row.to_dict() == pytest.approx(metrics_row(impacts))
+    # Incomes grow each year, so the rate cut costs more revenue
+    revenue = table["revenue_impact_millions"].sort_index()
+    assert revenue.is_monotonic_decreasing
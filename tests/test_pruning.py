@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utah_sb60.pruning import RATE_PARAMETER, is_rate_cut
+from utah_sb60.reform import (
+    PRE_SB60_RATE,
+    SB60_BASELINE_PARAMETERS,
+    SB60_RATE,
+    SB60_REFORM_PARAMETERS,
+    rate_parameters,
+)
+
+YEAR = 2026
+
+
+def test_rate_cut():
+    assert is_rate_cut(SB60_BASELINE_PARAMETERS, SB60_REFORM_PARAMETERS)
+    assert is_rate_cut(SB60_BASELINE_PARAMETERS, SB60_BASELINE_PARAMETERS)
+
+
+def test_rate_rise_is_not_a_cut():
+    assert not is_rate_cut(SB60_REFORM_PARAMETERS, SB60_BASELINE_PARAMETERS)
+
+
+def test_extra_parameter_is_not_a_cut():
+    reform = {
+        **SB60_REFORM_PARAMETERS,
+        "gov.states.ut.tax.income.credits.taxpayer.rate": {
+            "2026-01-01.2100-12-31": 0.05
+        },
+    }
+    assert not is_rate_cut(SB60_BASELINE_PARAMETERS, reform)
+    assert not is_rate_cut(reform, SB60_BASELINE_PARAMETERS)
+
+
+def test_mismatched_periods_are_not_a_cut():
+    reform = {RATE_PARAMETER: {"2027-01-01.2100-12-31": SB60_RATE}}
+    assert not is_rate_cut(SB60_BASELINE_PARAMETERS, reform)
+    split = {
+        RATE_PARAMETER: {
+            "2026-01-01.2026-12-31": SB60_RATE,
+            "2027-01-01.2100-12-31": PRE_SB60_RATE,
+        }
+    }
+    assert not is_rate_cut(rate_parameters(PRE_SB60_RATE), split)
+
+
+def two_household_dataset() -> pd.DataFrame:
+    """
+    Two single-adult Utah households: one with no earnings, so no Utah tax,
+    and one earning $60,000.
+    """
+    period = str(YEAR)
+    ids = np.array([1, 2])
+    columns = {
+        "person_id": ids,
+        "age": [40, 40],
+        "employment_income": [0.0, 60_000.0],
+        "state_fips": [49, 49],
+        "county_fips": ["49035", "49035"],
+        "household_weight": [100.0, 100.0],
+    }
+    for entity in ("household", "tax_unit", "spm_unit", "family", "marital_unit"):
+        columns[f"{entity}_id"] = ids
+        columns[f"person_{entity}_id"] = ids
+    return pd.DataFrame(
+        {f"{name}__{period}": values for name, values in columns.items()}
+    )
+
+
+@pytest.mark.simulation
+def test_pruned_scenarios_match_full_reform_run():
+    from utah_sb60.microdata import (
+        SCENARIO_COLUMNS,
+        build_microsimulation,
+        scenario_columns,
+    )
+    from utah_sb60.pruning import simulate_pruned_scenarios
+
+    dataset = two_household_dataset()
+    baseline, reform, affected = simulate_pruned_scenarios(YEAR, dataset)
+    full = scenario_columns(
+        build_microsimulation(SB60_REFORM_PARAMETERS, dataset), YEAR
+    )
+
+    assert affected.tolist() == [False, True]
+    assert reform["net_income"][1] > baseline["net_income"][1]
+    for column in SCENARIO_COLUMNS:
+        np.testing.assert_allclose(reform[column], full[column], err_msg=column)
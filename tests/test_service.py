@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+
+from utah_sb60 import service as service_module
+from utah_sb60.service import MAX_BODY_BYTES, HouseholdService
+
+
+async def exchange(request: bytes) -> tuple[int, dict]:
+    """Send one raw request to a fresh service and read its response."""
+    service = HouseholdService()
+    server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout=5)
+        writer.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def get(headers: str = "") -> bytes:
+    return (
+        "GET /household?employment_income=60000 HTTP/1.1\r\n"
+        f"Connection: close\r\n{headers}\r\n"
+    ).encode()
+
+
+def test_household_query():
+    status, body = asyncio.run(exchange(get()))
+    assert status == 200
+    assert body["net_income_change"] == pytest.approx(30.0)
+
+
+@pytest.mark.parametrize(
+    "length, status",
+    [("abc", 400), ("-1", 400), (str(MAX_BODY_BYTES + 1), 413)],
+)
+def test_bad_content_length_is_rejected(length, status):
+    request = get(f"Content-Length: {length}\r\n")
+    assert asyncio.run(exchange(request))[0] == status
+
+
+def test_body_is_read_and_ignored():
+    request = get("Content-Length: 5\r\n") + b"hello"
+    assert asyncio.run(exchange(request))[0] == 200
+
+
+def test_cancelled_request_does_not_cancel_shared_query():
+    async def run():
+        service = HouseholdService()
+        key = (60_000.0, "single", 0)
+        cancelled = asyncio.create_task(service.answer(key))
+        waiting = asyncio.create_task(service.answer(key))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await asyncio.wait_for(waiting, timeout=5)
+
+    assert asyncio.run(run())["net_income_change"] == pytest.approx(30.0)
+
+
+@pytest.mark.parametrize(
+    "request_bytes, status",
+    [
+        (b"GET /household?employment_income=" + b"1" * 70_000 + b" HTTP/1.1\r\n", 400),
+        (get("X-Padding: " + "a" * 70_000 + "\r\n"), 431),
+    ],
+    ids=["request-line", "header-line"],
+)
+def test_oversized_lines_are_rejected(request_bytes, status):
+    assert asyncio.run(exchange(request_bytes))[0] == status
+
+
+def test_failed_evaluation_fails_only_its_group(monkeypatch):
+    def evaluate(incomes, filing_status, dependents):
+        if filing_status == "joint":
+            raise RuntimeError("engine failure")
+        return original(incomes, filing_status, dependents)
+
+    original = service_module.evaluate_households
+    monkeypatch.setattr(service_module, "evaluate_households", evaluate)
+
+    async def run():
+        service = HouseholdService()
+        return await asyncio.wait_for(
+            asyncio.gather(
+                service.answer((60_000.0, "joint", 0)),
+                service.answer((60_000.0, "single", 0)),
+                return_exceptions=True,
+            ),
+            timeout=5,
+        )
+
+    failed, answered = asyncio.run(run())
+    assert isinstance(failed, RuntimeError)
+    assert answered["net_income_change"] == pytest.approx(30.0)
@@ -0,0 +1,38 @@
+import random
+
+import numpy as np
+import pytest
+
+from utah_sb60.microdata import aggregate_household_results
+from utah_sb60.shards import merge_summaries, sharded_impacts, summarize_shard
+from utah_sb60.store import open_household_table
+
+CHUNK_SIZE = 300
+
+
+@pytest.fixture
+def expected(table):
+    return aggregate_household_results(open_household_table(table), CHUNK_SIZE)
+
+
+def assert_identical(impacts, expected):
+    assert impacts.keys() == expected.keys()
+    for name, value in expected.items():
+        np.testing.assert_array_equal(impacts[name], value, err_msg=name)
+
+
+def test_sharded_impacts_are_bit_identical(table, expected):
+    impacts = sharded_impacts(table, shards=3, jobs=1, chunk_size=CHUNK_SIZE)
+    assert_identical(impacts, expected)
+
+
+def test_merge_order_does_not_change_impacts(table, expected):
+    summaries = [summarize_shard(table, shard, 5, CHUNK_SIZE) for shard in range(5)]
+    random.Random(0).shuffle(summaries)
+    assert_identical(merge_summaries(summaries), expected)
+
+
+def test_merge_rejects_missing_shard(table):
+    summaries = [summarize_shard(table, shard, 3, CHUNK_SIZE) for shard in range(2)]
+    with pytest.raises(ValueError, match="every chunk"):
+        merge_summaries(summaries)
@@ -0,0 +1,32 @@
+import logging
+import pickle
+
+from utah_sb60 import snapshot
+from utah_sb60.reform import SB60_BASELINE_PARAMETERS, SB60_REFORM_PARAMETERS
+
+
+class Corrupt:
+    """Unpickles by calling int("corrupt"), which raises ValueError."""
+
+    def __reduce__(self):
+        return int, ("corrupt",)
+
+
+def test_snapshot_key_tracks_version_and_parameters(monkeypatch):
+    key = snapshot.snapshot_key(SB60_REFORM_PARAMETERS)
+    assert snapshot.snapshot_key(SB60_REFORM_PARAMETERS) == key
+    assert snapshot.snapshot_key(SB60_BASELINE_PARAMETERS) != key
+
+    monkeypatch.setattr(snapshot, "policyengine_us_version", lambda: "0.0.1")
+    older = snapshot.snapshot_key(SB60_REFORM_PARAMETERS)
+    monkeypatch.setattr(snapshot, "policyengine_us_version", lambda: "0.0.2")
+    assert snapshot.snapshot_key(SB60_REFORM_PARAMETERS) != older
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path, caplog):
+    path = tmp_path / "system.pkl"
+    path.write_bytes(pickle.dumps(Corrupt()))
+    with caplog.at_level(logging.WARNING, logger=snapshot.__name__):
+        assert snapshot._load_snapshot(path) is None
+    assert "unreadable snapshot" in caplog.text
+    assert snapshot._load_snapshot(tmp_path / "missing.pkl") is None
@@ -0,0 +1,42 @@
+import numpy as np
+
+from utah_sb60.store import open_household_table, read_table_meta, write_household_table
+
+
+def test_table_round_trip(tmp_path, household_results):
+    household_results["weight"] = household_results["weight"].astype(np.float32)
+    path = write_household_table(
+        household_results, tmp_path / "table", meta={"year": 2026}
+    )
+    table = open_household_table(path)
+
+    assert table.keys() == {*household_results, "decile"}
+    for column, values in household_results.items():
+        assert isinstance(table[column], np.memmap), column
+        assert table[column].dtype == values.dtype, column
+        np.testing.assert_array_equal(table[column], values, err_msg=column)
+    assert table["decile"].dtype == np.int8
+    assert set(np.unique(table["decile"])) == set(range(1, 11))
+
+    meta = read_table_meta(path)
+    assert meta["rows"] == len(household_results["weight"])
+    assert meta["year"] == 2026
+    assert len(meta["decile_cutoffs"]) == 9
+
+
+def test_open_selected_columns_read_only(tmp_path, household_results):
+    path = write_household_table(household_results, tmp_path / "table")
+    table = open_household_table(path, ["weight", "people"])
+    assert list(table) == ["weight", "people"]
+    assert not table["weight"].flags.writeable
+
+
+def test_deciles_rank_equivalised_net_income(tmp_path, household_results):
+    table = open_household_table(
+        write_household_table(household_results, tmp_path / "table")
+    )
+    equivalised = household_results["baseline_equiv_net_income"]
+    for decile in range(1, 10):
+        below = equivalised[table["decile"] == decile]
+        above = equivalised[table["decile"] == decile + 1]
+        assert below.max() <= above.min(), decile
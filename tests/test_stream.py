@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from utah_sb60.household import calculate_net_income_change_arrays
+from utah_sb60.stream import RECORD_DTYPE, write_npy, write_sweep
+
+
+def test_npy_sink_round_trip(tmp_path):
+    path = tmp_path / "sweep.npy"
+    rows = write_sweep(path, 0, 100_000, step=7, chunk_size=1_000)
+    incomes, changes = calculate_net_income_change_arrays(0, 100_000, 7)
+
+    records = np.load(path, mmap_mode="r")
+    assert rows == len(incomes) == records.shape[0]
+    assert records.dtype == RECORD_DTYPE
+    np.testing.assert_array_equal(records["employment_income"], incomes)
+    np.testing.assert_array_equal(records["net_income_change"], changes)
+
+
+def test_npy_sink_rejects_wrong_row_count(tmp_path):
+    chunks = [(np.arange(3), np.zeros(3))]
+    with pytest.raises(ValueError, match="Expected 4 rows, got 3"):
+        write_npy(chunks, tmp_path / "sweep.npy", rows=4)
@@ -0,0 +1,31 @@
+import pytest
+
+from utah_sb60 import sweep
+from utah_sb60.microdata import aggregate_household_results, combine_scenarios
+from utah_sb60.reform import SB60_BASELINE_PARAMETERS, rate_parameters
+
+RATES = [0.0445, 0.044, 0.0425]
+
+
+def test_rate_sweep_rows(monkeypatch, simulate_synthetic_scenario):
+    monkeypatch.setattr(sweep, "simulate_scenario", simulate_synthetic_scenario)
+    table = sweep.run_rate_sweep(RATES, jobs=1)
+
+    assert table["rate"].tolist() == RATES
+    assert list(table.columns[:6]) == [
+        "rate",
+        "revenue_impact_millions",
+        "percent_benefiting",
+        "avg_benefit_per_household",
+        "poverty_impact_pct",
+        "gini_impact_pct",
+    ]
+    assert [f"avg_impact_decile_{d}" for d in range(1, 11)] == list(table.columns[6:])
+    baseline = simulate_synthetic_scenario(SB60_BASELINE_PARAMETERS)
+    for rate, (_, row) in zip(RATES, table.iterrows()):
+        reform = simulate_synthetic_scenario(rate_parameters(rate))
+        impacts = aggregate_household_results(combine_scenarios(baseline, reform))
+        assert row.to_dict() == pytest.approx(sweep.sweep_row(rate, impacts))
+    # Every rate is a cut from the pre-SB60 rate; deeper cuts cost more
+    assert table["revenue_impact_millions"].is_monotonic_decreasing
+    assert (table["revenue_impact_millions"] < 0).all()
@@ -0,0 +1,55 @@
+import numpy as np
+
+from utah_sb60.microdata import aggregate_household_results
+from utah_sb60.store import open_household_table
+from utah_sb60 import uncertainty
+from utah_sb60.uncertainty import confidence_intervals
+
+# Rounding of each published metric
+ROUNDING = {
+    "REVENUE_IMPACT_MILLIONS": 0.05,
+    "PERCENT_BENEFITING": 0.1,
+    "AVG_IMPACT_BY_DECILE": 0.5,
+}
+
+
+def test_point_estimates_lie_in_intervals_and_match_accumulator(table):
+    intervals = confidence_intervals(table, replicates=200, jobs=1, chunk_size=500)
+    impacts = aggregate_household_results(open_household_table(table))
+    assert 0 < impacts["PERCENT_BENEFITING"] < 100
+    for name, tolerance in ROUNDING.items():
+        estimate = np.asarray(intervals[name]["estimate"])
+        assert np.all(intervals[name]["low"] <= estimate), name
+        assert np.all(estimate <= intervals[name]["high"]), name
+        np.testing.assert_allclose(estimate, impacts[name], atol=tolerance)
+
+
+def test_intervals_do_not_depend_on_chunking(table):
+    small = confidence_intervals(table, replicates=50, jobs=1, chunk_size=300)
+    large = confidence_intervals(table, replicates=50, jobs=1, chunk_size=5_000)
+    for name in ROUNDING:
+        for key in ("estimate", "low", "high", "std_error"):
+            np.testing.assert_allclose(
+                small[name][key], large[name][key], err_msg=f"{name} {key}"
+            )
+
+
+def test_draws_depend_only_on_row():
+    whole = uncertainty._poisson_draws(0, 0, 3_000, replicates=5)
+    np.testing.assert_array_equal(
+        uncertainty._poisson_draws(0, 300, 2_500, replicates=5), whole[:, 300:2_500]
+    )
+
+
+def test_each_random_block_is_drawn_once(table, monkeypatch):
+    blocks = []
+    default_rng = np.random.default_rng
+
+    def recording_rng(seed):
+        blocks.append(seed[1])
+        return default_rng(seed)
+
+    monkeypatch.setattr(uncertainty.np.random, "default_rng", recording_rng)
+    uncertainty.replicate_estimates(table, replicates=5, jobs=1, chunk_size=300)
+    rows = len(open_household_table(table, ["weight"])["weight"])
+    assert sorted(blocks) == list(range(-(-rows // uncertainty._RNG_BLOCK)))
@@ -1,59 +1,85 @@
-"""Utah SB60 income tax reduction analysis package."""
-
-from .reform import ut_sb60_reform
-from .household import calculate_net_income_changes
-from .statewide import (
-    DECILES,
-    GAIN_MORE_THAN_5PCT,
-    GAIN_LESS_THAN_5PCT,
-    NO_CHANGE,
-    LOSS_LESS_THAN_5PCT,
-    LOSS_MORE_THAN_5PCT,
-    ALL_GAIN_MORE_THAN_5PCT,
-    ALL_GAIN_LESS_THAN_5PCT,
-    ALL_NO_CHANGE,
-    ALL_LOSS_LESS_THAN_5PCT,
-    ALL_LOSS_MORE_THAN_5PCT,
-    AVG_IMPACT_BY_DECILE,
-    REVENUE_IMPACT_MILLIONS,
-    PERCENT_BENEFITING,
-    POVERTY_IMPACT_PCT,
-    DEEP_POVERTY_IMPACT_PCT,
-    GINI_IMPACT_PCT,
-    AVG_BENEFIT_PER_HOUSEHOLD,
-)
-from .charts import (
-    create_net_income_change_chart,
-    create_winners_by_decile_chart,
-    create_avg_benefit_by_decile_chart,
-)
-
-__all__ = [
+"""Utah SB60 income tax reduction analysis package.
+
+Exports are resolved lazily on first access, so importing the package does
+not pull in policyengine, pandas or plotly until a symbol that needs them is
+used.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
     # Reform
-    "ut_sb60_reform",
+    "ut_sb60_reform": ".reform",
+    "ut_sb60_baseline": ".reform",
+    "make_rate_reform": ".reform",
     # Household calculations
-    "calculate_net_income_changes",
+    "calculate_ut_income_tax": ".household",
+    "calculate_net_income_change": ".household",
+    "calculate_net_income_change_arrays": ".household",
+    "calculate_net_income_changes": ".household",
+    "build_household_situation": ".household",
+    "simulate_net_income_changes": ".household",
+    "sample_net_income_changes": ".household",
+    "iter_net_income_changes": ".household",
+    "calculate_net_income_change_grid": ".household",
+    "simulate_net_income_change_grid": ".household",
+    "lookup_net_income_change": ".lookup",
     # Statewide data
-    "DECILES",
-    "GAIN_MORE_THAN_5PCT",
-    "GAIN_LESS_THAN_5PCT",
-    "NO_CHANGE",
-    "LOSS_LESS_THAN_5PCT",
-    "LOSS_MORE_THAN_5PCT",
-    "ALL_GAIN_MORE_THAN_5PCT",
-    "ALL_GAIN_LESS_THAN_5PCT",
-    "ALL_NO_CHANGE",
-    "ALL_LOSS_LESS_THAN_5PCT",
-    "ALL_LOSS_MORE_THAN_5PCT",
-    "AVG_IMPACT_BY_DECILE",
-    "REVENUE_IMPACT_MILLIONS",
-    "PERCENT_BENEFITING",
-    "POVERTY_IMPACT_PCT",
-    "DEEP_POVERTY_IMPACT_PCT",
-    "GINI_IMPACT_PCT",
-    "AVG_BENEFIT_PER_HOUSEHOLD",
+    "DECILES": ".statewide",
+    "GAIN_MORE_THAN_5PCT": ".statewide",
+    "GAIN_LESS_THAN_5PCT": ".statewide",
+    "NO_CHANGE": ".statewide",
+    "LOSS_LESS_THAN_5PCT": ".statewide",
+    "LOSS_MORE_THAN_5PCT": ".statewide",
+    "ALL_GAIN_MORE_THAN_5PCT": ".statewide",
+    "ALL_GAIN_LESS_THAN_5PCT": ".statewide",
+    "ALL_NO_CHANGE": ".statewide",
+    "ALL_LOSS_LESS_THAN_5PCT": ".statewide",
+    "ALL_LOSS_MORE_THAN_5PCT": ".statewide",
+    "AVG_IMPACT_BY_DECILE": ".statewide",
+    "REVENUE_IMPACT_MILLIONS": ".statewide",
+    "PERCENT_BENEFITING": ".statewide",
+    "POVERTY_IMPACT_PCT": ".statewide",
+    "DEEP_POVERTY_IMPACT_PCT": ".statewide",
+    "GINI_IMPACT_PCT": ".statewide",
+    "AVG_BENEFIT_PER_HOUSEHOLD": ".statewide",
+    "published_impacts": ".statewide",
+    # Statewide microdata engine
+    "compute_statewide_impacts": ".microdata",
+    "run_rate_sweep": ".sweep",
+    "project_statewide_impacts": ".projection",
+    "household_table": ".store",
+    "open_household_table": ".store",
+    "write_household_table": ".store",
+    "sharded_impacts": ".shards",
+    "compact_statewide_impacts": ".compact",
+    "confidence_intervals": ".uncertainty",
     # Charts
-    "create_net_income_change_chart",
-    "create_winners_by_decile_chart",
-    "create_avg_benefit_by_decile_chart",
-]
+    "create_net_income_change_chart": ".charts",
+    "create_winners_by_decile_chart": ".charts",
+    "create_avg_benefit_by_decile_chart": ".charts",
+    "create_net_income_change_heatmap": ".charts",
+    "create_budget_window_chart": ".charts",
+    "net_income_change_figure": ".figures",
+    "winners_by_decile_figure": ".figures",
+    "avg_benefit_by_decile_figure": ".figures",
+    "net_income_change_heatmap_figure": ".figures",
+    "budget_window_figure": ".figures",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
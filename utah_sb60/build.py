@@ -0,0 +1,156 @@
+"""Incremental build graph for generated outputs.
+
+Each target declares the inputs its output depends on (source functions
+and modules, constants, parameters). A target is rebuilt only when its
+output is missing or the fingerprint of its inputs differs from the one
+saved in the manifest.
+"""
+
+import hashlib
+import inspect
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+
+def fingerprint_value(value) -> str:
+    """
+    Hash one input: functions, classes and modules by their source code,
+    everything else by its JSON (or repr) encoding.
+    """
+    if inspect.isfunction(value) or inspect.isclass(value) or inspect.ismodule(value):
+        text = inspect.getsource(value)
+    else:
+        text = json.dumps(value, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class Target:
+    """
+    One buildable output.
+
+    Args:
+        name: Short name used in reports and the manifest
+        path: Output file the build writes
+        build: Function taking the output path and writing it; must be
+            picklable (e.g. a module-level function or partial) to run in
+            a worker process
+        inputs: Label -> input (function, module, constant or parameter
+            value); list whole modules to cover the helpers a build calls
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        build: Callable[[Path], None],
+        inputs: dict,
+    ):
+        self.name = name
+        self.path = Path(path)
+        self.build = build
+        self.inputs = inputs
+
+    def input_fingerprints(self) -> dict:
+        return {label: fingerprint_value(value) for label, value in self.inputs.items()}
+
+
+class BuildGraph:
+    """
+    Set of targets sharing a manifest of input fingerprints.
+
+    Args:
+        manifest_path: JSON file recording each target's last-built inputs
+    """
+
+    def __init__(self, manifest_path: Path):
+        self.manifest_path = Path(manifest_path)
+        self.targets: dict[str, Target] = {}
+
+    def add(self, target: Target) -> Target:
+        self.targets[target.name] = target
+        return target
+
+    def _load_manifest(self) -> dict:
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def stale_reason(self, target: Target, manifest: dict) -> str | None:
+        """Return why target needs rebuilding, or None if it is up to date."""
+        if not target.path.exists():
+            return "output missing"
+        previous = manifest.get(target.name)
+        if previous is None:
+            return "not in manifest"
+        current = target.input_fingerprints()
+        changed = sorted(
+            label
+            for label in current.keys() | previous.keys()
+            if current.get(label) != previous.get(label)
+        )
+        if changed:
+            return "changed: " + ", ".join(changed)
+        return None
+
+    def run(
+        self,
+        names: list[str] | None = None,
+        force: bool = False,
+        jobs: int | None = None,
+    ) -> list[dict]:
+        """
+        Build stale targets and record their fingerprints.
+
+        Stale targets build concurrently in a process pool unless jobs is 1
+        or only one target is stale.
+
+        Args:
+            names: Targets to consider; defaults to all
+            force: Rebuild even if up to date
+            jobs: Worker processes; None uses os.cpu_count()
+
+        Returns:
+            One report dict per target with name, path, rebuilt and reason
+        """
+        manifest = self._load_manifest()
+        names = names or list(self.targets)
+        reasons = {
+            name: "forced" if force else self.stale_reason(self.targets[name], manifest)
+            for name in names
+        }
+        stale = [self.targets[name] for name in names if reasons[name] is not None]
+        for target in stale:
+            target.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if jobs == 1 or len(stale) <= 1:
+            for target in stale:
+                target.build(target.path)
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = [pool.submit(target.build, target.path) for target in stale]
+                for future in futures:
+                    future.result()
+
+        for target in stale:
+            manifest[target.name] = target.input_fingerprints()
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        return [
+            {
+                "name": name,
+                "path": str(self.targets[name].path),
+                "rebuilt": reasons[name] is not None,
+                "reason": reasons[name] or "up to date",
+            }
+            for name in names
+        ]
+
+
+def print_report(report: list[dict]) -> None:
+    """Print one line per target saying whether and why it was rebuilt."""
+    for entry in report:
+        status = "rebuilt" if entry["rebuilt"] else "skipped"
+        print(f"{status:>8}  {entry['path']}  ({entry['reason']})")
@@ -0,0 +1,125 @@
+"""Content-hashed chart bundles.
+
+In bundle mode each chart's data and layout are written to
+data/<name>.<hash>.json, named by a hash of their content. The chart's page
+is a small shell with a stable URL that looks its data file up in
+manifest.json. The shell is identical across deploys and a data file's name
+changes only with its content. So after a redeploy, browsers revalidate the
+shell and manifest and download only the charts that changed.
+
+    charts/
+    ├── manifest.json                       # chart name -> shell and data file
+    ├── net-income-change.html              # shell
+    └── data/net-income-change.<hash>.json  # {"data": [...], "layout": {...}}
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+MANIFEST_NAME = "manifest.json"
+DATA_DIR = "data"
+MANIFEST_VERSION = 1
+
+# Hex digits of the SHA-256 content hash kept in data file names
+HASH_LENGTH = 16
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def _data_files(charts_dir: Path, name: str) -> list[Path]:
+    """Data files written for one chart, by any build."""
+    pattern = re.compile(rf"{re.escape(name)}\.[0-9a-f]{{{HASH_LENGTH}}}\.json")
+    data_dir = Path(charts_dir) / DATA_DIR
+    if not data_dir.is_dir():
+        return []
+    return sorted(path for path in data_dir.iterdir() if pattern.fullmatch(path.name))
+
+
+def shell_name(name: str) -> str:
+    """File name of a chart's shell page, relative to the charts directory."""
+    return f"{name}.html"
+
+
+def write_chart_data(
+    charts_dir: Path, name: str, data_json: str, layout_json: str
+) -> Path:
+    """
+    Write a chart's data and layout JSON under its content hash, and delete
+    the chart's data files from earlier builds.
+
+    Args:
+        charts_dir: Charts output directory
+        name: Chart name
+        data_json: Serialized figure data (see payload.figure_payload)
+        layout_json: Serialized figure layout
+
+    Returns:
+        Path of the data file
+    """
+    text = f'{{"data":{data_json},"layout":{layout_json}}}'
+    digest = hashlib.sha256(text.encode()).hexdigest()[:HASH_LENGTH]
+    path = Path(charts_dir) / DATA_DIR / f"{name}.{digest}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        _write_atomic(path, text)
+    for stale in _data_files(charts_dir, name):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    return path
+
+
+def write_manifest(charts_dir: Path, names: list[str]) -> dict:
+    """
+    Record each chart's shell and current data file in manifest.json.
+
+    Charts with no data file yet are left out. The manifest is rewritten
+    only when an entry changed.
+
+    Args:
+        charts_dir: Charts output directory
+        names: Chart names to look up
+
+    Returns:
+        The manifest dict
+    """
+    charts = {}
+    for name in names:
+        files = _data_files(charts_dir, name)
+        if len(files) > 1:
+            raise ValueError(f"Found {len(files)} data files for chart {name!r}")
+        if files:
+            charts[name] = {
+                "shell": shell_name(name),
+                "data": f"{DATA_DIR}/{files[0].name}",
+                "bytes": files[0].stat().st_size,
+            }
+    manifest = {"version": MANIFEST_VERSION, "charts": charts}
+    text = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    path = Path(charts_dir) / MANIFEST_NAME
+    if not path.exists() or path.read_text() != text:
+        _write_atomic(path, text)
+    return manifest
+
+
+def load_manifest(charts_dir: Path) -> dict:
+    """Read manifest.json from a charts directory."""
+    return json.loads((Path(charts_dir) / MANIFEST_NAME).read_text())
+
+
+def chart_url(manifest: dict, name: str, base_url: str) -> str:
+    """
+    Stable URL of a chart's page, resolved through the manifest.
+
+    The shell's URL does not depend on the content hash, so charts not yet
+    in the manifest (e.g. left out of a --only build) get their shell URL.
+    """
+    entry = manifest["charts"].get(name)
+    shell = shell_name(name) if entry is None else entry["shell"]
+    return f"{base_url}/{shell}"
@@ -0,0 +1,276 @@
+"""Content-addressed on-disk cache for simulation outputs."""
+
+import hashlib
+import json
+import os
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from .profiling import span
+
+# Bump when the on-disk layout or key derivation changes
+CACHE_FORMAT_VERSION = 2
+
+# Cache location and size cap, overridable from the environment
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("UTAH_SB60_CACHE_DIR", Path.home() / ".cache" / "utah-sb60")
+)
+DEFAULT_MAX_BYTES = int(os.environ.get("UTAH_SB60_CACHE_MAX_BYTES", 512 * 1024**2))
+
+_META_KEY = "__meta__"
+
+
+def cache_enabled() -> bool:
+    """Return False when UTAH_SB60_CACHE is set to 0/false/off."""
+    return os.environ.get("UTAH_SB60_CACHE", "1").lower() not in ("0", "false", "off")
+
+
+def _package_version(name: str) -> str:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def policyengine_us_version() -> str:
+    """Return the installed policyengine-us version, or "unknown"."""
+    return _package_version("policyengine-us")
+
+
+def policyengine_core_version() -> str:
+    """Return the installed policyengine-core version, or "unknown"."""
+    return _package_version("policyengine-core")
+
+
+def cache_key(kind: str, spec: dict, year: int) -> str:
+    """
+    Derive a content hash for a simulation output.
+
+    The key covers the reform and baseline parameter dicts, the tax year,
+    the caller's spec (e.g. the household situation with its axes) and the
+    installed policyengine-us and policyengine-core versions, so any change
+    to these invalidates old entries.
+
+    Args:
+        kind: Name of the computation (e.g. "household_sweep")
+        spec: JSON-serializable description of the inputs
+        year: Tax year simulated
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    from .reform import SB60_BASELINE_PARAMETERS, SB60_REFORM_PARAMETERS
+
+    payload = {
+        "format": CACHE_FORMAT_VERSION,
+        "kind": kind,
+        "year": year,
+        "spec": spec,
+        "reform": SB60_REFORM_PARAMETERS,
+        "baseline": SB60_BASELINE_PARAMETERS,
+        "policyengine_us": policyengine_us_version(),
+        "policyengine_core": policyengine_core_version(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _entry_path(key: str, cache_dir: Path) -> Path:
+    return Path(cache_dir) / f"{key}.npz"
+
+
+def load(key: str, cache_dir: Path = DEFAULT_CACHE_DIR) -> dict | None:
+    """
+    Load cached arrays for a key, marking the entry as recently used.
+
+    Returns:
+        Dict of array name to array, or None on a miss
+    """
+    path = _entry_path(key, cache_dir)
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files if name != _META_KEY}
+    except (FileNotFoundError, ValueError, OSError):
+        return None
+    # Access time drives LRU eviction; mtime is reliable even on noatime mounts
+    os.utime(path)
+    return arrays
+
+
+def save(
+    key: str,
+    arrays: dict,
+    meta: dict | None = None,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> Path:
+    """
+    Store arrays under a key, then evict least recently used entries so the
+    cache stays under max_bytes.
+
+    Returns:
+        Path of the written entry
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = _entry_path(key, cache_dir)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    meta = {**(meta or {}), "created": time.time()}
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays, **{_META_KEY: np.asarray(json.dumps(meta))})
+    os.replace(tmp_path, path)
+    evict(max_bytes, cache_dir)
+    return path
+
+
+def evict(
+    max_bytes: int = DEFAULT_MAX_BYTES, cache_dir: Path = DEFAULT_CACHE_DIR
+) -> int:
+    """
+    Remove least recently used entries until the cache fits in max_bytes.
+
+    Returns:
+        Number of entries removed
+    """
+    entries = sorted(
+        Path(cache_dir).glob("*.npz"), key=lambda path: path.stat().st_mtime
+    )
+    total = sum(path.stat().st_size for path in entries)
+    removed = 0
+    for path in entries:
+        if total <= max_bytes:
+            break
+        total -= path.stat().st_size
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def invalidate(key: str | None = None, cache_dir: Path = DEFAULT_CACHE_DIR) -> int:
+    """
+    Remove one entry, or every entry when key is None.
+
+    Returns:
+        Number of entries removed
+    """
+    paths = (
+        [_entry_path(key, cache_dir)]
+        if key is not None
+        else list(Path(cache_dir).glob("*.npz"))
+    )
+    removed = 0
+    for path in paths:
+        if path.exists():
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def inspect_cache(cache_dir: Path = DEFAULT_CACHE_DIR) -> list[dict]:
+    """
+    Describe cache entries, most recently used first.
+
+    Returns:
+        List of dicts with key, size_bytes, last_used, arrays and meta
+    """
+    entries = []
+    for path in Path(cache_dir).glob("*.npz"):
+        stat = path.stat()
+        with np.load(path, allow_pickle=False) as data:
+            arrays = [name for name in data.files if name != _META_KEY]
+            meta = json.loads(str(data[_META_KEY])) if _META_KEY in data.files else {}
+        entries.append(
+            {
+                "key": path.stem,
+                "size_bytes": stat.st_size,
+                "last_used": stat.st_mtime,
+                "arrays": arrays,
+                "meta": meta,
+            }
+        )
+    return sorted(entries, key=lambda entry: entry["last_used"], reverse=True)
+
+
+def cached_arrays(
+    kind: str,
+    spec: dict,
+    year: int,
+    compute: Callable[[], dict],
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> dict:
+    """
+    Return arrays for (kind, spec, year) from the cache, computing and
+    storing them on a miss.
+
+    Args:
+        kind: Name of the computation
+        spec: JSON-serializable description of the inputs
+        year: Tax year simulated
+        compute: Zero-argument function returning a dict of arrays
+        cache_dir: Cache directory
+
+    Returns:
+        Dict of array name to array
+    """
+    if not cache_enabled():
+        return compute()
+    arrays = lookup(kind, spec, year, cache_dir)
+    if arrays is None:
+        arrays = compute()
+        store(kind, spec, year, arrays, cache_dir)
+    return arrays
+
+
+def lookup(
+    kind: str, spec: dict, year: int, cache_dir: Path = DEFAULT_CACHE_DIR
+) -> dict | None:
+    """
+    Return cached arrays for (kind, spec, year), or None on a miss or when
+    caching is disabled.
+    """
+    if not cache_enabled():
+        return None
+    with span("cache lookup", kind=kind):
+        return load(cache_key(kind, spec, year), cache_dir)
+
+
+def store(
+    kind: str, spec: dict, year: int, arrays: dict, cache_dir: Path = DEFAULT_CACHE_DIR
+) -> None:
+    """Cache arrays computed for (kind, spec, year), unless caching is disabled."""
+    if not cache_enabled():
+        return
+    save(
+        cache_key(kind, spec, year),
+        arrays,
+        meta={
+            "kind": kind,
+            "year": year,
+            "policyengine_us": policyengine_us_version(),
+            "policyengine_core": policyengine_core_version(),
+        },
+        cache_dir=cache_dir,
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the SB60 cache.")
+    parser.add_argument("command", choices=["inspect", "clear"])
+    parser.add_argument("--key", help="Clear a single entry")
+    args = parser.parse_args()
+
+    if args.command == "inspect":
+        for entry in inspect_cache():
+            print(
+                f"{entry['key'][:12]}  {entry['size_bytes']:>10,}  "
+                f"{entry['meta'].get('kind', '?')}  {entry['meta'].get('year', '?')}  "
+                f"policyengine-us {entry['meta'].get('policyengine_us', '?')}"
+            )
+    else:
+        print(f"Removed {invalidate(args.key)} entries")
@@ -5,55 +5,52 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from .household import calculate_net_income_changes
-from .statewide import (
-    DECILES,
-    GAIN_MORE_THAN_5PCT,
-    GAIN_LESS_THAN_5PCT,
-    NO_CHANGE,
-    LOSS_LESS_THAN_5PCT,
-    LOSS_MORE_THAN_5PCT,
-    ALL_GAIN_MORE_THAN_5PCT,
-    ALL_GAIN_LESS_THAN_5PCT,
-    ALL_NO_CHANGE,
-    ALL_LOSS_LESS_THAN_5PCT,
-    ALL_LOSS_MORE_THAN_5PCT,
-    AVG_IMPACT_BY_DECILE,
+from .household import (
+    GRID_CHILDREN,
+    GRID_HOUSEHOLD_STRUCTURES,
+    simulate_net_income_change_grid,
+    simulate_net_income_changes,
+)
+from .payload import reduce_piecewise_linear
+from .profiling import traced
+from .statewide import published_impacts
+from .theme import (
+    BLACK,
+    FONT_FAMILY,
+    GRAY_200,
+    GRAY_400,
+    GRAY_600,
+    HOUSEHOLD_GRID_STEP,
+    HOUSEHOLD_TYPE_LABELS,
+    NET_INCOME_CHANGE_TOLERANCE,
+    PRIMARY_500,
+    PRIMARY_700,
+    PRIMARY_ALPHA_60,
+    WATERMARK_CONFIG,
 )
-
-# PolicyEngine app-v2 color palette - matching WinnersLosersIncomeDecileSubPage.tsx
-BLACK = "#000000"
-
-# Primary teal colors
-PRIMARY_500 = "#319795"  # colors.primary[500] - main brand color
-PRIMARY_700 = "#285E61"  # colors.primary[700] - dark teal for gains >5%
-PRIMARY_ALPHA_60 = "rgba(49, 151, 149, 0.6)"  # colors.primary.alpha[60] - teal with 60% opacity
-
-# Gray scale
-GRAY_200 = "#E5E7EB"  # colors.gray[200] - no change
-GRAY_400 = "#9CA3AF"  # colors.gray[400] - loss <5%
-GRAY_600 = "#4B5563"  # colors.gray[600] - loss >5%
-
-# Chart watermark configuration
-WATERMARK_CONFIG = {
-    "source": "https://policyengine.github.io/utah-sb60-calc/assets/teal-square-transparent.png",
-    "xref": "paper",
-    "yref": "paper",
-    "sizex": 0.07,
-    "sizey": 0.07,
-    "xanchor": "right",
-    "yanchor": "bottom",
-}
 
 
-def create_net_income_change_chart() -> go.Figure:
+@traced()
+def create_net_income_change_chart(curve: tuple | None = None) -> go.Figure:
     """
     Create Figure 1: Change in net income for a single adult.
 
+    The curve is simulated with PolicyEngine-US under ut_sb60_reform, then
+    reduced to the kink points of the piecewise-linear change.
+
+    Args:
+        curve: (employment_income_values, net_income_changes); defaults to
+            simulate_net_income_changes reduced at NET_INCOME_CHANGE_TOLERANCE.
+            Pass household.sample_net_income_changes() to sample adaptively
+
     Returns:
         Plotly figure object
     """
-    employment_income_values, net_income_changes = calculate_net_income_changes()
+    employment_income_values, net_income_changes = curve or (
+        reduce_piecewise_linear(
+            *simulate_net_income_changes(), tolerance=NET_INCOME_CHANGE_TOLERANCE
+        )
+    )
 
     df = pd.DataFrame(
         {
@@ -62,71 +59,81 @@ def create_net_income_change_chart() -> go.Figure:
         }
     )
 
-    fig = px.line(
-        df,
-        x="Employment Income",
-        y="Change in net income",
-        color_discrete_sequence=[PRIMARY_500],
-        title="Figure 1: Change in net income for a single adult",
-    ).update_layout(
-        font=dict(family="Roboto Serif"),
-        xaxis=dict(
-            title=dict(text="Employment income"),
-            tickformat=",",
-            tickprefix="$",
-            fixedrange=True,
-        ),
-        yaxis=dict(
-            title=dict(text="Change in net income"),
-            tickformat=",",
-            tickprefix="$",
-            fixedrange=True,
-        ),
-        font_color=BLACK,
-        margin={"l": 60, "r": 60, "b": 80, "t": 80, "pad": 4},
-        showlegend=False,
-        images=[
-            {
-                **WATERMARK_CONFIG,
-                "x": 1.05,
-                "y": -0.18,
-            }
-        ],
-    ).update_traces(
-        hovertemplate="Employment income: $%{x:,}<br>Change in net income: $%{y:.2f}<extra></extra>"
+    fig = (
+        px.line(
+            df,
+            x="Employment Income",
+            y="Change in net income",
+            color_discrete_sequence=[PRIMARY_500],
+            title="Figure 1: Change in net income for a single adult",
+        )
+        .update_layout(
+            font=dict(family=FONT_FAMILY),
+            xaxis=dict(
+                title=dict(text="Employment income"),
+                tickformat=",",
+                tickprefix="$",
+                fixedrange=True,
+            ),
+            yaxis=dict(
+                title=dict(text="Change in net income"),
+                tickformat=",",
+                tickprefix="$",
+                fixedrange=True,
+            ),
+            font_color=BLACK,
+            margin={"l": 60, "r": 60, "b": 80, "t": 80, "pad": 4},
+            showlegend=False,
+            images=[
+                {
+                    **WATERMARK_CONFIG,
+                    "x": 1.05,
+                    "y": -0.18,
+                }
+            ],
+        )
+        .update_traces(
+            hovertemplate="Employment income: $%{x:,}<br>Change in net income: $%{y:.2f}<extra></extra>"
+        )
     )
 
     return fig
 
 
-def create_winners_by_decile_chart() -> go.Figure:
+@traced()
+def create_winners_by_decile_chart(impacts: dict | None = None) -> go.Figure:
     """
     Create Figure 2: Winners of Utah SB60 by income decile.
 
+    Args:
+        impacts: Statewide results keyed by statewide.py constant name;
+            defaults to the published results
+
     Returns:
         Plotly figure object
     """
-    labels_deciles = [f"{i}" for i in DECILES]
+    impacts = impacts or published_impacts()
+    labels_deciles = [f"{i}" for i in impacts["DECILES"]]
 
     df_deciles = pd.DataFrame(
         {
             "Income decile": labels_deciles,
-            "Gain more than 5%": GAIN_MORE_THAN_5PCT,
-            "Gain less than 5%": GAIN_LESS_THAN_5PCT,
-            "No change": NO_CHANGE,
-            "Lose less than 5%": LOSS_LESS_THAN_5PCT,
-            "Lose more than 5%": LOSS_MORE_THAN_5PCT,
+            "Gain more than 5%": impacts["GAIN_MORE_THAN_5PCT"],
+            "Gain less than 5%": impacts["GAIN_LESS_THAN_5PCT"],
+            "No change": impacts["NO_CHANGE"],
+            "Lose less than 5%": impacts["LOSS_LESS_THAN_5PCT"],
+            "Lose more than 5%": impacts["LOSS_MORE_THAN_5PCT"],
         }
     )
 
     df_all = pd.DataFrame(
         {
             "Income decile": ["All"],
-            "Gain more than 5%": [ALL_GAIN_MORE_THAN_5PCT],
-            "Gain less than 5%": [ALL_GAIN_LESS_THAN_5PCT],
-            "No change": [ALL_NO_CHANGE],
-            "Lose less than 5%": [ALL_LOSS_LESS_THAN_5PCT],
-            "Lose more than 5%": [ALL_LOSS_MORE_THAN_5PCT],
+            "Gain more than 5%": [impacts["ALL_GAIN_MORE_THAN_5PCT"]],
+            "Gain less than 5%": [impacts["ALL_GAIN_LESS_THAN_5PCT"]],
+            "No change": [impacts["ALL_NO_CHANGE"]],
+            "Lose less than 5%": [impacts["ALL_LOSS_LESS_THAN_5PCT"]],
+            "Lose more than 5%": [impacts["ALL_LOSS_MORE_THAN_5PCT"]],
         }
     )
 
@@ -147,22 +154,34 @@ def create_winners_by_decile_chart() -> go.Figure:
 
     # Add traces for "All" category - first row
     _add_stacked_bar_traces(
-        fig, df_all, COLOR_GAIN_MORE, COLOR_GAIN_LESS,
-        COLOR_NO_CHANGE, COLOR_LOSS_LESS, COLOR_LOSS_MORE,
-        row=1, show_legend=True
+        fig,
+        df_all,
+        COLOR_GAIN_MORE,
+        COLOR_GAIN_LESS,
+        COLOR_NO_CHANGE,
+        COLOR_LOSS_LESS,
+        COLOR_LOSS_MORE,
+        row=1,
+        show_legend=True,
     )
 
     # Add traces for deciles - second row
     _add_stacked_bar_traces(
-        fig, df_deciles, COLOR_GAIN_MORE, COLOR_GAIN_LESS,
-        COLOR_NO_CHANGE, COLOR_LOSS_LESS, COLOR_LOSS_MORE,
-        row=2, show_legend=False
+        fig,
+        df_deciles,
+        COLOR_GAIN_MORE,
+        COLOR_GAIN_LESS,
+        COLOR_NO_CHANGE,
+        COLOR_LOSS_LESS,
+        COLOR_LOSS_MORE,
+        row=2,
+        show_legend=False,
     )
 
     fig.update_layout(
         barmode="stack",
         title=dict(text="Figure 2: Winners of Utah SB60 by income decile", x=0),
-        font=dict(family="Roboto Serif"),
+        font=dict(family=FONT_FAMILY),
         xaxis=dict(
             title=dict(text=""),
             ticksuffix="%",
@@ -261,21 +280,31 @@ def _add_stacked_bar_traces(
         )
 
 
-def create_avg_benefit_by_decile_chart() -> go.Figure:
+@traced()
+def create_avg_benefit_by_decile_chart(
+    impacts: dict | None = None, intervals: dict | None = None
+) -> go.Figure:
     """
     Create Figure 3: Average benefit of Utah SB60 by income decile.
 
+    Args:
+        impacts: Statewide results keyed by statewide.py constant name;
+            defaults to the published results
+        intervals: Confidence intervals from uncertainty.confidence_intervals;
+            when given, drawn as error bars around each decile's bar
+
     Returns:
         Plotly figure object
     """
+    impacts = impacts or published_impacts()
     df = pd.DataFrame(
         {
-            "Income decile": DECILES,
-            "Average impact": AVG_IMPACT_BY_DECILE,
+            "Income decile": impacts["DECILES"],
+            "Average impact": impacts["AVG_IMPACT_BY_DECILE"],
         }
     )
 
-    dollar_text = [f"${x}" for x in AVG_IMPACT_BY_DECILE]
+    dollar_text = [f"${x}" for x in impacts["AVG_IMPACT_BY_DECILE"]]
 
     fig = (
         px.bar(
@@ -287,7 +316,7 @@ def create_avg_benefit_by_decile_chart() -> go.Figure:
             title="Figure 3: Average benefit of Utah SB60 by income decile",
         )
         .update_layout(
-            font=dict(family="Roboto Serif"),
+            font=dict(family=FONT_FAMILY),
             xaxis=dict(
                 title=dict(text="Income decile"),
                 tickvals=list(range(1, 11)),
@@ -315,4 +344,173 @@ def create_avg_benefit_by_decile_chart() -> go.Figure:
         )
     )
 
+    if intervals is not None:
+        interval = intervals["AVG_IMPACT_BY_DECILE"]
+        values = impacts["AVG_IMPACT_BY_DECILE"]
+        fig.update_traces(
+            error_y=dict(
+                type="data",
+                symmetric=False,
+                array=[
+                    max(high - value, 0)
+                    for high, value in zip(interval["high"], values)
+                ],
+                arrayminus=[
+                    max(value - low, 0) for low, value in zip(interval["low"], values)
+                ],
+                color=GRAY_600,
+                thickness=1.5,
+            ),
+            hovertemplate=(
+                "Income decile: %{x}<br>Average impact: $%{y:,.0f}"
+                "<br>Interval: $%{customdata[0]:,.0f} to $%{customdata[1]:,.0f}<extra></extra>"
+            ),
+            customdata=list(zip(interval["low"], interval["high"])),
+        )
+
+    return fig
+
+
+@traced()
+def create_net_income_change_heatmap(
+    grid: tuple | None = None,
+    household_types: tuple[str, ...] = GRID_HOUSEHOLD_STRUCTURES,
+    children: tuple[int, ...] = GRID_CHILDREN,
+) -> go.Figure:
+    """
+    Create a heatmap of the change in net income by household type, number
+    of children and earnings, one panel per household type.
+
+    Args:
+        grid: (employment_income_values, net_income_changes) shaped
+            (household type, children, income); defaults to
+            simulate_net_income_change_grid over household_types and children
+        household_types: Household structures or filing statuses along the
+            first grid axis
+        children: Numbers of children along the second grid axis
+
+    Returns:
+        Plotly figure object
+    """
+    employment_income_values, net_income_changes = grid or (
+        simulate_net_income_change_grid(
+            household_types, children, step=HOUSEHOLD_GRID_STEP
+        )
+    )
+
+    fig = make_subplots(
+        rows=len(household_types),
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.08,
+        subplot_titles=[HOUSEHOLD_TYPE_LABELS.get(t, t) for t in household_types],
+    )
+    for index, changes in enumerate(net_income_changes):
+        fig.add_trace(
+            go.Heatmap(
+                x=employment_income_values,
+                y=children,
+                z=changes,
+                coloraxis="coloraxis",
+                hovertemplate=(
+                    "Employment income: $%{x:,}<br>Children: %{y}<br>"
+                    "Change in net income: $%{z:.2f}<extra></extra>"
+                ),
+            ),
+            row=index + 1,
+            col=1,
+        )
+        fig.update_yaxes(
+            title=dict(text="Children"),
+            tickvals=children,
+            fixedrange=True,
+            row=index + 1,
+            col=1,
+        )
+    fig.update_xaxes(tickformat=",", tickprefix="$", fixedrange=True)
+    fig.update_xaxes(
+        title=dict(text="Employment income"), row=len(household_types), col=1
+    )
+
+    fig.update_layout(
+        title=dict(text="Change in net income by household type", x=0),
+        font=dict(family=FONT_FAMILY),
+        font_color=BLACK,
+        coloraxis=dict(
+            colorscale=[[0, GRAY_200], [0.5, PRIMARY_500], [1, PRIMARY_700]],
+            colorbar=dict(title=dict(text="Change"), tickprefix="$"),
+        ),
+        margin={"l": 60, "r": 60, "b": 100, "t": 100, "pad": 4},
+        height=200 * len(household_types) + 200,
+        images=[
+            {
+                **WATERMARK_CONFIG,
+                "x": 1.05,
+                "y": -0.18,
+            }
+        ],
+    )
+
+    return fig
+
+
+@traced()
+def create_budget_window_chart(projection: pd.DataFrame) -> go.Figure:
+    """
+    Create a chart of SB60's revenue impact in each year of a budget window,
+    with the cumulative impact as a line.
+
+    Args:
+        projection: Table from projection.project_statewide_impacts, indexed
+            by year
+
+    Returns:
+        Plotly figure object
+    """
+    years = list(projection.index)
+    revenue = projection["revenue_impact_millions"]
+    cumulative = revenue.cumsum()
+
+    fig = go.Figure(
+        [
+            go.Bar(
+                x=years,
+                y=revenue,
+                name="Annual",
+                marker_color=PRIMARY_500,
+                text=[f"${x:,.0f}M" for x in revenue],
+                hovertemplate="Year: %{x}<br>Revenue impact: $%{y:,.1f}M<extra></extra>",
+            ),
+            go.Scatter(
+                x=years,
+                y=cumulative,
+                name="Cumulative",
+                mode="lines+markers",
+                line=dict(color=PRIMARY_700),
+                hovertemplate="Year: %{x}<br>Cumulative impact: $%{y:,.1f}M<extra></extra>",
+            ),
+        ]
+    )
+    fig.update_layout(
+        title=dict(text=f"Revenue impact of Utah SB60, {years[0]}-{years[-1]}", x=0),
+        font=dict(family=FONT_FAMILY),
+        font_color=BLACK,
+        xaxis=dict(title=dict(text="Year"), tickvals=years, fixedrange=True),
+        yaxis=dict(
+            title=dict(text="Change in state revenue (millions)"),
+            tickformat=",",
+            tickprefix="$",
+            fixedrange=True,
+        ),
+        legend=dict(orientation="h", yanchor="bottom", y=1.0, x=0),
+        margin={"l": 60, "r": 60, "b": 80, "t": 100, "pad": 4},
+        images=[
+            {
+                **WATERMARK_CONFIG,
+                "x": 1.05,
+                "y": -0.18,
+            }
+        ],
+    )
+
     return fig
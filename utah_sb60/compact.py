@@ -0,0 +1,297 @@
+"""Compact statewide runs with a memory report.
+
+Compact mode keeps household results in the narrowest dtype that holds them
+exactly enough (microdata.COMPACT_DTYPES). PolicyEngine-US calculates net
+income and weights in float32, so float32 loses nothing there; head counts
+fit in int16. A dollar column that would round by more than a cent, or a
+weight by more than COMPACT_WEIGHT_RTOL, stays float64.
+Only the variables the statewide metrics use are calculated. Each variable
+is cut to Utah households as soon as it is calculated, and each
+simulation is freed before the next one loads. Aggregation widens one chunk
+at a time back to float64.
+
+A MemoryReport records resident memory after each stage. It is a report,
+not a limit: stages are not interrupted, and a run whose peak went over
+the budget is flagged once it has finished.
+
+Usage:
+    python -m utah_sb60.compact --year 2026 --budget-mb 8000   # memory report
+    python -m utah_sb60.compact --check     # compare with the float64 run
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from .microdata import (
+    DEFAULT_CHUNK_SIZE,
+    aggregate_household_results,
+    combine_scenarios,
+    load_household_results,
+    simulate_scenario,
+)
+from .profiling import process_peak_rss_mb, span
+from .reform import SB60_BASELINE_PARAMETERS, SB60_REFORM_PARAMETERS
+
+# Largest accepted difference from the float64 run: one step of each
+# metric's published rounding
+DEFAULT_TOLERANCE = 0.1
+METRIC_TOLERANCES = {
+    "AVG_IMPACT_BY_DECILE": 1,
+    "AVG_BENEFIT_PER_HOUSEHOLD": 1,
+    "GINI_IMPACT_PCT": 0.01,
+}
+
+
+def memory_budget_mb() -> float | None:
+    """
+    Peak resident memory in MiB set by UTAH_SB60_MEMORY_BUDGET_MB, or None
+    when it is unset or 0.
+
+    Raises:
+        ValueError: If the variable is not a non-negative number
+    """
+    value = os.environ.get("UTAH_SB60_MEMORY_BUDGET_MB", "")
+    try:
+        budget_mb = float(value or 0)
+        if not budget_mb >= 0:
+            raise ValueError
+    except ValueError:
+        raise ValueError(
+            f"UTAH_SB60_MEMORY_BUDGET_MB must be a non-negative number of MiB, "
+            f"not {value!r}"
+        ) from None
+    return budget_mb or None
+
+
+def _current_rss_mb() -> float | None:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024**2
+
+
+class MemoryReport:
+    """
+    Resident memory recorded after each stage, compared with a budget.
+
+    Peak memory is the process's high-water mark, read between stages, so
+    a stage that goes over the budget still runs to completion; the report
+    shows which stage it was.
+
+    Args:
+        budget_mb: Peak resident memory in MiB to report against; None
+            only records checkpoints
+    """
+
+    def __init__(self, budget_mb: float | None = None):
+        self.budget_mb = budget_mb
+        self.checkpoints = []
+
+    def record(self, stage: str) -> dict:
+        """Record current and peak memory after a stage."""
+        checkpoint = {
+            "stage": stage,
+            "rss_mb": _current_rss_mb(),
+            "process_peak_rss_mb": process_peak_rss_mb(),
+        }
+        self.checkpoints.append(checkpoint)
+        return checkpoint
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether the peak recorded so far is over the budget."""
+        peaks = [c["process_peak_rss_mb"] or 0 for c in self.checkpoints]
+        return self.budget_mb is not None and max(peaks, default=0) > self.budget_mb
+
+    def format_report(self) -> str:
+        """One line per checkpoint with current and peak memory."""
+
+        def mb(value: float | None) -> str:
+            return "n/a" if value is None else f"{value:,.0f} MiB"
+
+        lines = [f"{'stage':<24} {'rss':>12} {'peak':>12}"]
+        for checkpoint in self.checkpoints:
+            lines.append(
+                f"{checkpoint['stage']:<24} {mb(checkpoint['rss_mb']):>12} "
+                f"{mb(checkpoint['process_peak_rss_mb']):>12}"
+            )
+        if self.budget_mb is not None:
+            lines.append(f"{'budget':<24} {'':>12} {mb(self.budget_mb):>12}")
+            if self.over_budget:
+                lines.append("Peak memory went over the budget")
+        return "\n".join(lines)
+
+
+def table_nbytes(results: dict) -> int:
+    """Bytes held by a dict of household-level arrays."""
+    return sum(np.asarray(values).nbytes for values in results.values())
+
+
+def compact_household_results(
+    year: int = 2026,
+    dataset: str | None = None,
+    prune: bool = True,
+    report: MemoryReport | None = None,
+) -> dict:
+    """
+    load_household_results in compact mode, recording memory after each
+    simulation.
+
+    Args:
+        year: Tax year to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        prune: Simulate the reform only for affected households (pruning.py)
+        report: Memory report to record in; defaults to MemoryReport()
+
+    Returns:
+        Dict of household-level arrays as load_household_results returns,
+        in COMPACT_DTYPES
+    """
+    report = report if report is not None else MemoryReport()
+    if prune:
+        results = load_household_results(year, dataset, prune=True, compact=True)
+        report.record("simulate scenarios")
+        return results
+    baseline = simulate_scenario(SB60_BASELINE_PARAMETERS, year, dataset, compact=True)
+    report.record("simulate baseline")
+    reform = simulate_scenario(SB60_REFORM_PARAMETERS, year, dataset, compact=True)
+    report.record("simulate reform")
+    return combine_scenarios(baseline, reform)
+
+
+def compact_statewide_impacts(
+    year: int = 2026,
+    dataset: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    prune: bool = True,
+    report: MemoryReport | None = None,
+) -> dict:
+    """
+    Compute the statewide.py metrics in compact mode, recording memory
+    after each stage.
+
+    Args:
+        year: Tax year to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        chunk_size: Rows aggregated per chunk
+        prune: Simulate the reform only for affected households (pruning.py)
+        report: Memory report to record in; defaults to MemoryReport()
+
+    Returns:
+        Dict keyed by the statewide.py constant names
+    """
+    report = report if report is not None else MemoryReport()
+    report.record("start")
+    results = compact_household_results(year, dataset, prune, report)
+    with span("aggregate compact results", bytes=table_nbytes(results)):
+        impacts = aggregate_household_results(results, chunk_size)
+    del results
+    report.record("aggregate")
+    return impacts
+
+
+def check_tolerance(
+    year: int = 2026,
+    dataset: str | None = None,
+    prune: bool = True,
+    tolerances: dict | None = None,
+) -> dict:
+    """
+    Compare compact-mode metrics with the float64 run.
+
+    Args:
+        year: Tax year to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        prune: Use affected-household pruning in both runs
+        tolerances: Metric name -> largest accepted absolute difference;
+            defaults to METRIC_TOLERANCES, then DEFAULT_TOLERANCE
+
+    Returns:
+        Dict with "max_abs_diff" per metric, "bytes" of the compact and
+        float64 household tables and "passed"
+    """
+    tolerances = {**METRIC_TOLERANCES, **(tolerances or {})}
+    compact = compact_household_results(year, dataset, prune)
+    full = load_household_results(year, dataset, prune=prune)
+    compact_impacts = aggregate_household_results(compact)
+    full_impacts = aggregate_household_results(full)
+    differences = {
+        metric: float(
+            np.max(
+                np.abs(
+                    np.asarray(compact_impacts[metric], dtype=np.float64)
+                    - np.asarray(full_impacts[metric], dtype=np.float64)
+                ),
+                initial=0.0,
+            )
+        )
+        for metric in full_impacts
+    }
+    return {
+        "max_abs_diff": differences,
+        "bytes": {"compact": table_nbytes(compact), "float64": table_nbytes(full)},
+        "passed": all(
+            difference <= tolerances.get(metric, DEFAULT_TOLERANCE)
+            for metric, difference in differences.items()
+        ),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compute SB60 statewide metrics in compact mode."
+    )
+    parser.add_argument("--year", type=int, default=2026)
+    parser.add_argument("--dataset", help="PolicyEngine-US dataset to simulate")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--budget-mb",
+        type=float,
+        help=(
+            "Report peak memory against this budget in MiB, exiting 1 if the "
+            "run went over (default: $UTAH_SB60_MEMORY_BUDGET_MB)"
+        ),
+    )
+    parser.add_argument(
+        "--no-prune",
+        action="store_true",
+        help="Simulate the reform for every household",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Compare with the float64 run"
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        report = check_tolerance(args.year, args.dataset, prune=not args.no_prune)
+        for metric, difference in report["max_abs_diff"].items():
+            print(f"{metric:<28} max abs diff {difference:.3g}")
+        print(
+            f"Household table: {report['bytes']['compact']:,} bytes compact, "
+            f"{report['bytes']['float64']:,} bytes float64"
+        )
+        print("PASS" if report["passed"] else "FAIL")
+        return 0 if report["passed"] else 1
+
+    budget_mb = args.budget_mb
+    if budget_mb is None:
+        try:
+            budget_mb = memory_budget_mb()
+        except ValueError as error:
+            parser.error(str(error))
+    report = MemoryReport(budget_mb)
+    impacts = compact_statewide_impacts(
+        args.year, args.dataset, args.chunk_size, not args.no_prune, report
+    )
+    print(json.dumps(impacts, indent=2))
+    print(report.format_report())
+    return 1 if report.over_budget else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
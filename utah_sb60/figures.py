@@ -0,0 +1,454 @@
+"""Fast figure specs for Utah SB60 charts, built without Plotly.
+
+Each function here returns the same {"data", "layout"} spec that the
+matching charts.py figure's to_plotly_json() gives, as plain dicts and NumPy
+arrays drawn from the shared theme. Plotly's property validation is skipped,
+so a spec costs well under a millisecond instead of tens to hundreds of
+milliseconds per figure; pass it to payload.figure_payload like a figure.
+
+generate_post.py publishes charts from these specs; charts.py keeps the
+Plotly figures for interactive use. Keep the two in step:
+tests/test_figures.py compares every builder against its Plotly figure
+under the installed Plotly, with typed arrays compared by value.
+"""
+
+from functools import lru_cache
+from importlib.metadata import version
+
+import numpy as np
+
+from .statewide import published_impacts
+from .theme import (
+    BLACK,
+    FONT_FAMILY,
+    GRAY_200,
+    GRAY_400,
+    GRAY_600,
+    HOUSEHOLD_TYPE_LABELS,
+    PRIMARY_500,
+    PRIMARY_700,
+    PRIMARY_ALPHA_60,
+    plotly_template,
+    watermark,
+)
+
+# Stacked bar categories for Figure 2: impacts key suffix, legend name,
+# legend group, bar color and text color
+WINNER_CATEGORIES = [
+    ("GAIN_MORE_THAN_5PCT", "Gain >5%", "gain_more_than_5%", PRIMARY_700, None),
+    ("GAIN_LESS_THAN_5PCT", "Gain <5%", "gain_less_than_5%", PRIMARY_ALPHA_60, BLACK),
+    ("NO_CHANGE", "No change", "no_change", GRAY_200, BLACK),
+    ("LOSS_LESS_THAN_5PCT", "Loss <5%", "lose_less_than_5%", GRAY_400, None),
+    ("LOSS_MORE_THAN_5PCT", "Loss >5%", "lose_more_than_5%", GRAY_600, None),
+]
+
+
+def _font() -> dict:
+    return {"family": FONT_FAMILY, "color": BLACK}
+
+
+def _dollar_axis(title: str) -> dict:
+    return {
+        "title": {"text": title},
+        "tickformat": ",",
+        "tickprefix": "$",
+        "fixedrange": True,
+    }
+
+
+@lru_cache(maxsize=1)
+def _px_bar_groups() -> dict:
+    """Bar group keys plotly.express sets on its bars before Plotly 6."""
+    if int(version("plotly").split(".")[0]) < 6:
+        return {"alignmentgroup": "True", "offsetgroup": ""}
+    return {}
+
+
+def _spec(data: list[dict], layout: dict) -> dict:
+    return {"data": data, "layout": {**layout, "template": plotly_template()}}
+
+
+def _row_domains(
+    rows: int, vertical_spacing: float, row_heights: list[float] | None = None
+) -> list[list[float]]:
+    """
+    y domains of a one-column make_subplots grid, top row first, computed
+    the way Plotly does.
+    """
+    if row_heights is None:
+        heights = [(1.0 - vertical_spacing * (rows - 1)) / rows] * rows
+    else:
+        total = float(sum(row_heights))
+        heights = [
+            (1.0 - vertical_spacing * (rows - 1)) * (height / total)
+            for height in reversed(row_heights)
+        ]
+
+    def clip(value: float) -> float:
+        if -0.01 < value < 0:
+            return 0.0
+        if 1 < value < 1.01:
+            return 1.0
+        return value
+
+    domains = []
+    for row in range(rows):
+        below = rows - 1 - row
+        start = sum(heights[:below]) + below * vertical_spacing
+        domains.append([clip(start), clip(start + heights[below])])
+    return domains
+
+
+def _shared_x_axes(rows: int, domains: list[list[float]]) -> dict:
+    """Layout axes of a one-column make_subplots grid with shared_xaxes."""
+    layout = {}
+    for row in range(1, rows + 1):
+        suffix = "" if row == 1 else str(row)
+        xaxis = {"anchor": f"y{suffix}", "domain": [0.0, 1.0]}
+        if row < rows:
+            xaxis.update(matches=f"x{rows}", showticklabels=False)
+        layout[f"xaxis{suffix}"] = xaxis
+        layout[f"yaxis{suffix}"] = {"anchor": f"x{suffix}", "domain": domains[row - 1]}
+    return layout
+
+
+def net_income_change_figure(
+    employment_income_values: np.ndarray, net_income_changes: np.ndarray
+) -> dict:
+    """
+    Figure 1 spec, as charts.create_net_income_change_chart((values, changes)).
+
+    Args:
+        employment_income_values: Employment incomes along the curve
+        net_income_changes: Change in net income at each income
+
+    Returns:
+        Figure spec dict with "data" and "layout"
+    """
+    trace = {
+        "hovertemplate": (
+            "Employment income: $%{x:,}<br>"
+            "Change in net income: $%{y:.2f}<extra></extra>"
+        ),
+        "legendgroup": "",
+        "line": {"color": PRIMARY_500, "dash": "solid"},
+        "marker": {"symbol": "circle"},
+        "mode": "lines",
+        "name": "",
+        "orientation": "v",
+        "showlegend": False,
+        "x": np.asarray(employment_income_values),
+        "xaxis": "x",
+        "y": np.asarray(net_income_changes),
+        "yaxis": "y",
+        "type": "scatter",
+    }
+    layout = {
+        "xaxis": {
+            "anchor": "y",
+            "domain": [0.0, 1.0],
+            **_dollar_axis("Employment income"),
+        },
+        "yaxis": {
+            "anchor": "x",
+            "domain": [0.0, 1.0],
+            **_dollar_axis("Change in net income"),
+        },
+        "legend": {"tracegroupgap": 0},
+        "title": {"text": "Figure 1: Change in net income for a single adult"},
+        "font": _font(),
+        "margin": {"l": 60, "r": 60, "b": 80, "t": 80, "pad": 4},
+        "showlegend": False,
+        "images": [watermark(1.05, -0.18)],
+    }
+    return _spec([trace], layout)
+
+
+def winners_by_decile_figure(impacts: dict | None = None) -> dict:
+    """
+    Figure 2 spec, as charts.create_winners_by_decile_chart(impacts).
+
+    Args:
+        impacts: Statewide results keyed by statewide.py constant name;
+            defaults to the published results
+
+    Returns:
+        Figure spec dict with "data" and "layout"
+    """
+    impacts = impacts or published_impacts()
+    rows = [
+        ("x", "y", ["All"], "ALL_", True),
+        ("x2", "y2", [f"{i}" for i in impacts["DECILES"]], "", False),
+    ]
+    data = []
+    for xaxis, yaxis, labels, prefix, show_legend in rows:
+        for key, name, group, color, text_color in WINNER_CATEGORIES:
+            shares = impacts[prefix + key]
+            shares = np.asarray([shares] if prefix else shares)
+            trace = {
+                "hovertemplate": "%{x:.1f}%<extra></extra>",
+                "legendgroup": group,
+                "marker": {"color": color},
+                "name": name,
+                "orientation": "h",
+                "showlegend": show_legend,
+                "text": [f"{x:.0f}%" if x > 0 else "" for x in shares],
+                "textangle": 0,
+            }
+            if text_color:
+                trace["textfont"] = {"color": text_color}
+            trace.update(
+                textposition="inside",
+                x=shares,
+                y=np.asarray(labels, dtype=object),
+                type="bar",
+                xaxis=xaxis,
+                yaxis=yaxis,
+            )
+            data.append(trace)
+
+    layout = _shared_x_axes(2, _row_domains(2, 0.02, [0.1, 0.9]))
+    layout["xaxis"].update(
+        title={"text": ""},
+        ticksuffix="%",
+        range=[0, 100],
+        showgrid=False,
+        fixedrange=True,
+    )
+    layout["yaxis"].update(title={"text": ""}, tickvals=["All"])
+    layout["xaxis2"].update(
+        title={"text": "Population share"},
+        ticksuffix="%",
+        range=[0, 100],
+        fixedrange=True,
+    )
+    layout["yaxis2"].update(title={"text": "Income decile"}, automargin=True)
+    layout.update(
+        title={"text": "Figure 2: Winners of Utah SB60 by income decile", "x": 0},
+        font=_font(),
+        legend={
+            "title": {"text": ""},
+            "font": {"size": 10},
+            "orientation": "h",
+            "yanchor": "bottom",
+            "y": 1.08,
+            "xanchor": "center",
+            "x": 0.5,
+            "traceorder": "normal",
+        },
+        margin={"l": 60, "r": 60, "b": 100, "t": 120, "pad": 4},
+        uniformtext={"mode": "hide", "minsize": 8},
+        barmode="stack",
+        height=580,
+        width=800,
+        images=[watermark(1.05, -0.20)],
+    )
+    return _spec(data, layout)
+
+
+def avg_benefit_by_decile_figure(
+    impacts: dict | None = None, intervals: dict | None = None
+) -> dict:
+    """
+    Figure 3 spec, as charts.create_avg_benefit_by_decile_chart(impacts,
+    intervals).
+
+    Args:
+        impacts: Statewide results keyed by statewide.py constant name;
+            defaults to the published results
+        intervals: Confidence intervals from uncertainty.confidence_intervals;
+            when given, drawn as error bars around each decile's bar
+
+    Returns:
+        Figure spec dict with "data" and "layout"
+    """
+    impacts = impacts or published_impacts()
+    values = impacts["AVG_IMPACT_BY_DECILE"]
+    trace = {
+        **_px_bar_groups(),
+        "hovertemplate": (
+            "Income decile: %{x}<br>Average impact: $%{y:,.0f}<extra></extra>"
+        ),
+        "legendgroup": "",
+        "marker": {"color": PRIMARY_500, "pattern": {"shape": ""}},
+        "name": "",
+        "orientation": "v",
+        "showlegend": False,
+        "text": np.asarray([f"${x}" for x in values], dtype=object),
+        "textposition": "auto",
+        "x": np.asarray(impacts["DECILES"]),
+        "xaxis": "x",
+        "y": np.asarray(values),
+        "yaxis": "y",
+        "type": "bar",
+    }
+    if intervals is not None:
+        interval = intervals["AVG_IMPACT_BY_DECILE"]
+        trace.update(
+            hovertemplate=(
+                "Income decile: %{x}<br>Average impact: $%{y:,.0f}"
+                "<br>Interval: $%{customdata[0]:,.0f} to "
+                "$%{customdata[1]:,.0f}<extra></extra>"
+            ),
+            error_y={
+                "array": [
+                    max(high - value, 0)
+                    for high, value in zip(interval["high"], values)
+                ],
+                "arrayminus": [
+                    max(value - low, 0) for low, value in zip(interval["low"], values)
+                ],
+                "color": GRAY_600,
+                "symmetric": False,
+                "thickness": 1.5,
+                "type": "data",
+            },
+            customdata=[list(pair) for pair in zip(interval["low"], interval["high"])],
+        )
+
+    layout = {
+        "xaxis": {
+            "anchor": "y",
+            "domain": [0.0, 1.0],
+            "title": {"text": "Income decile"},
+            "tickvals": list(range(1, 11)),
+            "fixedrange": True,
+        },
+        "yaxis": {
+            "anchor": "x",
+            "domain": [0.0, 1.0],
+            **_dollar_axis("Absolute change in household income"),
+        },
+        "legend": {"tracegroupgap": 0},
+        "title": {"text": "Figure 3: Average benefit of Utah SB60 by income decile"},
+        "barmode": "relative",
+        "font": _font(),
+        "margin": {"l": 60, "r": 60, "b": 80, "t": 80, "pad": 4},
+        "showlegend": False,
+        "images": [watermark(1.05, -0.18)],
+    }
+    return _spec([trace], layout)
+
+
+def net_income_change_heatmap_figure(
+    grid: tuple, household_types: tuple[str, ...], children: tuple[int, ...]
+) -> dict:
+    """
+    Household-type heatmap spec, as charts.create_net_income_change_heatmap(
+    grid, household_types, children).
+
+    Args:
+        grid: (employment_income_values, net_income_changes) shaped
+            (household type, children, income)
+        household_types: Household structures or filing statuses along the
+            first grid axis
+        children: Numbers of children along the second grid axis
+
+    Returns:
+        Figure spec dict with "data" and "layout"
+    """
+    employment_income_values, net_income_changes = grid
+    rows = len(household_types)
+    domains = _row_domains(rows, 0.08)
+    layout = _shared_x_axes(rows, domains)
+
+    data = []
+    for index, changes in enumerate(net_income_changes):
+        suffix = "" if index == 0 else str(index + 1)
+        data.append(
+            {
+                "coloraxis": "coloraxis",
+                "hovertemplate": (
+                    "Employment income: $%{x:,}<br>Children: %{y}<br>"
+                    "Change in net income: $%{z:.2f}<extra></extra>"
+                ),
+                "x": np.asarray(employment_income_values),
+                "y": list(children),
+                "z": np.asarray(changes),
+                "type": "heatmap",
+                "xaxis": f"x{suffix}",
+                "yaxis": f"y{suffix}",
+            }
+        )
+        layout[f"xaxis{suffix}"].update(tickformat=",", tickprefix="$", fixedrange=True)
+        layout[f"yaxis{suffix}"].update(
+            title={"text": "Children"}, tickvals=list(children), fixedrange=True
+        )
+    layout[f"xaxis{rows if rows > 1 else ''}"]["title"] = {"text": "Employment income"}
+
+    layout.update(
+        annotations=[
+            {
+                "font": {"size": 16},
+                "showarrow": False,
+                "text": HOUSEHOLD_TYPE_LABELS.get(household_type, household_type),
+                "x": 0.5,
+                "xanchor": "center",
+                "xref": "paper",
+                "y": domain[1],
+                "yanchor": "bottom",
+                "yref": "paper",
+            }
+            for household_type, domain in zip(household_types, domains)
+        ],
+        title={"text": "Change in net income by household type", "x": 0},
+        font=_font(),
+        coloraxis={
+            "colorbar": {"title": {"text": "Change"}, "tickprefix": "$"},
+            "colorscale": [[0, GRAY_200], [0.5, PRIMARY_500], [1, PRIMARY_700]],
+        },
+        margin={"l": 60, "r": 60, "b": 100, "t": 100, "pad": 4},
+        height=200 * rows + 200,
+        images=[watermark(1.05, -0.18)],
+    )
+    return _spec(data, layout)
+
+
+def budget_window_figure(projection) -> dict:
+    """
+    Budget window spec, as charts.create_budget_window_chart(projection).
+
+    Args:
+        projection: Table from projection.project_statewide_impacts, indexed
+            by year
+
+    Returns:
+        Figure spec dict with "data" and "layout"
+    """
+    years = list(projection.index)
+    revenue = projection["revenue_impact_millions"].to_numpy()
+    data = [
+        {
+            "hovertemplate": "Year: %{x}<br>Revenue impact: $%{y:,.1f}M<extra></extra>",
+            "marker": {"color": PRIMARY_500},
+            "name": "Annual",
+            "text": [f"${x:,.0f}M" for x in revenue],
+            "x": years,
+            "y": revenue,
+            "type": "bar",
+        },
+        {
+            "hovertemplate": (
+                "Year: %{x}<br>Cumulative impact: $%{y:,.1f}M<extra></extra>"
+            ),
+            "line": {"color": PRIMARY_700},
+            "mode": "lines+markers",
+            "name": "Cumulative",
+            "x": years,
+            "y": projection["revenue_impact_millions"].cumsum().to_numpy(),
+            "type": "scatter",
+        },
+    ]
+    layout = {
+        "title": {
+            "text": f"Revenue impact of Utah SB60, {years[0]}-{years[-1]}",
+            "x": 0,
+        },
+        "font": _font(),
+        "xaxis": {"title": {"text": "Year"}, "tickvals": years, "fixedrange": True},
+        "yaxis": _dollar_axis("Change in state revenue (millions)"),
+        "legend": {"orientation": "h", "yanchor": "bottom", "y": 1.0, "x": 0},
+        "margin": {"l": 60, "r": 60, "b": 80, "t": 100, "pad": 4},
+        "images": [watermark(1.05, -0.18)],
+    }
+    return _spec(data, layout)
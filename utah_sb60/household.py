@@ -1,5 +1,149 @@
 """Household impact calculations for Utah SB60."""
 
+from functools import lru_cache
+from typing import Iterator
+
+import numpy as np
+
+from .reform import PRE_SB60_RATE, SB60_RATE
+
+# Utah taxpayer credit parameters for tax year 2026
+TAXPAYER_CREDIT_RATE = 0.06
+TAXPAYER_CREDIT_PHASE_OUT_RATE = 0.013
+PERSONAL_EXEMPTION = 2_159
+
+# Federal standard deduction by filing status (2026)
+STANDARD_DEDUCTION = {
+    "single": 16_100,
+    "joint": 32_200,
+    "head_of_household": 24_150,
+    "separate": 16_100,
+    "surviving_spouse": 32_200,
+}
+
+# Incomes per chunk yielded by iter_net_income_changes (16 MB of float64)
+DEFAULT_STREAM_CHUNK_SIZE = 1_000_000
+
+# Household types covered by the analytic grid
+GRID_FILING_STATUSES = ("single", "head_of_household", "joint")
+GRID_CHILDREN = (0, 1, 2, 3)
+
+# Household structures covered by simulated grids, and adults in each.
+# PolicyEngine-US infers the filing status itself (see grid_filing_status),
+# so simulated grids are keyed on structure rather than filing status
+GRID_HOUSEHOLD_STRUCTURES = ("unmarried", "married")
+GRID_ADULTS = {"unmarried": 1, "married": 2}
+
+# Income above which the taxpayer credit phases out, by filing status (2026)
+TAXPAYER_CREDIT_PHASE_OUT_THRESHOLD = {
+    "single": 18_626,
+    "joint": 37_252,
+    "head_of_household": 27_939,
+    "separate": 18_626,
+    "surviving_spouse": 37_252,
+}
+
+
+def _ut_income_tax(
+    income: np.ndarray,
+    rate: float,
+    standard_deduction: np.ndarray,
+    phase_out_threshold: np.ndarray,
+    dependents: np.ndarray,
+) -> np.ndarray:
+    """Utah income tax after the taxpayer credit; all inputs broadcast."""
+    initial_credit = TAXPAYER_CREDIT_RATE * (
+        standard_deduction + PERSONAL_EXEMPTION * dependents
+    )
+    phase_out_income = np.maximum(income - phase_out_threshold, 0)
+    credit = np.maximum(
+        initial_credit - TAXPAYER_CREDIT_PHASE_OUT_RATE * phase_out_income, 0
+    )
+    return np.maximum(rate * income - credit, 0)
+
+
+def calculate_ut_income_tax(
+    employment_income: np.ndarray,
+    rate: float,
+    filing_status: str = "single",
+    dependents: int = 0,
+) -> np.ndarray:
+    """
+    Calculate Utah income tax liability for a vector of employment incomes.
+
+    Applies the flat rate, then the nonrefundable taxpayer credit: 6% of the
+    federal standard deduction plus personal exemptions for dependents,
+    reduced by 1.3% of income above the filing-status phase-out threshold.
+
+    Args:
+        employment_income: Employment income values (any array-like)
+        rate: Utah flat income tax rate
+        filing_status: Key into STANDARD_DEDUCTION
+        dependents: Number of dependents claimed
+
+    Returns:
+        Array of Utah income tax liabilities, same shape as employment_income
+    """
+    return _ut_income_tax(
+        np.asarray(employment_income, dtype=np.float64),
+        rate,
+        STANDARD_DEDUCTION[filing_status],
+        TAXPAYER_CREDIT_PHASE_OUT_THRESHOLD[filing_status],
+        dependents,
+    )
+
+
+def calculate_net_income_change(
+    employment_income: np.ndarray,
+    filing_status: str = "single",
+    dependents: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the change in net income from SB60 for a vector of incomes.
+
+    Args:
+        employment_income: Employment income values (any array-like)
+        filing_status: Key into STANDARD_DEDUCTION
+        dependents: Number of dependents claimed
+
+    Returns:
+        Array of net income changes (baseline tax minus reform tax)
+    """
+    baseline = calculate_ut_income_tax(
+        employment_income, PRE_SB60_RATE, filing_status, dependents
+    )
+    reform = calculate_ut_income_tax(
+        employment_income, SB60_RATE, filing_status, dependents
+    )
+    return baseline - reform
+
+
+def calculate_net_income_change_arrays(
+    min_income: int = 0,
+    max_income: int = 200000,
+    step: int = 50,
+    filing_status: str = "single",
+    dependents: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate change in net income across evenly spaced earnings levels.
+
+    Args:
+        min_income: Minimum employment income to calculate
+        max_income: Maximum employment income to calculate
+        step: Income increment step size
+        filing_status: Key into STANDARD_DEDUCTION
+        dependents: Number of dependents claimed
+
+    Returns:
+        Tuple of (employment_income_values, net_income_changes) arrays
+    """
+    employment_income_values = np.arange(min_income, max_income + 1, step)
+    net_income_changes = calculate_net_income_change(
+        employment_income_values, filing_status, dependents
+    )
+    return employment_income_values, net_income_changes
+
 
 def calculate_net_income_changes(
     min_income: int = 0,
@@ -17,15 +161,459 @@ def calculate_net_income_changes(
     Returns:
         Tuple of (employment_income_values, net_income_changes)
     """
-    employment_income_values = list(range(min_income, max_income + 1, step))
-    net_income_changes = []
+    employment_income_values, net_income_changes = calculate_net_income_change_arrays(
+        min_income, max_income, step
+    )
+    return employment_income_values.tolist(), net_income_changes.tolist()
+
+
+def iter_net_income_changes(
+    min_income: int = 0,
+    max_income: int = 200000,
+    step: int = 50,
+    filing_status: str = "single",
+    dependents: int = 0,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Stream the change in net income across earnings in fixed-size chunks.
+
+    Same values as calculate_net_income_change_arrays, but only one chunk
+    is held in memory at a time, so sweeps of any length (e.g. $0 to $10M
+    at $1) run in constant memory.
+
+    Args:
+        min_income: Minimum employment income to calculate
+        max_income: Maximum employment income to calculate
+        step: Income increment step size
+        filing_status: Key into STANDARD_DEDUCTION
+        dependents: Number of dependents claimed
+        chunk_size: Incomes per chunk
+
+    Yields:
+        Tuples of (employment_income_values, net_income_changes) arrays
+    """
+    count = (max_income - min_income) // step + 1
+    for start in range(0, count, chunk_size):
+        employment_income_values = min_income + step * np.arange(
+            start, min(start + chunk_size, count), dtype=np.int64
+        )
+        yield employment_income_values, calculate_net_income_change(
+            employment_income_values, filing_status, dependents
+        )
+
+
+def calculate_net_income_change_grid(
+    filing_statuses: tuple[str, ...] = GRID_FILING_STATUSES,
+    children: tuple[int, ...] = GRID_CHILDREN,
+    min_income: int = 0,
+    max_income: int = 200000,
+    step: int = 1000,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the change in net income for every combination of filing
+    status, number of children and earnings in one broadcast evaluation.
+
+    Args:
+        filing_statuses: Keys into STANDARD_DEDUCTION
+        children: Numbers of children, each claimed as a dependent
+        min_income: Minimum employment income to calculate
+        max_income: Maximum employment income to calculate
+        step: Income increment step size
+
+    Returns:
+        Tuple of (employment_income_values, net_income_changes), where
+        net_income_changes[f, c, i] is for filing_statuses[f], children[c]
+        and employment_income_values[i]
+    """
+    employment_income_values = np.arange(min_income, max_income + 1, step)
+    income = employment_income_values.astype(np.float64)[None, None, :]
+    standard_deduction = np.array(
+        [STANDARD_DEDUCTION[status] for status in filing_statuses]
+    )[:, None, None]
+    threshold = np.array(
+        [TAXPAYER_CREDIT_PHASE_OUT_THRESHOLD[status] for status in filing_statuses]
+    )[:, None, None]
+    dependents = np.asarray(children)[None, :, None]
+    baseline = _ut_income_tax(
+        income, PRE_SB60_RATE, standard_deduction, threshold, dependents
+    )
+    reform = _ut_income_tax(
+        income, SB60_RATE, standard_deduction, threshold, dependents
+    )
+    return employment_income_values, baseline - reform
+
+
+def build_household_situation(
+    min_income: int = 0,
+    max_income: int = 200000,
+    step: int = 50,
+    year: int = 2026,
+) -> dict:
+    """
+    Build a PolicyEngine-US situation for a single adult in Utah with an
+    employment income axis.
+
+    The axis expands the household into one copy per income level, so a
+    single simulation covers the whole sweep.
+
+    Args:
+        min_income: Minimum employment income on the axis
+        max_income: Maximum employment income on the axis
+        step: Income increment step size
+        year: Tax year to simulate
+
+    Returns:
+        Situation dictionary accepted by policyengine_us.Simulation
+    """
+    count = (max_income - min_income) // step + 1
+    period = str(year)
+    members = ["adult"]
+    return {
+        "people": {"adult": {"age": {period: 40}}},
+        "families": {"family": {"members": members}},
+        "marital_units": {"marital_unit": {"members": members}},
+        "tax_units": {"tax_unit": {"members": members}},
+        "spm_units": {"spm_unit": {"members": members}},
+        "households": {"household": {"members": members, "state_name": {period: "UT"}}},
+        "axes": [
+            [
+                {
+                    "name": "employment_income",
+                    "count": count,
+                    "min": min_income,
+                    "max": min_income + (count - 1) * step,
+                    "period": period,
+                }
+            ]
+        ],
+    }
+
+
+@lru_cache(maxsize=1)
+def _tax_benefit_systems() -> tuple:
+    """
+    Load the baseline and reform tax-benefit systems once per process, from
+    on-disk snapshots when available, so repeated household simulations skip
+    re-applying the reforms.
+    """
+    from .reform import SB60_BASELINE_PARAMETERS, SB60_REFORM_PARAMETERS
+    from .snapshot import tax_benefit_system
+
+    return (
+        tax_benefit_system(SB60_BASELINE_PARAMETERS),
+        tax_benefit_system(SB60_REFORM_PARAMETERS),
+    )
+
 
-    for income in employment_income_values:
-        if income <= 20500:
-            net_income_changes.append(0)
-        else:
-            # Linear interpolation from $10 at $21,000 to $100 at $200,000
-            change = 10 + (income - 21000) * (100 - 10) / (200000 - 21000)
-            net_income_changes.append(change)
+def _simulate_net_income(situation: dict, year: int) -> dict:
+    """Baseline and reform household_net_income for a situation."""
+    from policyengine_us import Simulation
 
+    baseline_system, reform_system = _tax_benefit_systems()
+    baseline = Simulation(situation=situation, tax_benefit_system=baseline_system)
+    reformed = Simulation(situation=situation, tax_benefit_system=reform_system)
+    return {
+        "baseline_net_income": baseline.calculate("household_net_income", year),
+        "reform_net_income": reformed.calculate("household_net_income", year),
+    }
+
+
+def simulate_net_income_changes(
+    min_income: int = 0,
+    max_income: int = 200000,
+    step: int = 50,
+    year: int = 2026,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate change in net income for a single adult with PolicyEngine-US.
+
+    Runs exactly two vectorized simulations (baseline and ut_sb60_reform)
+    over an employment income axis rather than one simulation per income.
+    Results are served from the on-disk cache when available.
+
+    Args:
+        min_income: Minimum employment income to calculate
+        max_income: Maximum employment income to calculate
+        step: Income increment step size
+        year: Tax year to simulate
+
+    Returns:
+        Tuple of (employment_income_values, net_income_changes) arrays
+    """
+    from .cache import cached_arrays
+    from .profiling import span
+
+    situation = build_household_situation(min_income, max_income, step, year)
+
+    def compute() -> dict:
+        with span("load policyengine_us"):
+            _tax_benefit_systems()
+
+        with span("simulate household sweep", step=step):
+            return _simulate_net_income(situation, year)
+
+    arrays = cached_arrays("household_sweep", situation, year, compute)
+
+    employment_income_values = np.arange(min_income, max_income + 1, step)
+    net_income_changes = np.asarray(
+        arrays["reform_net_income"], dtype=np.float64
+    ) - np.asarray(arrays["baseline_net_income"], dtype=np.float64)
     return employment_income_values, net_income_changes
+
+
+def grid_filing_status(structure: str, children: int) -> str:
+    """
+    Filing status PolicyEngine-US assigns a simulated grid household: married
+    couples file jointly, and an unmarried adult files as head of household
+    when they have children and single otherwise.
+
+    Args:
+        structure: Key into GRID_ADULTS
+        children: Number of children in the household
+
+    Returns:
+        Key into STANDARD_DEDUCTION
+    """
+    if structure == "married":
+        return "joint"
+    return "head_of_household" if children else "single"
+
+
+def build_household_grid_situation(
+    structure: str = "unmarried",
+    children: tuple[int, ...] = GRID_CHILDREN,
+    min_income: int = 0,
+    max_income: int = 200000,
+    step: int = 1000,
+    year: int = 2026,
+) -> dict:
+    """
+    Build a PolicyEngine-US situation holding one Utah household per number
+    of children, all sharing a household structure, with parallel
+    employment income axes on each household's first adult.
+
+    The axes expand every household into one copy per income level, so a
+    single simulation covers all numbers of children and earnings.
+
+    Args:
+        structure: Key into GRID_ADULTS
+        children: Numbers of children, one household each
+        min_income: Minimum employment income on the axes
+        max_income: Maximum employment income on the axes
+        step: Income increment step size
+        year: Tax year to simulate
+
+    Returns:
+        Situation dictionary accepted by policyengine_us.Simulation
+    """
+    if structure not in GRID_ADULTS:
+        raise ValueError(
+            f"Simulated grids support household structures {sorted(GRID_ADULTS)}, "
+            f"not {structure!r}"
+        )
+    count = (max_income - min_income) // step + 1
+    period = str(year)
+    situation = {
+        "people": {},
+        "families": {},
+        "marital_units": {},
+        "tax_units": {},
+        "spm_units": {},
+        "households": {},
+    }
+    axes = []
+    for index, n_children in enumerate(children):
+        adults = [f"adult_{index}_{a}" for a in range(GRID_ADULTS[structure])]
+        kids = [f"child_{index}_{c}" for c in range(n_children)]
+        members = adults + kids
+        # Parallel axes vary the first adult of each household; index counts
+        # people in situation order
+        axes.append(
+            {
+                "name": "employment_income",
+                "count": count,
+                "min": min_income,
+                "max": min_income + (count - 1) * step,
+                "period": period,
+                "index": len(situation["people"]),
+            }
+        )
+        for person in adults:
+            situation["people"][person] = {"age": {period: 40}}
+        for person in kids:
+            situation["people"][person] = {"age": {period: 8}}
+            situation["marital_units"][f"{person}_marital_unit"] = {"members": [person]}
+        situation["marital_units"][f"marital_unit_{index}"] = {"members": adults}
+        situation["families"][f"family_{index}"] = {"members": members}
+        situation["tax_units"][f"tax_unit_{index}"] = {"members": members}
+        situation["spm_units"][f"spm_unit_{index}"] = {"members": members}
+        situation["households"][f"household_{index}"] = {
+            "members": members,
+            "state_name": {period: "UT"},
+        }
+    situation["axes"] = [axes]
+    return situation
+
+
+def simulate_net_income_change_grid(
+    structures: tuple[str, ...] = GRID_HOUSEHOLD_STRUCTURES,
+    children: tuple[int, ...] = GRID_CHILDREN,
+    min_income: int = 0,
+    max_income: int = 200000,
+    step: int = 1000,
+    year: int = 2026,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate the change in net income over household structure, number of
+    children and earnings with PolicyEngine-US.
+
+    Runs one baseline and one reform simulation per household structure
+    (see build_household_grid_situation). Results are served from the
+    on-disk cache when available.
+
+    Args:
+        structures: Keys into GRID_ADULTS
+        children: Numbers of children
+        min_income: Minimum employment income to calculate
+        max_income: Maximum employment income to calculate
+        step: Income increment step size
+        year: Tax year to simulate
+
+    Returns:
+        Tuple of (employment_income_values, net_income_changes), with
+        net_income_changes shaped (structure, children, income) as in
+        calculate_net_income_change_grid
+    """
+    from .cache import cached_arrays
+    from .profiling import span
+
+    employment_income_values = np.arange(min_income, max_income + 1, step)
+    grid = np.empty((len(structures), len(children), len(employment_income_values)))
+    for index, structure in enumerate(structures):
+        situation = build_household_grid_situation(
+            structure, children, min_income, max_income, step, year
+        )
+
+        def compute() -> dict:
+            with span("load policyengine_us"):
+                _tax_benefit_systems()
+
+            with span("simulate household grid", structure=structure):
+                return _simulate_net_income(situation, year)
+
+        arrays = cached_arrays("household_grid", situation, year, compute)
+        change = np.asarray(arrays["reform_net_income"], dtype=np.float64) - np.asarray(
+            arrays["baseline_net_income"], dtype=np.float64
+        )
+        # Axis copies are laid out income-major: [income][household]
+        grid[index] = change.reshape(len(employment_income_values), len(children)).T
+    return employment_income_values, grid
+
+
+def build_household_points_situation(employment_incomes, year: int = 2026) -> dict:
+    """
+    Build a PolicyEngine-US situation with one single-adult Utah household
+    per employment income, for incomes that are not evenly spaced.
+
+    Args:
+        employment_incomes: Employment income of each household
+        year: Tax year to simulate
+
+    Returns:
+        Situation dictionary accepted by policyengine_us.Simulation
+    """
+    period = str(year)
+    situation = {
+        "people": {},
+        "families": {},
+        "marital_units": {},
+        "tax_units": {},
+        "spm_units": {},
+        "households": {},
+    }
+    for index, income in enumerate(employment_incomes):
+        adult = f"adult_{index}"
+        members = [adult]
+        situation["people"][adult] = {
+            "age": {period: 40},
+            "employment_income": {period: float(income)},
+        }
+        for group, name in (
+            ("families", "family"),
+            ("marital_units", "marital_unit"),
+            ("tax_units", "tax_unit"),
+            ("spm_units", "spm_unit"),
+        ):
+            situation[group][f"{name}_{index}"] = {"members": members}
+        situation["households"][f"household_{index}"] = {
+            "members": members,
+            "state_name": {period: "UT"},
+        }
+    return situation
+
+
+def simulate_net_income_change_at(employment_incomes, year: int = 2026) -> np.ndarray:
+    """
+    Simulate the change in net income for a single adult at arbitrary
+    employment incomes, with one baseline and one reform simulation.
+
+    Returns:
+        Array of net income changes, one per income
+    """
+    from .cache import cached_arrays
+    from .profiling import span
+
+    situation = build_household_points_situation(employment_incomes, year)
+
+    def compute() -> dict:
+        with span("load policyengine_us"):
+            _tax_benefit_systems()
+
+        with span("simulate household points", households=len(employment_incomes)):
+            return _simulate_net_income(situation, year)
+
+    arrays = cached_arrays("household_points", situation, year, compute)
+    return np.asarray(arrays["reform_net_income"], dtype=np.float64) - np.asarray(
+        arrays["baseline_net_income"], dtype=np.float64
+    )
+
+
+def sample_net_income_changes(
+    min_income: int = 0,
+    max_income: int = 200000,
+    tolerance: float = 0.05,
+    year: int = 2026,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate the single-adult net income change curve at only the incomes
+    needed to draw it within tolerance.
+
+    Uses sampling.adaptive_sample: a coarse first round, then refinement
+    only where the curve bends, with each round's incomes simulated
+    together. It is not faster than a $50 sweep: each of the seven or so
+    rounds is its own pair of simulations, and their fixed cost outweighs
+    simulating fewer households. What it buys is accuracy per point:
+    kinks are placed exactly rather than to the nearest step, and the
+    curve is returned as its endpoints and kinks only.
+
+    Args:
+        min_income: Minimum employment income
+        max_income: Maximum employment income
+        tolerance: Largest allowed error in net income change, in dollars;
+            simulated net income is float32, so keep this above a few cents
+        year: Tax year to simulate
+
+    Returns:
+        Tuple of (employment_income_values, net_income_changes) at the kinks
+        and endpoints of the curve
+    """
+    from .sampling import adaptive_sample
+
+    incomes, changes, _ = adaptive_sample(
+        lambda incomes: simulate_net_income_change_at(incomes, year),
+        min_income,
+        max_income,
+        tolerance=tolerance,
+    )
+    return incomes, changes
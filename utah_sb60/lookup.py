@@ -0,0 +1,209 @@
+"""Breakpoint lookup tables for household net income changes.
+
+For a given filing status and number of dependents, SB60's change in net
+income is piecewise-linear in employment income: its only kinks are where
+each scenario's tax first becomes positive and where the taxpayer credit
+starts and finishes phasing out. Each household archetype is stored as the
+handful of (income, change) points at those kinks, and any income is then
+answered by binary search and linear interpolation.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .household import (
+    PERSONAL_EXEMPTION,
+    STANDARD_DEDUCTION,
+    TAXPAYER_CREDIT_PHASE_OUT_RATE,
+    TAXPAYER_CREDIT_PHASE_OUT_THRESHOLD,
+    TAXPAYER_CREDIT_RATE,
+    calculate_net_income_change,
+)
+from .reform import PRE_SB60_RATE, SB60_RATE
+
+# Archetypes precomputed by default: every filing status with 0-6 dependents
+DEFAULT_MAX_DEPENDENTS = 6
+
+
+def tax_kinks(rate: float, filing_status: str, dependents: int) -> list[float]:
+    """
+    Incomes where calculate_ut_income_tax changes slope for one rate.
+
+    Returns:
+        Sorted kink incomes: where the credit starts phasing out, where it is
+        exhausted and where tax first exceeds the credit
+    """
+    initial_credit = TAXPAYER_CREDIT_RATE * (
+        STANDARD_DEDUCTION[filing_status] + PERSONAL_EXEMPTION * dependents
+    )
+    threshold = TAXPAYER_CREDIT_PHASE_OUT_THRESHOLD[filing_status]
+    credit_exhausted = threshold + initial_credit / TAXPAYER_CREDIT_PHASE_OUT_RATE
+    # Tax = rate * income - credit crosses zero either before the phase-out
+    # starts or while the credit is phasing out
+    zero_crossing = initial_credit / rate
+    if zero_crossing > threshold:
+        zero_crossing = (
+            initial_credit + TAXPAYER_CREDIT_PHASE_OUT_RATE * threshold
+        ) / (rate + TAXPAYER_CREDIT_PHASE_OUT_RATE)
+    return sorted({threshold, credit_exhausted, zero_crossing})
+
+
+def build_breakpoint_table(
+    filing_status: str = "single", dependents: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Breakpoints of the net income change for one household archetype.
+
+    Args:
+        filing_status: Key into STANDARD_DEDUCTION
+        dependents: Number of dependents claimed
+
+    Returns:
+        Tuple of (incomes, net_income_changes): zero income, every kink and
+        one point past the last kink to fix the final slope
+    """
+    kinks = set(tax_kinks(PRE_SB60_RATE, filing_status, dependents))
+    kinks |= set(tax_kinks(SB60_RATE, filing_status, dependents))
+    incomes = np.array(sorted({0.0, *kinks}))
+    incomes = np.append(incomes, incomes[-1] * 2 + 1)
+    return incomes, calculate_net_income_change(incomes, filing_status, dependents)
+
+
+def build_lookup_tables(max_dependents: int = DEFAULT_MAX_DEPENDENTS) -> dict:
+    """
+    Breakpoint tables for every filing status with 0 to max_dependents.
+
+    Returns:
+        Dict of (filing_status, dependents) -> (incomes, changes)
+    """
+    return {
+        (filing_status, dependents): build_breakpoint_table(filing_status, dependents)
+        for filing_status in STANDARD_DEDUCTION
+        for dependents in range(max_dependents + 1)
+    }
+
+
+@lru_cache(maxsize=1)
+def default_lookup_tables() -> dict:
+    """Tables for the default archetypes, built once per process."""
+    return build_lookup_tables()
+
+
+def interpolate_table(
+    incomes: np.ndarray, changes: np.ndarray, employment_income: np.ndarray
+) -> np.ndarray:
+    """
+    Evaluate a breakpoint table at any incomes, extrapolating the last
+    segment's slope beyond the final breakpoint.
+    """
+    employment_income = np.asarray(employment_income, dtype=np.float64)
+    values = np.interp(employment_income, incomes, changes)
+    slope = (changes[-1] - changes[-2]) / (incomes[-1] - incomes[-2])
+    beyond = employment_income > incomes[-1]
+    values[beyond] = changes[-1] + slope * (employment_income[beyond] - incomes[-1])
+    return values
+
+
+def lookup_net_income_change(
+    employment_income: np.ndarray,
+    filing_status: str = "single",
+    dependents: int = 0,
+    tables: dict | None = None,
+) -> np.ndarray:
+    """
+    Change in net income from SB60 via the breakpoint tables.
+
+    Same result as household.calculate_net_income_change, in O(log k) per
+    income for k breakpoints. Archetypes missing from tables are built on
+    first use and added to them.
+
+    Args:
+        employment_income: Employment income values (any array-like)
+        filing_status: Key into STANDARD_DEDUCTION
+        dependents: Number of dependents claimed
+        tables: Lookup tables; defaults to default_lookup_tables()
+
+    Returns:
+        Array of net income changes, same shape as employment_income
+    """
+    tables = default_lookup_tables() if tables is None else tables
+    key = (filing_status, dependents)
+    if key not in tables:
+        tables[key] = build_breakpoint_table(filing_status, dependents)
+    return interpolate_table(*tables[key], np.atleast_1d(employment_income)).reshape(
+        np.shape(employment_income)
+    )
+
+
+def verify_lookup_tables(
+    tables: dict | None = None,
+    samples: int = 100_000,
+    max_income: float = 1_000_000,
+    seed: int = 0,
+) -> float:
+    """
+    Compare table lookups with direct calculation at random incomes.
+
+    Args:
+        tables: Lookup tables; defaults to default_lookup_tables()
+        samples: Random incomes checked per archetype
+        max_income: Upper bound of the sampled incomes
+        seed: Random seed
+
+    Returns:
+        Largest absolute difference found, in dollars
+    """
+    tables = default_lookup_tables() if tables is None else tables
+    rng = np.random.default_rng(seed)
+    worst = 0.0
+    for (filing_status, dependents), (incomes, changes) in tables.items():
+        sample = rng.uniform(0, max_income, samples)
+        expected = calculate_net_income_change(sample, filing_status, dependents)
+        actual = interpolate_table(incomes, changes, sample)
+        worst = max(worst, float(np.max(np.abs(actual - expected))))
+    return worst
+
+
+def save_lookup_tables(tables: dict, path: Path) -> Path:
+    """Store tables in one .npz, two arrays per archetype."""
+    arrays = {}
+    for (filing_status, dependents), (incomes, changes) in tables.items():
+        arrays[f"{filing_status}:{dependents}:incomes"] = incomes
+        arrays[f"{filing_status}:{dependents}:changes"] = changes
+    np.savez(path, **arrays)
+    return Path(path)
+
+
+def load_lookup_tables(path: Path) -> dict:
+    """Read tables written by save_lookup_tables."""
+    tables = {}
+    with np.load(path, allow_pickle=False) as data:
+        for name in data.files:
+            filing_status, dependents, kind = name.split(":")
+            if kind == "incomes":
+                prefix = f"{filing_status}:{dependents}"
+                tables[(filing_status, int(dependents))] = (
+                    data[f"{prefix}:incomes"],
+                    data[f"{prefix}:changes"],
+                )
+    return tables
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build and verify SB60 lookup tables.")
+    parser.add_argument("--output", help="Write the tables to this .npz file")
+    parser.add_argument("--samples", type=int, default=100_000)
+    args = parser.parse_args()
+
+    tables = build_lookup_tables()
+    points = sum(len(incomes) for incomes, _ in tables.values())
+    print(f"{len(tables)} archetypes, {points} breakpoints")
+    print(
+        f"Max error vs direct calculation: ${verify_lookup_tables(tables, args.samples):.2e}"
+    )
+    if args.output:
+        print(f"Wrote {save_lookup_tables(tables, args.output)}")
@@ -0,0 +1,704 @@
+"""Statewide impact calculations for Utah SB60 from microdata.
+
+Runs the baseline and ut_sb60_reform over the PolicyEngine-US microdata,
+keeps Utah households, and aggregates them chunk by chunk into the same
+structures published in statewide.py.
+"""
+
+import gc
+import math
+from typing import Iterator
+
+import numpy as np
+
+# Rows aggregated at a time; bounds the size of every temporary array
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Relative net income change thresholds used by PolicyEngine's
+# winners-and-losers breakdown
+NO_CHANGE_THRESHOLD = 1e-3
+LARGE_CHANGE_THRESHOLD = 0.05
+
+# Outcome categories in chart order, with the statewide.py names for their
+# decile and all-population shares
+OUTCOMES = [
+    ("GAIN_MORE_THAN_5PCT", "ALL_GAIN_MORE_THAN_5PCT"),
+    ("GAIN_LESS_THAN_5PCT", "ALL_GAIN_LESS_THAN_5PCT"),
+    ("NO_CHANGE", "ALL_NO_CHANGE"),
+    ("LOSS_LESS_THAN_5PCT", "ALL_LOSS_LESS_THAN_5PCT"),
+    ("LOSS_MORE_THAN_5PCT", "ALL_LOSS_MORE_THAN_5PCT"),
+]
+
+# Household-level variables computed for each scenario
+SCENARIO_VARIABLES = {
+    "net_income": "household_net_income",
+    "equiv_net_income": "equiv_household_net_income",
+    "state_income_tax": "household_state_income_tax",
+}
+
+# Columns stored per scenario: the variables above plus poverty head counts
+SCENARIO_COLUMNS = [*SCENARIO_VARIABLES, "in_poverty", "in_deep_poverty"]
+
+# Household column deciles are ranked on, weighted by people, as
+# PolicyEngine's household_income_decile ranks equivalised net income
+DECILE_RANKING_COLUMN = "baseline_equiv_net_income"
+
+
+# Narrowest dtypes compact mode stores each column in; see compact_array
+COMPACT_DTYPES = {
+    "weight": np.float32,
+    "people": np.int16,
+    "net_income": np.float32,
+    "equiv_net_income": np.float32,
+    "state_income_tax": np.float32,
+    "in_poverty": np.int16,
+    "in_deep_poverty": np.int16,
+}
+
+# Largest rounding error accepted when compact mode narrows a float column
+# to float32: a cent for dollar columns, and a relative error for weights,
+# which count households rather than dollars
+COMPACT_FLOAT_ATOL = 0.01
+COMPACT_WEIGHT_RTOL = 1e-6
+
+# Microsimulation inherited by simulate_scenario_years' forked workers
+_loaded_simulation = None
+
+
+def _household_values(sim, variable: str, year: int) -> np.ndarray:
+    return np.asarray(sim.calculate(variable, year, map_to="household"))
+
+
+def _people_in(sim, variable: str, year: int) -> np.ndarray:
+    """Count people per household for which a boolean variable holds."""
+    by_person = np.asarray(sim.calculate(variable, year, map_to="person"))
+    return np.asarray(sim.map_result(by_person.astype(float), "person", "household"))
+
+
+def compact_array(
+    values: np.ndarray, dtype, atol: float = COMPACT_FLOAT_ATOL, rtol: float = 0.0
+) -> np.ndarray:
+    """
+    Narrow values to dtype when that is exact enough, else keep float64.
+
+    Integer dtypes must hold every value exactly; float32 must round every
+    value to within atol + rtol * |value|. PolicyEngine-US calculates most
+    variables in float32 already, so those narrow without any loss.
+
+    Args:
+        values: Array to narrow
+        dtype: Target dtype, e.g. from COMPACT_DTYPES
+        atol: Largest absolute rounding error for float dtypes, in the
+            units of values (COMPACT_FLOAT_ATOL is a cent)
+        rtol: Largest rounding error relative to each value
+
+    Returns:
+        values as dtype, or as float64 if narrowing would lose too much
+    """
+    values = np.asarray(values)
+    narrowed = values.astype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        exact = np.array_equal(narrowed, values)
+    else:
+        error = np.abs(narrowed.astype(np.float64) - values)
+        exact = bool(np.all(error <= atol + rtol * np.abs(values)))
+    return narrowed if exact else values.astype(np.float64)
+
+
+def build_microsimulation(parameters: dict, dataset: str | None = None):
+    """
+    Microsimulation of the microdata under a reform parameter dict, using
+    the snapshotted tax-benefit system (see snapshot.tax_benefit_system).
+    """
+    from .profiling import span
+    from .snapshot import tax_benefit_system
+
+    with span("import policyengine_us"):
+        from policyengine_us import Microsimulation
+
+    system = tax_benefit_system(parameters)
+    with span("load microsimulation", dataset=str(dataset)):
+        kwargs = {} if dataset is None else {"dataset": dataset}
+        return Microsimulation(tax_benefit_system=system, **kwargs)
+
+
+def scenario_columns(sim, year: int, compact: bool = False) -> dict:
+    """
+    Calculate one year's scenario columns for Utah households from a
+    loaded Microsimulation.
+
+    Each variable is cut to Utah households as soon as it is calculated, so
+    only one nationwide array is held at a time.
+
+    Args:
+        sim: Loaded Microsimulation
+        year: Tax year to calculate
+        compact: Store columns in COMPACT_DTYPES (see compact_array)
+            instead of float64
+
+    Returns:
+        Dict of household-level arrays: weight, people and SCENARIO_COLUMNS
+    """
+    from .profiling import span
+
+    with span("simulate scenario", year=year, compact=compact):
+        in_utah = _household_values(sim, "state_code_str", year) == "UT"
+
+        def utah(column: str, values: np.ndarray) -> np.ndarray:
+            values = values[in_utah]
+            if compact and column == "weight":
+                return compact_array(
+                    values, COMPACT_DTYPES[column], atol=0.0, rtol=COMPACT_WEIGHT_RTOL
+                )
+            if compact:
+                return compact_array(values, COMPACT_DTYPES[column])
+            return values.astype(np.float64)
+
+        results = {
+            "weight": utah("weight", _household_values(sim, "household_weight", year)),
+            "people": utah(
+                "people", _household_values(sim, "household_count_people", year)
+            ),
+        }
+        for column, variable in SCENARIO_VARIABLES.items():
+            results[column] = utah(column, _household_values(sim, variable, year))
+        for column in ("in_poverty", "in_deep_poverty"):
+            results[column] = utah(column, _people_in(sim, column, year))
+        return results
+
+
+def simulate_scenario(
+    parameters: dict,
+    year: int = 2026,
+    dataset: str | None = None,
+    compact: bool = False,
+) -> dict:
+    """
+    Simulate one policy scenario over the microdata and return one array
+    per column for Utah households.
+
+    Results are served from the on-disk cache when available.
+
+    Args:
+        parameters: Reform parameter changes, e.g. reform.rate_parameters(0.044)
+        year: Tax year to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        compact: Return COMPACT_DTYPES columns, and free the simulation
+            before returning so the next one does not load beside it
+
+    Returns:
+        Dict of household-level arrays: weight, people and SCENARIO_COLUMNS
+    """
+    from .cache import cached_arrays
+
+    def compute() -> dict:
+        return scenario_columns(
+            build_microsimulation(parameters, dataset), year, compact
+        )
+
+    spec = {"dataset": dataset, "parameters": parameters}
+    if compact:
+        spec["compact"] = True
+    results = cached_arrays("scenario_results", spec, year, compute)
+    if compact:
+        # Simulations hold reference cycles; collect them now, not later
+        gc.collect()
+    return results
+
+
+def _simulate_loaded_year(year: int) -> dict:
+    """Worker body for simulate_scenario_years: one year of the inherited sim."""
+    return scenario_columns(_loaded_simulation, year)
+
+
+def simulate_scenario_years(
+    parameters: dict,
+    years: list[int],
+    dataset: str | None = None,
+    jobs: int | None = None,
+) -> dict[int, dict]:
+    """
+    Simulate one policy scenario for several years from a single loaded
+    Microsimulation.
+
+    The tax-benefit system and dataset are loaded once in this process;
+    years missing from the cache are then calculated in forked worker
+    processes that inherit the loaded simulation, so no worker repeats the
+    import or dataset load. Each year is cached under the same key as
+    simulate_scenario.
+
+    Args:
+        parameters: Reform parameter changes
+        years: Tax years to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        jobs: Worker processes; None uses os.cpu_count(), 1 runs inline
+
+    Returns:
+        Dict of year to the arrays simulate_scenario returns for that year
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .cache import lookup, store
+
+    global _loaded_simulation
+
+    spec = {"dataset": dataset, "parameters": parameters}
+    results = {year: lookup("scenario_results", spec, year) for year in years}
+    missing = [year for year, arrays in results.items() if arrays is None]
+    if not missing:
+        return results
+
+    _loaded_simulation = build_microsimulation(parameters, dataset)
+    try:
+        if (
+            jobs == 1
+            or len(missing) == 1
+            or ("fork" not in multiprocessing.get_all_start_methods())
+        ):
+            computed = [_simulate_loaded_year(year) for year in missing]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+            ) as pool:
+                computed = list(pool.map(_simulate_loaded_year, missing))
+    finally:
+        _loaded_simulation = None
+
+    for year, arrays in zip(missing, computed):
+        store("scenario_results", spec, year, arrays)
+        results[year] = arrays
+    return results
+
+
+def combine_scenarios(baseline: dict, reform: dict) -> dict:
+    """
+    Merge baseline and reform scenario columns into one household table,
+    prefixing scenario columns with "baseline_" and "reform_".
+    """
+    results = {"weight": baseline["weight"], "people": baseline["people"]}
+    for scenario, columns in (("baseline", baseline), ("reform", reform)):
+        for column in SCENARIO_COLUMNS:
+            results[f"{scenario}_{column}"] = columns[column]
+    return results
+
+
+def load_household_results(
+    year: int = 2026,
+    dataset: str | None = None,
+    prune: bool = True,
+    compact: bool = False,
+) -> dict:
+    """
+    Simulate the pinned baseline and ut_sb60_reform over the microdata and
+    return one array per column for Utah households.
+
+    Args:
+        year: Tax year to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        prune: Simulate the reform only for households whose Utah tax can
+            change (see pruning.py); False runs it over the whole dataset
+        compact: Return COMPACT_DTYPES columns (see compact.py)
+
+    Returns:
+        Dict of household-level arrays: weight, people, and for each of
+        "baseline"/"reform" the net income, equivalised net income, state
+        income tax and counts of people in poverty and deep poverty
+    """
+    from .reform import SB60_BASELINE_PARAMETERS, SB60_REFORM_PARAMETERS
+
+    if prune:
+        from .pruning import pruned_household_results
+
+        return pruned_household_results(year, dataset, compact)
+    return combine_scenarios(
+        simulate_scenario(SB60_BASELINE_PARAMETERS, year, dataset, compact),
+        simulate_scenario(SB60_REFORM_PARAMETERS, year, dataset, compact),
+    )
+
+
+def iter_chunks(results: dict, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict]:
+    """Yield dicts of aligned slices of every column, chunk_size rows each."""
+    n = len(next(iter(results.values())))
+    for start in range(0, n, chunk_size):
+        yield {
+            column: values[start : start + chunk_size]
+            for column, values in results.items()
+        }
+
+
+def weighted_decile_cutoffs(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Return the nine weighted cutoffs separating values into deciles.
+
+    Args:
+        values: Ranking variable
+        weights: Non-negative weights, same length as values
+
+    Returns:
+        Array of 9 cutoffs; decile d holds values in (cutoff[d-2], cutoff[d-1]]
+    """
+    order = np.argsort(values, kind="stable")
+    cumulative = np.cumsum(weights[order])
+    targets = cumulative[-1] * np.arange(1, 10) / 10
+    positions = np.searchsorted(cumulative, targets, side="left")
+    return values[order][np.minimum(positions, len(values) - 1)]
+
+
+def assign_deciles(values: np.ndarray, cutoffs: np.ndarray) -> np.ndarray:
+    """Map values to deciles 1-10 given weighted_decile_cutoffs."""
+    return np.searchsorted(cutoffs, values, side="left") + 1
+
+
+def classify_outcomes(baseline: np.ndarray, reform: np.ndarray) -> np.ndarray:
+    """
+    Classify each household's relative net income change into the OUTCOMES
+    categories (0 = gain more than 5%, ..., 4 = loss more than 5%).
+
+    Uses PolicyEngine's intra-decile formula exactly: both incomes are
+    floored at 1 and the absolute change is added again to the floored
+    reform income, so the relative change is effectively doubled. Category
+    intervals are closed above, as in PolicyEngine: a relative change of
+    exactly 0.1% counts as no change and exactly -5% as a loss over 5%.
+    """
+    capped_baseline = np.maximum(baseline, 1)
+    absolute_change = reform - baseline
+    capped_reform = np.maximum(reform, 1) + absolute_change
+    relative_change = (capped_reform - capped_baseline) / capped_baseline
+    ascending_bounds = [
+        -LARGE_CHANGE_THRESHOLD,
+        -NO_CHANGE_THRESHOLD,
+        NO_CHANGE_THRESHOLD,
+        LARGE_CHANGE_THRESHOLD,
+    ]
+    # searchsorted counts up from the largest loss; OUTCOMES counts down
+    outcome = np.searchsorted(ascending_bounds, relative_change, side="left")
+    return len(OUTCOMES) - 1 - outcome
+
+
+def weighted_gini(values: np.ndarray, weights: np.ndarray) -> float:
+    """
+    Weighted Gini coefficient of values (trapezoidal Lorenz area).
+
+    Ties in values are ordered by weight, so the result does not depend on
+    the order of the inputs.
+    """
+    order = np.lexsort((weights, values))
+    values, weights = values[order], weights[order]
+    cumulative_income = np.cumsum(values * weights)
+    previous_income = np.concatenate([[0.0], cumulative_income[:-1]])
+    total_weight = weights.sum()
+    if len(values) == 0 or total_weight == 0 or cumulative_income[-1] == 0:
+        return 0.0
+    return float(
+        1
+        - np.sum(weights * (previous_income + cumulative_income))
+        / (total_weight * cumulative_income[-1])
+    )
+
+
+# Layout of the weighted sums kept by StatewideAccumulator
+_SUM_SLICES = {
+    "decile_people": slice(0, 10),
+    "outcome_people": slice(10, 10 + len(OUTCOMES) * 10),
+    "decile_households": slice(60, 70),
+    "decile_change": slice(70, 80),
+    "households": 80,
+    "people": 81,
+    "change": 82,
+    "revenue_change": 83,
+    "baseline_in_poverty": 84,
+    "reform_in_poverty": 85,
+    "baseline_in_deep_poverty": 86,
+    "reform_in_deep_poverty": 87,
+}
+_SUM_COLUMNS = 88
+
+# Gini index income bins: 4,000 log-spaced bins per sign from $1 to $1bn of
+# equivalised net income (each about 0.5% wide), one bin from -$1 to $1 and
+# one beyond each end
+_GINI_POSITIVE_EDGES = np.geomspace(1, 1e9, 4_001)
+GINI_BIN_EDGES = np.concatenate([-_GINI_POSITIVE_EDGES[::-1], _GINI_POSITIVE_EDGES])
+_GINI_BINS = len(GINI_BIN_EDGES) + 1
+
+# People weight and weighted income per Gini bin, for each scenario, follow
+# the fixed sums
+_GINI_SLICES = {
+    f"{scenario}_{part}": slice(
+        _SUM_COLUMNS + index * _GINI_BINS, _SUM_COLUMNS + (index + 1) * _GINI_BINS
+    )
+    for index, (scenario, part) in enumerate(
+        (scenario, part)
+        for scenario in ("baseline", "reform")
+        for part in ("weight", "income")
+    )
+}
+_STATE_COLUMNS = _SUM_COLUMNS + 4 * _GINI_BINS
+
+# Every finite float64 is an integer multiple of 2**-1074
+_FLOAT_UNIT_BITS = 1074
+
+
+class _ExactSums:
+    """
+    Running totals of float64 vectors held exactly as Python integers in
+    units of 2**-1074, so they do not depend on the order values are added.
+    """
+
+    def __init__(self, size: int):
+        self.units = [0] * size
+
+    def add(self, values: np.ndarray) -> None:
+        for index in np.flatnonzero(values).tolist():
+            numerator, denominator = float(values[index]).as_integer_ratio()
+            shift = _FLOAT_UNIT_BITS - (denominator.bit_length() - 1)
+            self.units[index] += numerator << shift
+
+    def merge(self, other: "_ExactSums") -> None:
+        self.units = [a + b for a, b in zip(self.units, other.units)]
+
+    def totals(self) -> np.ndarray:
+        """Totals as float64, each correctly rounded from its exact value."""
+        # int / int true division rounds correctly
+        return np.array([units / (1 << _FLOAT_UNIT_BITS) for units in self.units])
+
+    def encode(self) -> np.ndarray:
+        """Totals as one hex string, storable without pickling."""
+        return np.array(",".join(format(units, "x") for units in self.units))
+
+    @classmethod
+    def decode(cls, encoded: np.ndarray) -> "_ExactSums":
+        units = [int(text, 16) for text in str(encoded).split(",")]
+        sums = cls(len(units))
+        sums.units = units
+        return sums
+
+
+class StatewideAccumulator:
+    """
+    Streaming weighted aggregation of household results.
+
+    Feed chunks of household-level arrays to update(); result() returns the
+    statewide.py metrics. Chunks carrying a "decile" column (as stored
+    tables do) use it instead of ranking against decile_cutoffs.
+
+    Each chunk's weighted sums, and its people-weighted histogram of
+    equivalised net income over GINI_BIN_EDGES for the Gini index, are added
+    exactly to fixed-size running totals. State does not grow with the
+    number of households or chunks, and accumulators over disjoint sets of
+    chunks can be merged in any order with bit-identical results to one
+    accumulator over all of them (see summary, from_summaries and
+    shards.py).
+
+    The Gini index is computed from the histogram, treating each bin's
+    households as having the bin's mean income; with bins about 0.5% wide
+    this moves the relative Gini change by well under 0.0001 percentage
+    points, below the published rounding.
+    """
+
+    def __init__(self, decile_cutoffs: np.ndarray | None = None):
+        self.decile_cutoffs = decile_cutoffs
+        self.sums = _ExactSums(_STATE_COLUMNS)
+
+    def update(self, chunk: dict) -> None:
+        """
+        Add one chunk of household-level arrays. Compact columns are
+        widened to float64 one chunk at a time.
+        """
+
+        def column(name: str) -> np.ndarray:
+            return np.asarray(chunk[name], dtype=np.float64)
+
+        weight = column("weight")
+        person_weight = weight * column("people")
+        baseline = column("baseline_net_income")
+        reform = column("reform_net_income")
+        change = reform - baseline
+
+        if "decile" in chunk:
+            decile_index = chunk["decile"].astype(np.intp) - 1
+        else:
+            decile_index = (
+                assign_deciles(column(DECILE_RANKING_COLUMN), self.decile_cutoffs) - 1
+            )
+        outcome = classify_outcomes(baseline, reform)
+
+        sums = np.zeros(_STATE_COLUMNS)
+        sums[_SUM_SLICES["decile_people"]] = np.bincount(
+            decile_index, weights=person_weight, minlength=10
+        )
+        sums[_SUM_SLICES["outcome_people"]] = np.bincount(
+            outcome * 10 + decile_index,
+            weights=person_weight,
+            minlength=len(OUTCOMES) * 10,
+        )
+        sums[_SUM_SLICES["decile_households"]] = np.bincount(
+            decile_index, weights=weight, minlength=10
+        )
+        sums[_SUM_SLICES["decile_change"]] = np.bincount(
+            decile_index, weights=weight * change, minlength=10
+        )
+        sums[_SUM_SLICES["households"]] = weight.sum()
+        sums[_SUM_SLICES["people"]] = person_weight.sum()
+        sums[_SUM_SLICES["change"]] = np.sum(weight * change)
+        sums[_SUM_SLICES["revenue_change"]] = np.sum(
+            weight
+            * (column("reform_state_income_tax") - column("baseline_state_income_tax"))
+        )
+        for scenario in ("baseline", "reform"):
+            sums[_SUM_SLICES[f"{scenario}_in_poverty"]] = np.sum(
+                weight * column(f"{scenario}_in_poverty")
+            )
+            sums[_SUM_SLICES[f"{scenario}_in_deep_poverty"]] = np.sum(
+                weight * column(f"{scenario}_in_deep_poverty")
+            )
+            income = column(f"{scenario}_equiv_net_income")
+            gini_bin = np.searchsorted(GINI_BIN_EDGES, income, side="right")
+            sums[_GINI_SLICES[f"{scenario}_weight"]] = np.bincount(
+                gini_bin, weights=person_weight, minlength=_GINI_BINS
+            )
+            sums[_GINI_SLICES[f"{scenario}_income"]] = np.bincount(
+                gini_bin, weights=person_weight * income, minlength=_GINI_BINS
+            )
+        self.sums.add(sums)
+
+    def summary(self) -> dict:
+        """
+        Mergeable summary of the chunks seen so far.
+
+        Returns:
+            Dict with "sums": the exact running totals encoded as one string
+            array, so summaries save to .npz without pickling
+        """
+        return {"sums": self.sums.encode()}
+
+    @classmethod
+    def from_summaries(cls, summaries: list[dict]) -> "StatewideAccumulator":
+        """Combine summaries of disjoint chunks into one accumulator."""
+        accumulator = cls()
+        for summary in summaries:
+            accumulator.sums.merge(_ExactSums.decode(summary["sums"]))
+        return accumulator
+
+    def totals(self) -> dict:
+        """
+        Totals over every chunk, split per _SUM_SLICES and _GINI_SLICES,
+        each correctly rounded from its exact value.
+        """
+        column_totals = self.sums.totals()
+        slices = {**_SUM_SLICES, **_GINI_SLICES}
+        return {name: column_totals[index] for name, index in slices.items()}
+
+    def result(self) -> dict:
+        """
+        Return the metrics keyed by their statewide.py constant names,
+        rounded to the precision of the published constants.
+        """
+
+        def relative_change_pct(before: float, after: float) -> float:
+            return float((after - before) / before * 100) if before else 0.0
+
+        totals = self.totals()
+        outcome_people = totals["outcome_people"].reshape(len(OUTCOMES), 10)
+        results = {"DECILES": list(range(1, 11))}
+        decile_shares = (
+            outcome_people / np.maximum(totals["decile_people"], 1e-12) * 100
+        )
+        for index, (decile_name, all_name) in enumerate(OUTCOMES):
+            results[decile_name] = np.round(decile_shares[index], 1).tolist()
+            results[all_name] = round(
+                float(math.fsum(outcome_people[index]) / totals["people"] * 100), 1
+            )
+        results["AVG_IMPACT_BY_DECILE"] = [
+            int(value)
+            for value in np.round(
+                totals["decile_change"] / np.maximum(totals["decile_households"], 1e-12)
+            )
+        ]
+        results["REVENUE_IMPACT_MILLIONS"] = round(
+            float(totals["revenue_change"]) / 1e6, 1
+        )
+        results["PERCENT_BENEFITING"] = round(
+            results["ALL_GAIN_MORE_THAN_5PCT"] + results["ALL_GAIN_LESS_THAN_5PCT"], 1
+        )
+        results["POVERTY_IMPACT_PCT"] = round(
+            relative_change_pct(
+                totals["baseline_in_poverty"], totals["reform_in_poverty"]
+            ),
+            1,
+        )
+        results["DEEP_POVERTY_IMPACT_PCT"] = round(
+            relative_change_pct(
+                totals["baseline_in_deep_poverty"], totals["reform_in_deep_poverty"]
+            ),
+            1,
+        )
+        gini = {}
+        for scenario in ("baseline", "reform"):
+            weight = totals[f"{scenario}_weight"]
+            occupied = weight > 0
+            gini[scenario] = weighted_gini(
+                totals[f"{scenario}_income"][occupied] / weight[occupied],
+                weight[occupied],
+            )
+        results["GINI_IMPACT_PCT"] = round(
+            relative_change_pct(gini["baseline"], gini["reform"]), 2
+        )
+        results["AVG_BENEFIT_PER_HOUSEHOLD"] = int(
+            round(totals["change"] / totals["households"])
+        )
+        return results
+
+
+def aggregate_household_results(
+    results: dict, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> dict:
+    """
+    Aggregate household-level results into the statewide.py metrics.
+
+    Deciles are ranked on baseline equivalised household net income,
+    weighted by people, unless results already has a "decile" column.
+
+    Args:
+        results: Household-level arrays as returned by load_household_results
+            or store.open_household_table
+        chunk_size: Rows aggregated per chunk
+
+    Returns:
+        Dict keyed by the statewide.py constant names
+    """
+    cutoffs = None
+    if "decile" not in results:
+        cutoffs = weighted_decile_cutoffs(
+            np.asarray(results[DECILE_RANKING_COLUMN], dtype=np.float64),
+            np.asarray(results["weight"], dtype=np.float64) * results["people"],
+        )
+    accumulator = StatewideAccumulator(cutoffs)
+    for chunk in iter_chunks(results, chunk_size):
+        accumulator.update(chunk)
+    return accumulator.result()
+
+
+def compute_statewide_impacts(
+    year: int = 2026,
+    dataset: str | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict:
+    """
+    Compute the statewide.py metrics from microdata.
+
+    Reads the memory-mapped household table from store.household_table,
+    materializing it on first use.
+
+    Args:
+        year: Tax year to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        chunk_size: Rows aggregated per chunk
+
+    Returns:
+        Dict keyed by the statewide.py constant names, usable as the
+        impacts argument of the statewide chart builders
+    """
+    from .store import household_table
+
+    return aggregate_household_results(household_table(year, dataset), chunk_size)
@@ -0,0 +1,126 @@
+"""Compact chart payloads: point reduction and typed-array encoding."""
+
+import base64
+import json
+
+import numpy as np
+
+# Plotly.js typed array dtype codes (little-endian)
+TYPED_ARRAY_DTYPES = {
+    np.dtype("int8"): "i1",
+    np.dtype("uint8"): "u1",
+    np.dtype("int16"): "i2",
+    np.dtype("uint16"): "u2",
+    np.dtype("int32"): "i4",
+    np.dtype("uint32"): "u4",
+    np.dtype("float32"): "f4",
+    np.dtype("float64"): "f8",
+}
+
+
+def reduce_piecewise_linear(
+    x: np.ndarray, y: np.ndarray, tolerance: float = 0.01
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Keep only the points needed to redraw a polyline within a tolerance.
+
+    Uses Ramer-Douglas-Peucker on vertical distance: a segment is split at
+    its worst point until every dropped point lies within tolerance of the
+    straight line between its kept neighbours. For an exactly
+    piecewise-linear series this keeps the endpoints and kinks only.
+
+    Args:
+        x: Increasing x values
+        y: y values, same length as x
+        tolerance: Largest allowed vertical error, in y units
+
+    Returns:
+        Tuple of (x, y) arrays holding the kept points
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) <= 2:
+        return x, y
+
+    keep = np.zeros(len(x), dtype=bool)
+    keep[[0, -1]] = True
+    segments = [(0, len(x) - 1)]
+    while segments:
+        start, end = segments.pop()
+        if end - start < 2:
+            continue
+        inner = slice(start + 1, end)
+        slope = (y[end] - y[start]) / (x[end] - x[start])
+        chord = y[start] + slope * (x[inner] - x[start])
+        errors = np.abs(y[inner] - chord)
+        worst = int(np.argmax(errors))
+        if errors[worst] > tolerance:
+            split = start + 1 + worst
+            keep[split] = True
+            segments.append((start, split))
+            segments.append((split, end))
+    return x[keep], y[keep]
+
+
+def encode_typed_array(values: np.ndarray) -> dict:
+    """
+    Encode a numeric array as a Plotly typed array ({"dtype", "bdata"}).
+
+    int64 arrays are narrowed to int32 when their range allows and widened
+    to float64 otherwise, since Plotly.js has no 64-bit integer type.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iu" and values.dtype not in TYPED_ARRAY_DTYPES:
+        info = np.iinfo(np.int32)
+        fits = values.size == 0 or (
+            values.min() >= info.min and values.max() <= info.max
+        )
+        values = values.astype(np.int32 if fits else np.float64)
+    elif values.dtype.kind == "f" and values.dtype not in TYPED_ARRAY_DTYPES:
+        values = values.astype(np.float64)
+    values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+    encoded = {
+        "dtype": TYPED_ARRAY_DTYPES[values.dtype.newbyteorder("=")],
+        "bdata": base64.b64encode(values.tobytes()).decode("ascii"),
+    }
+    if values.ndim > 1:
+        encoded["shape"] = ",".join(str(size) for size in values.shape)
+    return encoded
+
+
+def _encode_arrays(value):
+    """Recursively replace numeric NumPy arrays with typed arrays."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in "iuf":
+            return encode_typed_array(value)
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: _encode_arrays(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_arrays(item) for item in value]
+    return value
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def figure_payload(fig) -> tuple[str, str]:
+    """
+    Serialize a Plotly figure's data and layout to JSON in a single pass,
+    writing numeric arrays as base64 typed arrays.
+
+    Args:
+        fig: plotly.graph_objects.Figure, or a figure spec dict with "data"
+            and "layout" such as the figures.py builders return
+
+    Returns:
+        Tuple of (data_json, layout_json) strings for Plotly.newPlot
+    """
+    spec = _encode_arrays(fig if isinstance(fig, dict) else fig.to_plotly_json())
+    return (
+        json.dumps(spec["data"], separators=(",", ":"), default=_json_default),
+        json.dumps(spec["layout"], separators=(",", ":"), default=_json_default),
+    )
@@ -0,0 +1,251 @@
+"""Stage-level tracing emitted as Chrome/Perfetto trace JSON.
+
+Wrap stages with the span() context manager or the traced() decorator.
+Tracing is off unless UTAH_SB60_PROFILE is set to a trace file path ("1"
+uses output/trace.json) or enable() is called, e.g. by generate_post.py
+--profile; when off, spans cost one flag check. The trace is written when
+the main process exits, or earlier by calling write_trace().
+
+Each span records wall time, CPU time and the process's peak resident
+memory so far (process_peak_rss_mb: the lifetime high-water mark at span
+exit, not the memory the span itself used). Spans are buffered in memory;
+worker processes write theirs once, at exit, to <trace>.parts/<pid>.jsonl,
+and write_trace() merges them with the main process's buffer.
+"""
+
+import atexit
+import functools
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ENV_VAR = "UTAH_SB60_PROFILE"
+DEFAULT_TRACE_PATH = "output/trace.json"
+
+_trace_path = None
+_written = False
+
+# Spans recorded by this process, and the process that owns the buffer: a
+# forked worker starts with a copy of its parent's, which it discards
+_events = []
+_events_pid = None
+
+
+def _spool_dir() -> Path:
+    return _trace_path.with_name(_trace_path.name + ".parts")
+
+
+def _configure(value: str | None) -> None:
+    global _trace_path
+    if value and value.lower() not in ("0", "false", "off"):
+        _trace_path = Path(DEFAULT_TRACE_PATH if value == "1" else value)
+    else:
+        _trace_path = None
+        return
+    # Worker processes only spool; the main process owns the trace file
+    if multiprocessing.parent_process() is None:
+        spool = _spool_dir()
+        if spool.exists():
+            for part in spool.glob("*.jsonl"):
+                part.unlink()
+        atexit.register(_write_at_exit)
+
+
+def enabled() -> bool:
+    return _trace_path is not None
+
+
+def enable(path: str = DEFAULT_TRACE_PATH) -> None:
+    """
+    Turn tracing on for this process and any it starts, discarding spans
+    spooled by earlier runs to the same trace path.
+    """
+    os.environ[ENV_VAR] = str(path)
+    _configure(str(path))
+
+
+def process_peak_rss_mb() -> float | None:
+    """
+    Peak resident memory of this process since it started, in MiB (None
+    where the platform does not report it).
+    """
+    if resource is None:
+        return None
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _record(event: dict) -> None:
+    global _events_pid
+    pid = os.getpid()
+    if _events_pid != pid:
+        _events.clear()
+        _events_pid = pid
+        # multiprocessing workers skip atexit but run finalizers on exit
+        if multiprocessing.parent_process() is not None:
+            multiprocessing.util.Finalize(None, _flush_spool, exitpriority=0)
+    _events.append(event)
+
+
+def _flush_spool() -> None:
+    """Write a worker's buffered spans to its spool file in one go."""
+    if not _events or _trace_path is None:
+        return
+    spool = _spool_dir()
+    spool.mkdir(parents=True, exist_ok=True)
+    with open(spool / f"{os.getpid()}.jsonl", "a") as f:
+        f.writelines(json.dumps(event) + "\n" for event in _events)
+    _events.clear()
+
+
+@contextmanager
+def _traced_span(name: str, args: dict):
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        _record(
+            {
+                "name": name,
+                "cat": "utah_sb60",
+                "ph": "X",
+                "ts": (time.time() - wall) * 1e6,
+                "dur": wall * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": {
+                    **args,
+                    "cpu_ms": cpu * 1e3,
+                    "process_peak_rss_mb": process_peak_rss_mb(),
+                },
+            }
+        )
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, **args):
+    """
+    Context manager timing the enclosed block as one trace span.
+
+    Args:
+        name: Span name shown in the trace and summary
+        **args: Extra JSON-serializable details attached to the span
+    """
+    if _trace_path is None:
+        return _NULL_SPAN
+    return _traced_span(name, args)
+
+
+def traced(name: str | None = None):
+    """Decorator recording each call of a function as a span."""
+
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _trace_path is None:
+                return func(*args, **kwargs)
+            with _traced_span(label, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def collect_events() -> list[dict]:
+    """Every span recorded by this process and spooled by its workers."""
+    events = list(_events) if _events_pid == os.getpid() else []
+    for part in sorted(_spool_dir().glob("*.jsonl")):
+        with open(part) as f:
+            events.extend(json.loads(line) for line in f if line.strip())
+    return sorted(events, key=lambda event: event["ts"])
+
+
+def summarize(events: list[dict]) -> list[dict]:
+    """
+    Aggregate spans by name: calls, wall and CPU totals, and the highest
+    process peak memory seen at the end of any of them.
+    """
+    summary = {}
+    for event in events:
+        row = summary.setdefault(
+            event["name"],
+            {
+                "name": event["name"],
+                "calls": 0,
+                "wall_ms": 0.0,
+                "cpu_ms": 0.0,
+                "process_peak_rss_mb": 0.0,
+            },
+        )
+        row["calls"] += 1
+        row["wall_ms"] += event["dur"] / 1e3
+        row["cpu_ms"] += event["args"]["cpu_ms"]
+        row["process_peak_rss_mb"] = max(
+            row["process_peak_rss_mb"], event["args"]["process_peak_rss_mb"] or 0.0
+        )
+    return sorted(summary.values(), key=lambda row: row["wall_ms"], reverse=True)
+
+
+def print_summary(events: list[dict]) -> None:
+    print(
+        f"{'span':<40} {'calls':>5} {'wall ms':>10} {'cpu ms':>10} "
+        f"{'proc peak MB':>12}"
+    )
+    for row in summarize(events):
+        print(
+            f"{row['name']:<40} {row['calls']:>5} {row['wall_ms']:>10.1f} "
+            f"{row['cpu_ms']:>10.1f} {row['process_peak_rss_mb']:>12.0f}"
+        )
+
+
+def write_trace() -> Path | None:
+    """
+    Merge spooled spans into the Chrome trace file and print a summary.
+
+    Returns:
+        Path of the trace file, or None when tracing is off
+    """
+    global _written
+    if _trace_path is None:
+        return None
+    _written = True
+    events = collect_events()
+    _trace_path.parent.mkdir(parents=True, exist_ok=True)
+    _trace_path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}))
+    print_summary(events)
+    print(f"Wrote trace to {_trace_path} (open in ui.perfetto.dev or chrome://tracing)")
+    return _trace_path
+
+
+def _write_at_exit() -> None:
+    if not _written:
+        write_trace()
+
+
+_configure(os.environ.get(ENV_VAR))
@@ -0,0 +1,92 @@
+"""Multi-year projections: statewide impacts of SB60 over a budget window.
+
+Each scenario's tax-benefit system and dataset are loaded once and every
+year is calculated from that one simulation, years running concurrently in
+forked worker processes (see microdata.simulate_scenario_years).
+
+Usage:
+    python -m utah_sb60.projection 2026 2035 --jobs 4 --output projection.csv
+"""
+
+import argparse
+
+import pandas as pd
+
+from .microdata import (
+    DEFAULT_CHUNK_SIZE,
+    aggregate_household_results,
+    combine_scenarios,
+    simulate_scenario_years,
+)
+from .reform import SB60_BASELINE_PARAMETERS, SB60_REFORM_PARAMETERS
+from .sweep import metrics_row
+
+# Ten-year budget window starting when SB60 takes effect
+DEFAULT_START_YEAR = 2026
+DEFAULT_END_YEAR = 2035
+
+
+def project_statewide_impacts(
+    years: list[int],
+    dataset: str | None = None,
+    jobs: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """
+    Compute the statewide.py metrics for each year in years.
+
+    Args:
+        years: Tax years to simulate, e.g. range(2026, 2036)
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        jobs: Worker processes per scenario; None uses os.cpu_count(), 1 runs
+            inline
+        chunk_size: Rows aggregated per chunk
+
+    Returns:
+        DataFrame indexed by year with the same columns as sweep.run_rate_sweep
+        (without "rate")
+    """
+    years = list(years)
+    baseline = simulate_scenario_years(SB60_BASELINE_PARAMETERS, years, dataset, jobs)
+    reform = simulate_scenario_years(SB60_REFORM_PARAMETERS, years, dataset, jobs)
+    rows = [
+        metrics_row(
+            aggregate_household_results(
+                combine_scenarios(baseline[year], reform[year]), chunk_size
+            )
+        )
+        for year in years
+    ]
+    return pd.DataFrame(rows, index=pd.Index(years, name="year"))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Statewide impacts of Utah SB60 over a budget window."
+    )
+    parser.add_argument("start_year", type=int, nargs="?", default=DEFAULT_START_YEAR)
+    parser.add_argument("end_year", type=int, nargs="?", default=DEFAULT_END_YEAR)
+    parser.add_argument("--dataset", help="PolicyEngine-US dataset to simulate")
+    parser.add_argument("--jobs", type=int, help="Worker processes")
+    parser.add_argument("--output", help="Write the table to this CSV file")
+    parser.add_argument(
+        "--chart", help="Write the budget window chart to this HTML file"
+    )
+    args = parser.parse_args(argv)
+
+    table = project_statewide_impacts(
+        range(args.start_year, args.end_year + 1), args.dataset, args.jobs
+    )
+    print(table.to_string())
+    if args.output:
+        table.to_csv(args.output)
+        print(f"Generated {args.output}")
+    if args.chart:
+        from .charts import create_budget_window_chart
+
+        create_budget_window_chart(table).write_html(args.chart)
+        print(f"Generated {args.chart}")
+
+
+if __name__ == "__main__":
+    main()
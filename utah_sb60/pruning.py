@@ -0,0 +1,248 @@
+"""Affected-household pruning for reform microsimulations.
+
+Utah income tax after non-refundable credits is non-decreasing in the flat
+rate: tax before credits is max(taxable income * rate, 0), and the taxpayer
+and other non-refundable credits are subtracted with a floor at zero. So
+under a rate cut, a tax unit with no Utah tax before refundable credits in
+the baseline also has none under the reform, and nothing else in the
+household changes. Households outside Utah are never needed at all.
+
+The reform is therefore simulated only for Utah households with positive
+baseline liability; every other household keeps its baseline values. Use
+validate_pruning (or --validate) to check this against a full reform run.
+
+Usage:
+    python -m utah_sb60.pruning --year 2026 --validate
+"""
+
+import argparse
+import gc
+
+import numpy as np
+
+from .microdata import (
+    SCENARIO_COLUMNS,
+    _household_values,
+    build_microsimulation,
+    scenario_columns,
+)
+from .profiling import span
+from .reform import SB60_BASELINE_PARAMETERS, SB60_REFORM_PARAMETERS
+
+RATE_PARAMETER = "gov.states.ut.tax.income.rate"
+
+# Baseline liability that marks a tax unit as affected by a rate cut
+LIABILITY_VARIABLE = "ut_income_tax_before_refundable_credits"
+
+
+def is_rate_cut(baseline_parameters: dict, reform_parameters: dict) -> bool:
+    """
+    True when both scenarios only set the Utah rate, over the same periods,
+    and the reform's rate is nowhere higher than the baseline's.
+    """
+    if set(baseline_parameters) != {RATE_PARAMETER} or set(reform_parameters) != {
+        RATE_PARAMETER
+    }:
+        return False
+    baseline = baseline_parameters[RATE_PARAMETER]
+    reform = reform_parameters[RATE_PARAMETER]
+    return baseline.keys() == reform.keys() and all(
+        reform[period] <= baseline[period] for period in baseline
+    )
+
+
+def affected_households(sim, year: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the Utah households a rate cut can affect in a baseline simulation.
+
+    Returns:
+        Tuple of (household_ids, affected): IDs of Utah households in
+        scenario_columns order, and a boolean array marking those with
+        positive Utah tax before refundable credits
+    """
+    in_utah = _household_values(sim, "state_code_str", year) == "UT"
+    household_ids = _household_values(sim, "household_id", year)[in_utah]
+    liability = _household_values(sim, LIABILITY_VARIABLE, year)[in_utah]
+    return household_ids, liability > 0
+
+
+def input_subset(sim, household_ids: np.ndarray):
+    """
+    The simulation's input data restricted to some households, in the
+    person-level DataFrame form Microsimulation accepts as a dataset.
+
+    Person IDs and entity memberships are added from the simulation's
+    populations when the dataset supplied them outside its input variables.
+    """
+    inputs = sim.to_input_dataframe()
+    period = sim.dataset.time_period
+
+    def add_structure(name: str, values: np.ndarray) -> None:
+        if not any(column.split("__")[0] == name for column in inputs.columns):
+            inputs[f"{name}__{period}"] = values
+
+    add_structure("person_id", sim.persons.ids)
+    for entity in sim.tax_benefit_system.group_entities:
+        population = sim.populations[entity.key]
+        add_structure(
+            f"person_{entity.key}_id", population.ids[population.members_entity_id]
+        )
+    (column,) = [c for c in inputs.columns if c.split("__")[0] == "person_household_id"]
+    keep = np.isin(inputs[column].to_numpy(), household_ids)
+    return inputs[keep].reset_index(drop=True)
+
+
+def simulate_pruned_scenarios(
+    year: int = 2026,
+    dataset: str | None = None,
+    baseline_parameters: dict = SB60_BASELINE_PARAMETERS,
+    reform_parameters: dict = SB60_REFORM_PARAMETERS,
+    compact: bool = False,
+) -> tuple[dict, dict, np.ndarray]:
+    """
+    Simulate the baseline over the microdata and the reform over affected
+    Utah households only, scattering reform results back to full size.
+
+    Args:
+        year: Tax year to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        baseline_parameters: Baseline reform parameter changes
+        reform_parameters: Reform parameter changes; must be a rate cut
+            relative to baseline_parameters (see is_rate_cut)
+        compact: Return COMPACT_DTYPES columns (see scenario_columns), and
+            free the baseline simulation before the reform subset loads
+
+    Returns:
+        Tuple of (baseline, reform, affected): dicts of household-level
+        arrays for Utah households as simulate_scenario returns, and the
+        boolean mask of households the reform was simulated for
+    """
+    from policyengine_us import Microsimulation
+
+    from .snapshot import tax_benefit_system
+
+    if not is_rate_cut(baseline_parameters, reform_parameters):
+        raise ValueError("Pruning only applies to cuts in the Utah income tax rate")
+
+    baseline_sim = build_microsimulation(baseline_parameters, dataset)
+    baseline = scenario_columns(baseline_sim, year, compact)
+    household_ids, affected = affected_households(baseline_sim, year)
+    subset_inputs = (
+        input_subset(baseline_sim, household_ids[affected]) if affected.any() else None
+    )
+    del baseline_sim
+    if compact:
+        gc.collect()
+
+    reform = {column: values.copy() for column, values in baseline.items()}
+    if affected.any():
+        with span("simulate affected households", households=int(affected.sum())):
+            subset_sim = Microsimulation(
+                dataset=subset_inputs,
+                tax_benefit_system=tax_benefit_system(reform_parameters),
+            )
+            subset = scenario_columns(subset_sim, year, compact)
+            subset_ids = _household_values(subset_sim, "household_id", year)[
+                _household_values(subset_sim, "state_code_str", year) == "UT"
+            ]
+        order = np.argsort(subset_ids)
+        found = np.searchsorted(subset_ids, household_ids[affected], sorter=order)
+        positions = order[found]
+        if not np.array_equal(subset_ids[positions], household_ids[affected]):
+            raise ValueError("Affected households are missing from the reform subset")
+        for column in SCENARIO_COLUMNS:
+            values = subset[column][positions]
+            if values.dtype != reform[column].dtype:
+                # compact_array kept one scenario's column wider than the other's
+                dtype = np.result_type(reform[column], values)
+                reform[column] = reform[column].astype(dtype)
+            reform[column][affected] = values
+        if compact:
+            del subset_sim, subset
+            gc.collect()
+    return baseline, reform, affected
+
+
+def pruned_household_results(
+    year: int = 2026, dataset: str | None = None, compact: bool = False
+) -> dict:
+    """
+    load_household_results with the reform simulated only for affected
+    households. Both scenarios are cached like simulate_scenario's.
+    """
+    from .cache import lookup, store
+    from .microdata import combine_scenarios
+
+    baseline_spec = {"dataset": dataset, "parameters": SB60_BASELINE_PARAMETERS}
+    reform_spec = {
+        "dataset": dataset,
+        "parameters": SB60_REFORM_PARAMETERS,
+        "pruned_against": SB60_BASELINE_PARAMETERS,
+    }
+    if compact:
+        baseline_spec["compact"] = reform_spec["compact"] = True
+    baseline = lookup("scenario_results", baseline_spec, year)
+    reform = lookup("pruned_scenario_results", reform_spec, year)
+    if baseline is None or reform is None:
+        baseline, reform, _ = simulate_pruned_scenarios(year, dataset, compact=compact)
+        store("scenario_results", baseline_spec, year, baseline)
+        store("pruned_scenario_results", reform_spec, year, reform)
+    return combine_scenarios(baseline, reform)
+
+
+def validate_pruning(
+    year: int = 2026, dataset: str | None = None, atol: float = 1e-6
+) -> dict:
+    """
+    Compare pruned reform results with a full reform simulation.
+
+    Args:
+        year: Tax year to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        atol: Largest absolute difference accepted per household
+
+    Returns:
+        Dict with "max_abs_diff" per column, "affected" and "households"
+        counts and "passed"
+    """
+    from .microdata import simulate_scenario
+
+    _, pruned, affected = simulate_pruned_scenarios(year, dataset)
+    full = simulate_scenario(SB60_REFORM_PARAMETERS, year, dataset)
+    differences = {
+        column: float(np.max(np.abs(pruned[column] - full[column]), initial=0.0))
+        for column in ["weight", "people", *SCENARIO_COLUMNS]
+    }
+    return {
+        "max_abs_diff": differences,
+        "affected": int(affected.sum()),
+        "households": len(affected),
+        "passed": all(difference <= atol for difference in differences.values()),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Simulate SB60 for affected Utah households only."
+    )
+    parser.add_argument("--year", type=int, default=2026)
+    parser.add_argument("--dataset", help="PolicyEngine-US dataset to simulate")
+    parser.add_argument(
+        "--validate", action="store_true", help="Compare against a full reform run"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.validate:
+        results = pruned_household_results(args.year, args.dataset)
+        print(f"Simulated {len(results['weight']):,} Utah households")
+        return 0
+    report = validate_pruning(args.year, args.dataset)
+    print(f"Affected households: {report['affected']:,} of {report['households']:,}")
+    for column, difference in report["max_abs_diff"].items():
+        print(f"{column:<20} max abs diff {difference:.3g}")
+    print("PASS" if report["passed"] else "FAIL")
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
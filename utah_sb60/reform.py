@@ -1,9 +1,41 @@
-"""Utah SB60 reform definition."""
+"""Utah SB60 reform definition.
 
-from policyengine_core.reforms import Reform
+The rates and parameter changes are plain constants. The Reform objects
+need policyengine_core, which is imported only when one is first used.
+"""
 
-# Define the reform: reduce Utah income tax rate from 4.5% to 4.45%
-ut_sb60_reform = Reform.from_dict(
-    {"gov.states.ut.tax.income.rate": {"2026-01-01.2100-12-31": 0.0445}},
-    country_id="us",
-)
+# Utah flat income tax rate under SB60 and before it
+SB60_RATE = 0.0445
+PRE_SB60_RATE = 0.045
+
+
+def rate_parameters(rate: float) -> dict:
+    """Return reform parameter changes setting the Utah income tax rate."""
+    return {"gov.states.ut.tax.income.rate": {"2026-01-01.2100-12-31": rate}}
+
+
+def make_rate_reform(rate: float):
+    """Build an SB60-style reform setting the Utah income tax rate."""
+    from policyengine_core.reforms import Reform
+
+    return Reform.from_dict(rate_parameters(rate), country_id="us")
+
+
+# Parameter changes for the reform: reduce Utah income tax rate from 4.5% to 4.45%
+SB60_REFORM_PARAMETERS = rate_parameters(SB60_RATE)
+
+# Pre-SB60 rate, pinned so comparisons stay meaningful once current law in
+# policyengine-us already includes the 4.45% rate
+SB60_BASELINE_PARAMETERS = rate_parameters(PRE_SB60_RATE)
+
+# Reform objects built on first access: name -> rate
+_REFORMS = {"ut_sb60_reform": SB60_RATE, "ut_sb60_baseline": PRE_SB60_RATE}
+
+
+def __getattr__(name: str):
+    if name not in _REFORMS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = make_rate_reform(_REFORMS[name])
+    # Cache on the module so later lookups skip __getattr__
+    globals()[name] = value
+    return value
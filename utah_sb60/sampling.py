@@ -0,0 +1,138 @@
+"""Adaptive sampling of piecewise-linear curves.
+
+Instead of evaluating a curve at thousands of evenly spaced points, start
+from a coarse grid and refine only the intervals where the curve bends,
+evaluating each round's new points in one batched call. Kinks are then
+snapped to the intersection of the straight segments on either side.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+from .payload import reduce_piecewise_linear
+
+
+def _chord_errors(x: np.ndarray, y: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+    """Largest vertical distance from each [start, end] chord to points inside."""
+    errors = np.zeros(len(starts))
+    for index, (start, end) in enumerate(zip(starts, ends)):
+        if end - start < 2:
+            continue
+        inner = slice(start + 1, end)
+        slope = (y[end] - y[start]) / (x[end] - x[start])
+        chord = y[start] + slope * (x[inner] - x[start])
+        errors[index] = np.max(np.abs(y[inner] - chord))
+    return errors
+
+
+def adaptive_sample(
+    func: Callable[[np.ndarray], np.ndarray],
+    min_x: float,
+    max_x: float,
+    tolerance: float = 0.01,
+    min_step: float = 1.0,
+    initial_points: int = 17,
+    splits: int = 8,
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Sample a piecewise-linear function with as few evaluations as possible.
+
+    Each round splits every interval whose interior samples stray more than
+    tolerance from its chord into splits sub-intervals, and evaluates all
+    new points in one call to func. Refinement stops at intervals narrower
+    than min_step. Each remaining bend is then snapped to the intersection
+    of the straight segments on either side of it, which for an exactly
+    piecewise-linear curve is the kink itself.
+
+    Args:
+        func: Vectorized function mapping an array of x to an array of y;
+            called once per round
+        min_x: Lower end of the range
+        max_x: Upper end of the range
+        tolerance: Largest allowed vertical error, in y units
+        min_step: Narrowest interval that is still refined
+        initial_points: Evenly spaced points in the first round
+        splits: Sub-intervals each refined interval is split into
+
+    Returns:
+        Tuple of (x, y, evaluations): the minimal point set reproducing the
+        curve within tolerance, and how many points func was evaluated at
+    """
+    x = np.linspace(min_x, max_x, initial_points)
+    y = np.asarray(func(x), dtype=np.float64)
+    evaluations = len(x)
+    # Coarse grid points only bracket bends; every interval starts unchecked
+    suspect = np.ones(len(x) - 1, dtype=bool)
+
+    while True:
+        widths = np.diff(x)
+        refine = suspect & (widths > min_step)
+        if not refine.any():
+            break
+        starts = x[:-1][refine]
+        new_x = (
+            starts[:, None]
+            + widths[refine][:, None] * np.arange(1, splits)[None, :] / splits
+        ).ravel()
+        new_y = np.asarray(func(new_x), dtype=np.float64)
+        evaluations += len(new_x)
+
+        order = np.argsort(np.concatenate([x, new_x]), kind="stable")
+        x = np.concatenate([x, new_x])[order]
+        y = np.concatenate([y, new_y])[order]
+        # An interval is suspect when the curve bends inside or at either
+        # end of it: the chord over it and its neighbours misses a sample
+        previous = np.arange(len(x) - 1)
+        errors = _chord_errors(
+            x, y, np.maximum(previous - 1, 0), np.minimum(previous + 2, len(x) - 1)
+        )
+        suspect = errors > tolerance
+
+    x, y = reduce_piecewise_linear(x, y, tolerance)
+    x, y, snapped = _snap_kinks(func, x, y, tolerance)
+    return x, y, evaluations + snapped
+
+
+def _snap_kinks(func, x: np.ndarray, y: np.ndarray, tolerance: float):
+    """
+    Replace each pair of points bracketing a bend with the intersection of
+    the outer segments' lines, when func confirms the curve passes through
+    it.
+    """
+    if len(x) < 4:
+        return x, y, 0
+    slopes = np.diff(y) / np.diff(x)
+    candidates = []
+    for index in range(1, len(x) - 2):
+        left, right = slopes[index - 1], slopes[index + 1]
+        if np.isclose(left, right):
+            continue
+        # Lines through (x[i], y[i]) with the left slope and through
+        # (x[i+1], y[i+1]) with the right slope
+        kink = (y[index + 1] - y[index] + left * x[index] - right * x[index + 1]) / (
+            left - right
+        )
+        # Adjacent candidates would both claim x[index]; keep the first
+        if x[index] < kink < x[index + 1] and not (
+            candidates and candidates[-1][0] == index - 1
+        ):
+            candidates.append((index, kink))
+    if not candidates:
+        return x, y, 0
+
+    indices = np.array([index for index, _ in candidates])
+    kinks = np.array([kink for _, kink in candidates])
+    values = np.asarray(func(kinks), dtype=np.float64)
+    # Confirmed kinks lie on the left segment's line and replace the two
+    # points bracketing them
+    expected = y[indices] + slopes[indices - 1] * (kinks - x[indices])
+    confirmed = np.abs(values - expected) <= tolerance
+    keep = np.ones(len(x), dtype=bool)
+    keep[indices[confirmed]] = False
+    keep[indices[confirmed] + 1] = False
+    x = np.concatenate([x[keep], kinks[confirmed]])
+    y = np.concatenate([y[keep], values[confirmed]])
+    order = np.argsort(x, kind="stable")
+    x, y = reduce_piecewise_linear(x[order], y[order], tolerance)
+    return x, y, len(kinks)
@@ -0,0 +1,449 @@
+"""Household calculator HTTP service.
+
+Answers "what does SB60 do for my household?" with the same calculation as
+Figure 1 (household.calculate_ut_income_tax). Requests arriving within a
+short window are merged into one vectorized evaluation per filing status
+and dependent count, recent answers are kept in an LRU cache, and latency
+and throughput are reported at /metrics.
+
+Endpoints:
+    GET /household?employment_income=80000&filing_status=single&dependents=0
+    GET /metrics
+
+Usage:
+    python -m utah_sb60.service [--port 8060] [--window-ms 2] [--cache-size 100000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from .household import STANDARD_DEDUCTION, calculate_ut_income_tax
+from .reform import PRE_SB60_RATE, SB60_RATE
+
+DEFAULT_PORT = 8060
+
+# How long the first request of a batch waits for others to join it
+DEFAULT_WINDOW_SECONDS = 0.002
+
+# Largest batch evaluated at once; a full batch is flushed immediately
+DEFAULT_MAX_BATCH = 4096
+
+DEFAULT_CACHE_SIZE = 100_000
+
+# Latency samples kept for percentiles, and the throughput window
+LATENCY_SAMPLES = 10_000
+THROUGHPUT_WINDOW_SECONDS = 10.0
+
+MAX_DEPENDENTS = 20
+
+# Largest request body read (and discarded); requests carry no body
+MAX_BODY_BYTES = 64 * 1024
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Content Too Large",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+}
+
+# StreamReader.readline raises these for lines over the reader's limit
+# (64 KiB by default)
+_LINE_TOO_LONG = (ValueError, asyncio.LimitOverrunError)
+
+
+class LRUCache:
+    """
+    Fixed-size mapping evicting the least recently used key.
+
+    Args:
+        maxsize: Entries kept; 0 disables caching
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key):
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def evaluate_households(
+    employment_income: np.ndarray, filing_status: str, dependents: int
+) -> list[dict]:
+    """
+    Evaluate baseline and SB60 Utah income tax for many incomes sharing a
+    filing status and dependent count.
+
+    Returns:
+        One answer dict per income
+    """
+    income = np.asarray(employment_income, dtype=np.float64)
+    baseline = calculate_ut_income_tax(income, PRE_SB60_RATE, filing_status, dependents)
+    reform = calculate_ut_income_tax(income, SB60_RATE, filing_status, dependents)
+    return [
+        {
+            "employment_income": employment_income,
+            "filing_status": filing_status,
+            "dependents": dependents,
+            "baseline_ut_income_tax": round(baseline_tax, 2),
+            "reform_ut_income_tax": round(reform_tax, 2),
+            "net_income_change": round(baseline_tax - reform_tax, 2),
+        }
+        for employment_income, baseline_tax, reform_tax in zip(
+            income.tolist(), baseline.tolist(), reform.tolist()
+        )
+    ]
+
+
+class HouseholdBatcher:
+    """
+    Collect household queries for up to window seconds, then evaluate them
+    with one vectorized call per (filing_status, dependents) group.
+
+    Args:
+        window: Seconds the first query of a batch waits for others
+        max_batch: Queries that trigger an immediate flush
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW_SECONDS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: list[tuple[tuple, asyncio.Future]] = []
+        self._timer = None
+        self.batches = 0
+        self.batched_queries = 0
+
+    def submit(self, key: tuple) -> asyncio.Future:
+        """Queue (employment_income, filing_status, dependents); await the answer."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((key, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+        return future
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        self.batches += 1
+        self.batched_queries += len(pending)
+
+        groups: dict[tuple, list] = {}
+        for key, future in pending:
+            groups.setdefault(key[1:], []).append((key[0], future))
+        for (filing_status, dependents), items in groups.items():
+            incomes = np.fromiter((income for income, _ in items), dtype=np.float64)
+            try:
+                answers = evaluate_households(incomes, filing_status, dependents)
+            except Exception as error:
+                # Fail this group's queries rather than leave them waiting
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            for (_, future), answer in zip(items, answers):
+                if not future.done():
+                    future.set_result(answer)
+
+
+class ServiceMetrics:
+    """Request counts, latency percentiles and throughput."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.completed_at = deque()
+
+    def record(self, latency: float, ok: bool = True) -> None:
+        now = time.monotonic()
+        self.requests += 1
+        self.errors += not ok
+        self.latencies.append(latency)
+        self.completed_at.append(now)
+        while (
+            self.completed_at and self.completed_at[0] < now - THROUGHPUT_WINDOW_SECONDS
+        ):
+            self.completed_at.popleft()
+
+    def snapshot(self, cache: LRUCache, batcher: HouseholdBatcher) -> dict:
+        uptime = time.monotonic() - self.started
+        latencies_ms = np.asarray(self.latencies) * 1e3
+        percentiles = (
+            dict(
+                zip(
+                    ("p50", "p90", "p99"),
+                    np.percentile(latencies_ms, [50, 90, 99]).tolist(),
+                )
+            )
+            if len(latencies_ms)
+            else {"p50": None, "p90": None, "p99": None}
+        )
+        return {
+            "uptime_seconds": round(uptime, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+            "throughput_rps": (
+                round(
+                    len(self.completed_at) / min(uptime, THROUGHPUT_WINDOW_SECONDS), 1
+                )
+                if uptime
+                else 0.0
+            ),
+            "latency_ms": {
+                key: value and round(value, 3) for key, value in percentiles.items()
+            },
+            "cache": {
+                "size": len(cache),
+                "maxsize": cache.maxsize,
+                "hits": cache.hits,
+                "misses": cache.misses,
+            },
+            "batches": batcher.batches,
+            "mean_batch_size": (
+                round(batcher.batched_queries / batcher.batches, 2)
+                if batcher.batches
+                else 0.0
+            ),
+        }
+
+
+def parse_household_query(query: str) -> tuple:
+    """
+    Validate /household query parameters.
+
+    Returns:
+        (employment_income, filing_status, dependents) cache key
+
+    Raises:
+        ValueError: If a parameter is missing or out of range
+    """
+    params = {key: values[-1] for key, values in parse_qs(query).items()}
+    try:
+        income = float(params["employment_income"])
+    except KeyError:
+        raise ValueError("employment_income is required")
+    if not np.isfinite(income) or income < 0:
+        raise ValueError("employment_income must be a non-negative number")
+    filing_status = params.get("filing_status", "single")
+    if filing_status not in STANDARD_DEDUCTION:
+        raise ValueError(f"filing_status must be one of {sorted(STANDARD_DEDUCTION)}")
+    dependents = int(params.get("dependents", 0))
+    if not 0 <= dependents <= MAX_DEPENDENTS:
+        raise ValueError(f"dependents must be between 0 and {MAX_DEPENDENTS}")
+    return round(income, 2), filing_status, dependents
+
+
+class HouseholdService:
+    """
+    asyncio HTTP/1.1 server answering household queries.
+
+    Args:
+        window: Batching window in seconds
+        cache_size: LRU cache entries
+        max_batch: Queries that trigger an immediate flush
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW_SECONDS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        self.cache = LRUCache(cache_size)
+        self.batcher = HouseholdBatcher(window, max_batch)
+        self.metrics = ServiceMetrics()
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+
+    async def answer(self, key: tuple) -> dict:
+        answer = self.cache.get(key)
+        if answer is not None:
+            return answer
+        # Identical queries in the same batch share one evaluation
+        future = self._in_flight.get(key)
+        if future is None:
+            future = self._in_flight[key] = self.batcher.submit(key)
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded, so one client cancelling leaves the shared query running
+        answer = await asyncio.shield(future)
+        self.cache.put(key, answer)
+        return answer
+
+    async def route(self, method: str, target: str) -> tuple[int, dict]:
+        url = urlsplit(target)
+        if url.path == "/metrics":
+            return 200, self.metrics.snapshot(self.cache, self.batcher)
+        if url.path != "/household":
+            return 404, {"error": f"no route for {url.path}"}
+        if method != "GET":
+            return 405, {"error": "use GET"}
+        try:
+            key = parse_household_query(url.query)
+        except ValueError as error:
+            return 400, {"error": str(error)}
+        try:
+            return 200, await self.answer(key)
+        except Exception as error:
+            return 500, {"error": f"evaluation failed: {error}"}
+
+    async def respond(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: dict,
+        keep_alive: bool,
+    ) -> None:
+        payload = json.dumps(body).encode()
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+            ).encode()
+            + payload
+        )
+        await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                except _LINE_TOO_LONG:
+                    # The rest of the line is unread, so the connection closes
+                    error = {"error": "request line too long"}
+                    await self.respond(writer, 400, error, keep_alive=False)
+                    self.metrics.record(0.0, ok=False)
+                    break
+                if not request_line:
+                    break
+                start = time.perf_counter()
+                headers = {}
+                request_error = None
+                while True:
+                    try:
+                        line = await reader.readline()
+                    except _LINE_TOO_LONG:
+                        request_error = 431, {"error": "header line too long"}
+                        break
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if request_error is None:
+                    request_error = await self.read_body(reader, headers)
+
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    method, target, version = "", "", "HTTP/1.0"
+                    status, body = 400, {"error": "malformed request line"}
+                else:
+                    status, body = request_error or await self.route(method, target)
+
+                # An unread header or body would be parsed as the next request
+                keep_alive = (
+                    request_error is None
+                    and headers.get("connection", "").lower() != "close"
+                    and version == "HTTP/1.1"
+                )
+                await self.respond(writer, status, body, keep_alive)
+                # Keep /metrics polling out of the request statistics
+                if urlsplit(target).path != "/metrics":
+                    self.metrics.record(time.perf_counter() - start, ok=status == 200)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_body(
+        self, reader: asyncio.StreamReader, headers: dict
+    ) -> tuple[int, dict] | None:
+        """Read and discard the request body; return an error response if invalid."""
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            return 400, {"error": "malformed Content-Length"}
+        if length < 0:
+            return 400, {"error": "negative Content-Length"}
+        if length > MAX_BODY_BYTES:
+            return 413, {"error": f"body over {MAX_BODY_BYTES} bytes"}
+        if length:
+            await reader.readexactly(length)
+        return None
+
+    async def serve(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Serving household calculator on http://{host}:{port}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Utah SB60 household calculator service."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--window-ms",
+        type=float,
+        default=DEFAULT_WINDOW_SECONDS * 1e3,
+        help="Batching window in milliseconds",
+    )
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    args = parser.parse_args(argv)
+
+    service = HouseholdService(args.window_ms / 1e3, args.cache_size, args.max_batch)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Sharded map-reduce aggregation of the statewide metrics.
+
+A stored household table (see store.py) is split into shards on chunk
+boundaries. Each shard is summarized independently (map) into exact
+fixed-size weighted sums and Gini income histograms, and the summaries are
+merged into the statewide.py metrics (reduce). Sums are combined exactly,
+so the result is bit-identical to microdata.aggregate_household_results
+over the whole table with the same chunk size, whatever the shard count or
+merge order.
+
+Shards can run in a local process pool, or as separate invocations whose
+summaries are merged afterwards:
+
+    python -m utah_sb60.shards map --shard 0 --shards 4 --output shard-0.npz
+    ...
+    python -m utah_sb60.shards reduce shard-*.npz
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .microdata import DEFAULT_CHUNK_SIZE, StatewideAccumulator
+from .store import open_household_table
+
+
+def shard_bounds(
+    rows: int, shards: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> list[tuple[int, int]]:
+    """
+    Split rows into at most shards contiguous ranges that start on chunk
+    boundaries, with chunk counts differing by at most one.
+    """
+    chunks = -(-rows // chunk_size)
+    edges = np.linspace(0, chunks, min(shards, max(chunks, 1)) + 1).round().astype(int)
+    return [
+        (int(start) * chunk_size, min(int(stop) * chunk_size, rows))
+        for start, stop in zip(edges[:-1], edges[1:])
+    ]
+
+
+def summarize_shard(
+    path: Path, shard: int, shards: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> dict:
+    """
+    Summarize one shard of a stored household table.
+
+    Args:
+        path: Household table directory (see store.household_table)
+        shard: Shard index, 0 to shards - 1
+        shards: Number of shards the table is split into
+        chunk_size: Rows aggregated per chunk; must match across shards
+
+    Returns:
+        StatewideAccumulator.summary() plus "chunk_starts", "rows" and
+        "chunk_size" used to check coverage when merging
+    """
+    table = open_household_table(path)
+    rows = len(table["weight"])
+    bounds = shard_bounds(rows, shards, chunk_size)
+    start, stop = bounds[shard] if shard < len(bounds) else (rows, rows)
+    accumulator = StatewideAccumulator()
+    chunk_starts = np.arange(start, stop, chunk_size)
+    for chunk_start in chunk_starts:
+        accumulator.update(
+            {
+                column: values[chunk_start : chunk_start + chunk_size]
+                for column, values in table.items()
+            }
+        )
+    return {
+        **accumulator.summary(),
+        "chunk_starts": chunk_starts,
+        "rows": np.array(rows),
+        "chunk_size": np.array(chunk_size),
+    }
+
+
+def save_summary(summary: dict, path: Path) -> Path:
+    """Write a shard summary to an .npz file."""
+    np.savez(path, **summary)
+    return Path(path)
+
+
+def load_summary(path: Path) -> dict:
+    """Read a shard summary written by save_summary."""
+    with np.load(path, allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
+
+
+def merge_summaries(summaries: list[dict]) -> dict:
+    """
+    Reduce shard summaries into the statewide.py metrics.
+
+    Raises:
+        ValueError: If the summaries disagree on the table or chunk size, or
+            do not cover every chunk exactly once
+    """
+    layouts = {(int(s["rows"]), int(s["chunk_size"])) for s in summaries}
+    if len(layouts) != 1:
+        raise ValueError(
+            f"Summaries come from different tables or chunk sizes: {layouts}"
+        )
+    ((rows, chunk_size),) = layouts
+    starts = np.sort(np.concatenate([s["chunk_starts"] for s in summaries]))
+    if not np.array_equal(starts, np.arange(0, rows, chunk_size)):
+        raise ValueError("Summaries must cover every chunk of the table exactly once")
+    return StatewideAccumulator.from_summaries(summaries).result()
+
+
+def sharded_impacts(
+    path: Path,
+    shards: int | None = None,
+    jobs: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict:
+    """
+    Compute the statewide.py metrics for a stored table shard by shard.
+
+    Args:
+        path: Household table directory (see store.household_table)
+        shards: Number of shards; defaults to jobs, or os.cpu_count()
+        jobs: Worker processes; None uses os.cpu_count(), 1 runs inline
+        chunk_size: Rows aggregated per chunk
+
+    Returns:
+        Dict keyed by the statewide.py constant names, identical to
+        aggregate_household_results(open_household_table(path), chunk_size)
+    """
+    shards = shards or jobs or os.cpu_count()
+    if jobs == 1:
+        summaries = [
+            summarize_shard(path, shard, shards, chunk_size) for shard in range(shards)
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            summaries = list(
+                pool.map(
+                    summarize_shard,
+                    [path] * shards,
+                    range(shards),
+                    [shards] * shards,
+                    [chunk_size] * shards,
+                )
+            )
+    return merge_summaries(summaries)
+
+
+def main(argv: list[str] | None = None) -> None:
+    from .store import household_table, table_path
+
+    parser = argparse.ArgumentParser(
+        description="Sharded aggregation of SB60 statewide metrics."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name in ("map", "run"):
+        subparser = subparsers.add_parser(name)
+        subparser.add_argument("--year", type=int, default=2026)
+        subparser.add_argument("--dataset", help="PolicyEngine-US dataset to simulate")
+        subparser.add_argument(
+            "--table", help="Household table directory to read instead"
+        )
+        subparser.add_argument("--shards", type=int, required=name == "map")
+        subparser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    subparsers.choices["map"].add_argument("--shard", type=int, required=True)
+    subparsers.choices["map"].add_argument("--output", required=True)
+    subparsers.choices["run"].add_argument("--jobs", type=int, help="Worker processes")
+    subparsers.add_parser("reduce").add_argument("summaries", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "reduce":
+        impacts = merge_summaries([load_summary(path) for path in args.summaries])
+        print(json.dumps(impacts, indent=2))
+        return
+
+    path = args.table
+    if path is None:
+        household_table(args.year, args.dataset)
+        path = table_path(args.year, args.dataset)
+    if args.command == "map":
+        summary = summarize_shard(path, args.shard, args.shards, args.chunk_size)
+        print(f"Wrote {save_summary(summary, args.output)}")
+    else:
+        impacts = sharded_impacts(path, args.shards, args.jobs, args.chunk_size)
+        print(json.dumps(impacts, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -27,3 +27,32 @@ POVERTY_IMPACT_PCT = 0.0
 DEEP_POVERTY_IMPACT_PCT = 0.0
 GINI_IMPACT_PCT = 0.01
 AVG_BENEFIT_PER_HOUSEHOLD = 130
+
+
+def published_impacts() -> dict:
+    """
+    Return the published statewide results keyed by constant name.
+
+    utah_sb60.microdata.compute_statewide_impacts returns the same keys, so
+    either can be passed to the statewide chart builders.
+    """
+    return {
+        "DECILES": DECILES,
+        "GAIN_MORE_THAN_5PCT": GAIN_MORE_THAN_5PCT,
+        "GAIN_LESS_THAN_5PCT": GAIN_LESS_THAN_5PCT,
+        "NO_CHANGE": NO_CHANGE,
+        "LOSS_LESS_THAN_5PCT": LOSS_LESS_THAN_5PCT,
+        "LOSS_MORE_THAN_5PCT": LOSS_MORE_THAN_5PCT,
+        "ALL_GAIN_MORE_THAN_5PCT": ALL_GAIN_MORE_THAN_5PCT,
+        "ALL_GAIN_LESS_THAN_5PCT": ALL_GAIN_LESS_THAN_5PCT,
+        "ALL_NO_CHANGE": ALL_NO_CHANGE,
+        "ALL_LOSS_LESS_THAN_5PCT": ALL_LOSS_LESS_THAN_5PCT,
+        "ALL_LOSS_MORE_THAN_5PCT": ALL_LOSS_MORE_THAN_5PCT,
+        "AVG_IMPACT_BY_DECILE": AVG_IMPACT_BY_DECILE,
+        "REVENUE_IMPACT_MILLIONS": REVENUE_IMPACT_MILLIONS,
+        "PERCENT_BENEFITING": PERCENT_BENEFITING,
+        "POVERTY_IMPACT_PCT": POVERTY_IMPACT_PCT,
+        "DEEP_POVERTY_IMPACT_PCT": DEEP_POVERTY_IMPACT_PCT,
+        "GINI_IMPACT_PCT": GINI_IMPACT_PCT,
+        "AVG_BENEFIT_PER_HOUSEHOLD": AVG_BENEFIT_PER_HOUSEHOLD,
+    }
@@ -0,0 +1,174 @@
+"""Memory-mapped columnar store for household-level results.
+
+The combined baseline/reform household table is materialized once as one
+.npy file per column plus a table.json describing it. Readers get
+read-only memory-mapped NumPy arrays, so every consumer shares the same
+pages and slicing a column (e.g. into aggregation chunks) copies nothing.
+
+Layout:
+    <table>/
+    ├── table.json            # rows, column dtypes, year, dataset, cutoffs
+    ├── weight.npy
+    ├── people.npy
+    ├── decile.npy            # 1-10, ranked on equivalised net income
+    ├── baseline_net_income.npy
+    ├── reform_net_income.npy
+    └── ...                   # remaining load_household_results columns
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+from .cache import DEFAULT_CACHE_DIR, cache_key
+from .microdata import (
+    DECILE_RANKING_COLUMN,
+    DEFAULT_CHUNK_SIZE,
+    aggregate_household_results,
+    assign_deciles,
+    load_household_results,
+    weighted_decile_cutoffs,
+)
+from .profiling import span
+
+# Materialized tables live beside the simulation cache entries
+DEFAULT_TABLE_DIR = DEFAULT_CACHE_DIR / "tables"
+
+_META_FILE = "table.json"
+
+
+def write_household_table(results: dict, path: Path, meta: dict | None = None) -> Path:
+    """
+    Write household-level columns as a memory-mappable table.
+
+    A "decile" column (int8, 1-10, people-weighted on baseline equivalised
+    net income) is added when results lacks one. The table is written to a temporary
+    directory and moved into place, so readers never see a partial table.
+
+    Args:
+        results: Column name -> 1-D array, all the same length
+        path: Table directory to create or replace
+        meta: Extra JSON-serializable details stored in table.json
+
+    Returns:
+        Path of the table directory
+    """
+    path = Path(path)
+    results = dict(results)
+    meta = dict(meta or {})
+    if "decile" not in results:
+        ranking = np.asarray(results[DECILE_RANKING_COLUMN], dtype=np.float64)
+        cutoffs = weighted_decile_cutoffs(
+            ranking,
+            np.asarray(results["weight"], dtype=np.float64) * results["people"],
+        )
+        results["decile"] = assign_deciles(ranking, cutoffs).astype(np.int8)
+        meta["decile_cutoffs"] = cutoffs.tolist()
+
+    rows = {len(values) for values in results.values()}
+    if len(rows) != 1:
+        raise ValueError(f"Columns have different lengths: {sorted(rows)}")
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    tmp_path.mkdir(parents=True)
+    columns = {}
+    for column, values in results.items():
+        values = np.ascontiguousarray(values)
+        np.save(tmp_path / f"{column}.npy", values, allow_pickle=False)
+        columns[column] = values.dtype.str
+    (tmp_path / _META_FILE).write_text(
+        json.dumps({"rows": rows.pop(), "columns": columns, **meta}, indent=2)
+    )
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_table_meta(path: Path) -> dict:
+    """Return the table.json contents of a stored table."""
+    return json.loads((Path(path) / _META_FILE).read_text())
+
+
+def open_household_table(path: Path, columns: list[str] | None = None) -> dict:
+    """
+    Open a stored table as read-only memory-mapped arrays.
+
+    Pages are loaded lazily by the OS and shared between processes reading
+    the same table; nothing is copied into Python memory up front.
+
+    Args:
+        path: Table directory written by write_household_table
+        columns: Columns to open; defaults to all
+
+    Returns:
+        Dict of column name to read-only np.memmap
+    """
+    path = Path(path)
+    names = columns or list(read_table_meta(path)["columns"])
+    return {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in names}
+
+
+def table_path(year: int = 2026, dataset: str | None = None) -> Path:
+    """Default table directory for a year and dataset."""
+    spec = {"dataset": dataset, "decile_ranking": DECILE_RANKING_COLUMN}
+    key = cache_key("household_table", spec, year)
+    return DEFAULT_TABLE_DIR / key[:16]
+
+
+def household_table(
+    year: int = 2026, dataset: str | None = None, path: Path | None = None
+) -> dict:
+    """
+    Open the household table for a year and dataset, materializing it from
+    load_household_results on first use.
+
+    Args:
+        year: Tax year simulated
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        path: Table directory; defaults to table_path(year, dataset)
+
+    Returns:
+        Dict of column name to read-only np.memmap
+    """
+    path = Path(path) if path is not None else table_path(year, dataset)
+    if not (path / _META_FILE).exists():
+        with span("materialize household table"):
+            write_household_table(
+                load_household_results(year, dataset),
+                path,
+                meta={"year": year, "dataset": dataset},
+            )
+    return open_household_table(path)
+
+
+def decile_breakdown(
+    table: dict, values: np.ndarray | str, weights: np.ndarray | str = "weight"
+) -> np.ndarray:
+    """
+    Weighted mean of values within each income decile.
+
+    Args:
+        table: Household table from household_table or open_household_table
+        values: Column name or array aligned with the table
+        weights: Column name or array of weights; defaults to household weight
+
+    Returns:
+        Array of 10 weighted means, decile 1 first
+    """
+    values = table[values] if isinstance(values, str) else values
+    weights = table[weights] if isinstance(weights, str) else weights
+    index = table["decile"] - 1
+    totals = np.bincount(index, weights=weights * values, minlength=10)
+    return totals / np.maximum(np.bincount(index, weights=weights, minlength=10), 1e-12)
+
+
+def table_impacts(table: dict, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """
+    Aggregate a stored table into the statewide.py metrics, usable as the
+    impacts argument of the chart builders.
+    """
+    return aggregate_household_results(table, chunk_size)
@@ -0,0 +1,173 @@
+"""Sinks writing streamed household sweeps straight to disk.
+
+Each sink consumes (employment_income_values, net_income_changes) chunks,
+e.g. from household.iter_net_income_changes, and writes them as they
+arrive, so memory use depends on the chunk size only.
+
+Usage:
+    python -m utah_sb60.stream --max-income 10000000 --step 1 --output sweep.npy
+"""
+
+import argparse
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from .household import DEFAULT_STREAM_CHUNK_SIZE, iter_net_income_changes
+
+COLUMNS = ["employment_income", "net_income_change"]
+
+# Structured record written by write_npy
+RECORD_DTYPE = np.dtype([("employment_income", "<i8"), ("net_income_change", "<f8")])
+
+Chunks = Iterable[tuple[np.ndarray, np.ndarray]]
+
+
+def write_csv(chunks: Chunks, path: Path) -> int:
+    """
+    Write chunks as CSV with a header row; changes are rounded to cents.
+
+    Returns:
+        Rows written
+    """
+    rows = 0
+    with open(path, "w") as f:
+        f.write(",".join(COLUMNS) + "\n")
+        for incomes, changes in chunks:
+            np.savetxt(
+                f,
+                np.column_stack([incomes, changes]),
+                fmt=["%d", "%.2f"],
+                delimiter=",",
+            )
+            rows += len(incomes)
+    return rows
+
+
+def write_parquet(chunks: Chunks, path: Path) -> int:
+    """
+    Write chunks as one Parquet row group each. Requires pyarrow.
+
+    Returns:
+        Rows written
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(
+            "Parquet output requires pyarrow: pip install 'utah-sb60-calc[parquet]'"
+        ) from error
+
+    schema = pa.schema(
+        [("employment_income", pa.int64()), ("net_income_change", pa.float64())]
+    )
+    rows = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for incomes, changes in chunks:
+            writer.write_table(
+                pa.Table.from_arrays(
+                    [pa.array(incomes, pa.int64()), pa.array(changes, pa.float64())],
+                    schema=schema,
+                )
+            )
+            rows += len(incomes)
+    return rows
+
+
+def write_npy(chunks: Chunks, path: Path, rows: int) -> int:
+    """
+    Write chunks as a .npy array of RECORD_DTYPE records, appending each
+    chunk's bytes after the header so only the current chunk is in memory.
+    Read it back lazily with np.load(path, mmap_mode="r").
+
+    Args:
+        chunks: Chunks to write
+        path: Output .npy file
+        rows: Total rows the chunks will produce, recorded in the header
+
+    Returns:
+        Rows written
+    """
+    written = 0
+    with open(path, "wb") as f:
+        np.lib.format.write_array_header_1_0(
+            f,
+            {
+                "descr": np.lib.format.dtype_to_descr(RECORD_DTYPE),
+                "fortran_order": False,
+                "shape": (rows,),
+            },
+        )
+        for incomes, changes in chunks:
+            records = np.empty(len(incomes), dtype=RECORD_DTYPE)
+            records["employment_income"] = incomes
+            records["net_income_change"] = changes
+            f.write(records.tobytes())
+            written += len(incomes)
+    if written != rows:
+        raise ValueError(f"Expected {rows} rows, got {written}")
+    return written
+
+
+SINKS = {".csv": write_csv, ".parquet": write_parquet, ".npy": write_npy}
+
+
+def write_sweep(
+    path: Path,
+    min_income: int = 0,
+    max_income: int = 200000,
+    step: int = 50,
+    filing_status: str = "single",
+    dependents: int = 0,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> int:
+    """
+    Stream a household sweep to a file, picking the sink from its suffix
+    (.csv, .parquet or .npy).
+
+    Returns:
+        Rows written
+    """
+    path = Path(path)
+    sink = SINKS.get(path.suffix)
+    if sink is None:
+        raise ValueError(
+            f"Unsupported output type {path.suffix!r}; use one of {list(SINKS)}"
+        )
+    chunks = iter_net_income_changes(
+        min_income, max_income, step, filing_status, dependents, chunk_size
+    )
+    if sink is write_npy:
+        return write_npy(chunks, path, (max_income - min_income) // step + 1)
+    return sink(chunks, path)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Stream a Utah SB60 household sweep to CSV, Parquet or .npy."
+    )
+    parser.add_argument("--min-income", type=int, default=0)
+    parser.add_argument("--max-income", type=int, default=200000)
+    parser.add_argument("--step", type=int, default=50)
+    parser.add_argument("--filing-status", default="single")
+    parser.add_argument("--dependents", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_STREAM_CHUNK_SIZE)
+    parser.add_argument("--output", required=True, help="Output .csv, .parquet or .npy")
+    args = parser.parse_args(argv)
+
+    rows = write_sweep(
+        args.output,
+        args.min_income,
+        args.max_income,
+        args.step,
+        args.filing_status,
+        args.dependents,
+        args.chunk_size,
+    )
+    print(f"Wrote {rows:,} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Rate sweeps: statewide impacts of many SB60-style Utah income tax rates.
+
+The pre-SB60 baseline is simulated once and shared; each candidate rate's
+reform simulation runs in its own worker process.
+
+Usage:
+    python -m utah_sb60.sweep 0.044 0.0435 0.0425 --jobs 4 --output sweep.csv
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .microdata import (
+    DEFAULT_CHUNK_SIZE,
+    aggregate_household_results,
+    combine_scenarios,
+    simulate_scenario,
+)
+from .reform import SB60_BASELINE_PARAMETERS, rate_parameters
+
+
+def _simulate_rate(rate: float, year: int, dataset: str | None) -> dict:
+    return simulate_scenario(rate_parameters(rate), year, dataset)
+
+
+def metrics_row(impacts: dict) -> dict:
+    """Flatten statewide impacts into a table row."""
+    row = {
+        "revenue_impact_millions": impacts["REVENUE_IMPACT_MILLIONS"],
+        "percent_benefiting": impacts["PERCENT_BENEFITING"],
+        "avg_benefit_per_household": impacts["AVG_BENEFIT_PER_HOUSEHOLD"],
+        "poverty_impact_pct": impacts["POVERTY_IMPACT_PCT"],
+        "gini_impact_pct": impacts["GINI_IMPACT_PCT"],
+    }
+    for decile, impact in zip(impacts["DECILES"], impacts["AVG_IMPACT_BY_DECILE"]):
+        row[f"avg_impact_decile_{decile}"] = impact
+    return row
+
+
+def sweep_row(rate: float, impacts: dict) -> dict:
+    """Flatten one rate's statewide impacts into a table row."""
+    return {"rate": rate, **metrics_row(impacts)}
+
+
+def run_rate_sweep(
+    rates: list[float],
+    year: int = 2026,
+    dataset: str | None = None,
+    jobs: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """
+    Compute statewide impacts for each Utah income tax rate in rates.
+
+    Reform simulations are fanned out over a process pool while the parent
+    simulates the shared baseline, so wall time scales with
+    len(rates) / jobs rather than len(rates).
+
+    Args:
+        rates: Candidate flat income tax rates, e.g. [0.044, 0.0435]
+        year: Tax year to simulate
+        dataset: PolicyEngine-US dataset; defaults to the model's default
+        jobs: Worker processes; None uses os.cpu_count(), 1 runs inline
+        chunk_size: Rows aggregated per chunk
+
+    Returns:
+        DataFrame with one row per rate: revenue, percent benefiting,
+        average benefit, poverty and Gini impacts and average impact by decile
+    """
+    if jobs == 1:
+        baseline = simulate_scenario(SB60_BASELINE_PARAMETERS, year, dataset)
+        reforms = [_simulate_rate(rate, year, dataset) for rate in rates]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_simulate_rate, rate, year, dataset) for rate in rates
+            ]
+            baseline = simulate_scenario(SB60_BASELINE_PARAMETERS, year, dataset)
+            reforms = [future.result() for future in futures]
+
+    rows = [
+        sweep_row(
+            rate,
+            aggregate_household_results(
+                combine_scenarios(baseline, reform), chunk_size
+            ),
+        )
+        for rate, reform in zip(rates, reforms)
+    ]
+    return pd.DataFrame(rows)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Statewide impacts of SB60-style Utah income tax rates."
+    )
+    parser.add_argument("rates", nargs="+", type=float, help="Rates, e.g. 0.044")
+    parser.add_argument("--year", type=int, default=2026)
+    parser.add_argument("--dataset", help="PolicyEngine-US dataset to simulate")
+    parser.add_argument("--jobs", type=int, help="Worker processes")
+    parser.add_argument("--output", help="Write the table to this CSV file")
+    args = parser.parse_args(argv)
+
+    table = run_rate_sweep(args.rates, args.year, args.dataset, args.jobs)
+    print(table.to_string(index=False))
+    if args.output:
+        table.to_csv(args.output, index=False)
+        print(f"Generated {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Shared chart theme: palette, fonts, watermark and sampling settings.
+
+Used by the Plotly figure builders in charts.py and the plain-dict builders
+in figures.py, so both draw from one definition. Importing this module does
+not import Plotly.
+"""
+
+import importlib.util
+import json
+from functools import lru_cache
+from pathlib import Path
+
+# PolicyEngine app-v2 color palette - matching WinnersLosersIncomeDecileSubPage.tsx
+BLACK = "#000000"
+
+# Primary teal colors
+PRIMARY_500 = "#319795"  # colors.primary[500] - main brand color
+PRIMARY_700 = "#285E61"  # colors.primary[700] - dark teal for gains >5%
+PRIMARY_ALPHA_60 = (
+    "rgba(49, 151, 149, 0.6)"  # colors.primary.alpha[60] - teal with 60% opacity
+)
+
+# Gray scale
+GRAY_200 = "#E5E7EB"  # colors.gray[200] - no change
+GRAY_400 = "#9CA3AF"  # colors.gray[400] - loss <5%
+GRAY_600 = "#4B5563"  # colors.gray[600] - loss >5%
+
+FONT_FAMILY = "Roboto Serif"
+
+# Display names for grid filing statuses
+FILING_STATUS_LABELS = {
+    "single": "Single",
+    "head_of_household": "Head of household",
+    "joint": "Married filing jointly",
+}
+
+# Display names for simulated grid household structures, and for any
+# household type along the first axis of a net income change grid
+HOUSEHOLD_STRUCTURE_LABELS = {
+    "unmarried": "Unmarried adult",
+    "married": "Married couple",
+}
+HOUSEHOLD_TYPE_LABELS = {**FILING_STATUS_LABELS, **HOUSEHOLD_STRUCTURE_LABELS}
+
+# Largest vertical error allowed when sampling the Figure 1 curve; simulated
+# net income is float32, so changes are only precise to a few cents
+NET_INCOME_CHANGE_TOLERANCE = 0.05
+
+# Earnings step for the household-type heatmap
+HOUSEHOLD_GRID_STEP = 5_000
+
+# Chart watermark configuration
+WATERMARK_CONFIG = {
+    "source": "https://policyengine.github.io/utah-sb60-calc/assets/teal-square-transparent.png",
+    "xref": "paper",
+    "yref": "paper",
+    "sizex": 0.07,
+    "sizey": 0.07,
+    "xanchor": "right",
+    "yanchor": "bottom",
+}
+
+
+def watermark(x: float, y: float) -> dict:
+    """Watermark image placed at paper coordinates (x, y)."""
+    return {**WATERMARK_CONFIG, "x": x, "y": y}
+
+
+@lru_cache(maxsize=1)
+def plotly_template() -> dict:
+    """
+    Plotly's default "plotly" layout template, as every Plotly figure embeds
+    it, read from Plotly's package data without importing Plotly.
+    """
+    spec = importlib.util.find_spec("plotly")
+    (package_dir,) = spec.submodule_search_locations
+    path = Path(package_dir) / "package_data" / "templates" / "plotly.json"
+    return json.loads(path.read_text())
@@ -0,0 +1,234 @@
+"""Bootstrap confidence intervals for the headline statewide metrics.
+
+Each replicate reweights every household by an independent Poisson(1)
+draw (the Poisson bootstrap). Draws come from one random stream per fixed
+block of table rows, so each household gets the same replicate weights no
+matter how households are split into chunks or processes. For a chunk,
+the replicate weights form an R x n matrix W and the per-household
+outcomes an n x k matrix X, so one W @ X product gives every replicate's
+weighted sums at once; sums from chunks and worker processes are added.
+
+Deciles are kept as assigned under the original weights.
+
+Usage:
+    python -m utah_sb60.uncertainty --replicates 1000 --jobs 4
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .microdata import classify_outcomes
+from .store import open_household_table
+
+DEFAULT_REPLICATES = 1000
+DEFAULT_CONFIDENCE = 0.95
+
+# Table rows per random stream; fixed so replicate weights depend only on
+# each household's row, not on chunk_size
+_RNG_BLOCK = 1_024
+
+# Households per replicate-weight matrix, a whole number of random stream
+# blocks; R x this many float64 values are held per chunk (16 MB for 1,000
+# replicates)
+DEFAULT_CHUNK_SIZE = 2 * _RNG_BLOCK
+
+# Outcome matrix columns: revenue change, people, people benefiting, then
+# change and household indicator for each of the 10 deciles
+_REVENUE, _PEOPLE, _BENEFITING, _DECILE_CHANGE, _DECILE_COUNT = 0, 1, 2, 3, 13
+_OUTCOME_COLUMNS = 23
+
+
+def outcome_matrix(chunk: dict) -> np.ndarray:
+    """Per-household outcomes whose weighted sums give the headline metrics."""
+    baseline = np.asarray(chunk["baseline_net_income"], dtype=np.float64)
+    reform = np.asarray(chunk["reform_net_income"], dtype=np.float64)
+    people = np.asarray(chunk["people"], dtype=np.float64)
+    decile_index = np.asarray(chunk["decile"], dtype=np.intp) - 1
+
+    outcomes = np.zeros((len(baseline), _OUTCOME_COLUMNS))
+    outcomes[:, _REVENUE] = np.asarray(
+        chunk["reform_state_income_tax"], dtype=np.float64
+    ) - np.asarray(chunk["baseline_state_income_tax"], dtype=np.float64)
+    outcomes[:, _PEOPLE] = people
+    # Outcome classes 0 and 1 are gains of more and less than 5%
+    outcomes[:, _BENEFITING] = people * (classify_outcomes(baseline, reform) <= 1)
+    rows = np.arange(len(baseline))
+    outcomes[rows, _DECILE_CHANGE + decile_index] = reform - baseline
+    outcomes[rows, _DECILE_COUNT + decile_index] = 1.0
+    return outcomes
+
+
+def _poisson_draws(seed: int, start: int, stop: int, replicates: int) -> np.ndarray:
+    """
+    Poisson(1) replicate draws for table rows [start, stop), shape
+    (replicates, stop - start), identical for a row whatever range covers it.
+    """
+    draws = np.empty((replicates, stop - start), dtype=np.int64)
+    for block in range(start // _RNG_BLOCK, (stop - 1) // _RNG_BLOCK + 1):
+        block_start = block * _RNG_BLOCK
+        rng = np.random.default_rng([seed, block])
+        block_draws = rng.poisson(1.0, size=(replicates, _RNG_BLOCK))
+        low, high = max(start, block_start), min(stop, block_start + _RNG_BLOCK)
+        draws[:, low - start : high - start] = block_draws[
+            :, low - block_start : high - block_start
+        ]
+    return draws
+
+
+def _chunk_sums(
+    path: Path, start: int, stop: int, replicates: int, seed: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Weighted outcome sums for rows [start, stop) of a stored table.
+
+    Returns:
+        Tuple of (point, replicate) sums: shapes (k,) and (replicates, k)
+    """
+    table = open_household_table(path)
+    chunk = {column: values[start:stop] for column, values in table.items()}
+    outcomes = outcome_matrix(chunk)
+    weight = np.asarray(chunk["weight"], dtype=np.float64)
+    replicate_weights = _poisson_draws(seed, start, stop, replicates) * weight
+    return weight @ outcomes, replicate_weights @ outcomes
+
+
+def _metrics(sums: np.ndarray) -> dict:
+    """Headline metrics from weighted outcome sums (any leading shape)."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return {
+            "REVENUE_IMPACT_MILLIONS": sums[..., _REVENUE] / 1e6,
+            "PERCENT_BENEFITING": sums[..., _BENEFITING] / sums[..., _PEOPLE] * 100,
+            "AVG_IMPACT_BY_DECILE": sums[..., _DECILE_CHANGE:_DECILE_COUNT]
+            / sums[..., _DECILE_COUNT : _DECILE_COUNT + 10],
+        }
+
+
+def replicate_estimates(
+    path: Path,
+    replicates: int = DEFAULT_REPLICATES,
+    seed: int = 0,
+    jobs: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[dict, dict]:
+    """
+    Headline metrics under the original weights and under each replicate.
+
+    Chunks of the stored table are processed in a process pool; each
+    worker memory-maps the table, so households are never copied between
+    processes.
+
+    Args:
+        path: Household table directory (see store.household_table)
+        replicates: Number of bootstrap replicates
+        seed: Random seed; results do not depend on jobs
+        jobs: Worker processes; None uses os.cpu_count(), 1 runs inline
+        chunk_size: Households per replicate-weight matrix, rounded up to a
+            multiple of the random stream block so each block is drawn once
+
+    Returns:
+        Tuple of (point, replicate) dicts keyed by statewide.py constant
+        name; replicate arrays have a leading axis of length replicates
+    """
+    rows = len(open_household_table(path, ["weight"])["weight"])
+    chunk_size = -(-chunk_size // _RNG_BLOCK) * _RNG_BLOCK
+    bounds = [
+        (start, min(start + chunk_size, rows)) for start in range(0, rows, chunk_size)
+    ]
+    point = np.zeros(_OUTCOME_COLUMNS)
+    replicate = np.zeros((replicates, _OUTCOME_COLUMNS))
+    if jobs == 1:
+        results = (
+            _chunk_sums(path, start, stop, replicates, seed) for start, stop in bounds
+        )
+        for chunk_point, chunk_replicate in results:
+            point += chunk_point
+            replicate += chunk_replicate
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_chunk_sums, path, start, stop, replicates, seed)
+                for start, stop in bounds
+            ]
+            for future in futures:
+                chunk_point, chunk_replicate = future.result()
+                point += chunk_point
+                replicate += chunk_replicate
+    return _metrics(point), _metrics(replicate)
+
+
+def confidence_intervals(
+    path: Path,
+    replicates: int = DEFAULT_REPLICATES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: int = 0,
+    jobs: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict:
+    """
+    Percentile bootstrap intervals for REVENUE_IMPACT_MILLIONS,
+    PERCENT_BENEFITING and AVG_IMPACT_BY_DECILE.
+
+    Args:
+        path: Household table directory (see store.household_table)
+        replicates: Number of bootstrap replicates
+        confidence: Coverage of the intervals, e.g. 0.95
+        seed: Random seed
+        jobs: Worker processes; None uses os.cpu_count(), 1 runs inline
+        chunk_size: Households per replicate-weight matrix
+
+    Returns:
+        Dict of metric name -> {"estimate", "low", "high", "std_error"};
+        values are lists of 10 for AVG_IMPACT_BY_DECILE, floats otherwise
+    """
+    point, replicate = replicate_estimates(path, replicates, seed, jobs, chunk_size)
+    tail = (1 - confidence) / 2 * 100
+    intervals = {}
+    for name, estimate in point.items():
+        low, high = np.nanpercentile(replicate[name], [tail, 100 - tail], axis=0)
+        intervals[name] = {
+            "estimate": estimate.tolist(),
+            "low": low.tolist(),
+            "high": high.tolist(),
+            "std_error": np.nanstd(replicate[name], axis=0, ddof=1).tolist(),
+        }
+    return intervals
+
+
+def main(argv: list[str] | None = None) -> None:
+    from .store import household_table, table_path
+
+    parser = argparse.ArgumentParser(
+        description="Bootstrap confidence intervals for SB60 statewide metrics."
+    )
+    parser.add_argument("--year", type=int, default=2026)
+    parser.add_argument("--dataset", help="PolicyEngine-US dataset to simulate")
+    parser.add_argument("--table", help="Household table directory to read instead")
+    parser.add_argument("--replicates", type=int, default=DEFAULT_REPLICATES)
+    parser.add_argument("--confidence", type=float, default=DEFAULT_CONFIDENCE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, help="Worker processes")
+    args = parser.parse_args(argv)
+
+    path = args.table
+    if path is None:
+        household_table(args.year, args.dataset)
+        path = table_path(args.year, args.dataset)
+    intervals = confidence_intervals(
+        path, args.replicates, args.confidence, args.seed, args.jobs
+    )
+    for name, interval in intervals.items():
+        values = zip(
+            *(np.atleast_1d(interval[key]) for key in ("estimate", "low", "high"))
+        )
+        for index, (estimate, low, high) in enumerate(values):
+            label = (
+                name if np.ndim(interval["estimate"]) == 0 else f"{name}[{index + 1}]"
+            )
+            print(f"{label:<28} {estimate:>12,.2f}  [{low:,.2f}, {high:,.2f}]")
+
+
+if __name__ == "__main__":
+    main()